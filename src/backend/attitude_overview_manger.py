@@ -1,48 +1,95 @@
+import math
 import time
 
-from PySide6.QtCore import QObject, Signal, Slot
-from .MiniLink.lib.xmlHandler import XmlHandler
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot, Property
+from .graph_stream_server import batch_to_columns
+from .plot_ring_buffer import PlotRingBuffer
 
 
 class AttitudeOverviewManager(QObject):
-    messageUpdated = Signal(dict)  # 메시지 업데이트 시그널
+    messageUpdated = Signal(dict)       # 메시지 업데이트 시그널 (최신값)
     newPidGains = Signal(int, list, bool)     # 새로운 PID 게인 시그널
 
-    def __init__(self):
+    STREAM_CHANNEL = "attitudeOverview"  # 그래프 WebView로 바이너리 데이터를 보내는 채널
+
+    def __init__(self, serial_manager, graph_stream=None):
         super().__init__()
+        self.serial_manager = serial_manager
+        self.graph_stream = graph_stream
         self.current_message_id = None
+        self.current_fields = []  # 선택한 메시지에서 QML로 넘길 필드 이름 목록
+        self.plot_fields = []     # 그래프로 보낼 숫자 필드 이름 목록
+        self.plot_scale = None    # 그래프 필드별 단위 변환 배율 (rad -> degree)
+        self.x_index = None       # plot_fields에서 x축(time_boot_ms) 열의 위치 (없으면 수신 순번)
+        self._sample_count = 0
         self.message_data = {}
 
-        self.xmlHandler = XmlHandler()
-        self.xmlHandler.loadMessageListFromXML({})
+        # 네이티브 그래프(LinePlot)가 직접 읽는 최근 샘플
+        self.plot_buffer = PlotRingBuffer(self)
 
-    @Slot(int, dict)
-    def get_data(self, message_id: int, data: dict):
+    @Slot(int, list)
+    def get_batch(self, message_id: int, batch: list):
         """
-        SerialManager에 메시지가 전달되면 호출되는 슬롯
+        SerialManager에서 구독한 메시지의 한 프레임 동안 모인 묶음이 전달되면 호출되는 슬롯
+        3D 모델에는 최신값만 dict로 보내고, 그래프에는 전체 샘플을 degree로 변환하여 열 단위 바이너리로 보냅니다.
         """
-        if message_id == self.current_message_id:
-            self.message_data = data
-            self.messageUpdated.emit(data)
+        self.message_data = batch[-1].to_dict(self.current_fields)
+        self.messageUpdated.emit(self.message_data)
+
+        columns = batch_to_columns(batch, self.plot_fields)
+        columns *= self.plot_scale[:, None]
+
+        if self.x_index is None:
+            x = np.arange(self._sample_count, self._sample_count + len(batch), dtype=np.float64)
+            self._sample_count += len(batch)
+            self.plot_buffer.append(x, columns)
+        else:
+            self.plot_buffer.append(columns[self.x_index], np.delete(columns, self.x_index, axis=0))
+
+        if self.graph_stream is not None and self.graph_stream.has_subscribers(self.STREAM_CHANNEL):
+            self.graph_stream.publish(self.STREAM_CHANNEL, columns)
+
+    # QML의 LinePlot에 연결할 샘플 버퍼
+    @Property(QObject, constant=True)
+    def plotBuffer(self):
+        return self.plot_buffer
+
+    @Slot(result=str)
+    def getStreamUrl(self):
+        """
+        그래프 WebView가 접속할 WebSocket 주소를 반환합니다.
+        """
+        return self.graph_stream.url() if self.graph_stream is not None else ""
+
+    @Slot(result=str)
+    def getStreamChannel(self):
+        return self.STREAM_CHANNEL
 
     @Slot(int, result=dict)
     def setTargetMessage(self, message_id: int):
+        # 이전 메시지 구독을 해제하고 선택한 메시지만 구독
+        self.serial_manager.unsubscribe(self.get_batch)
+        self.serial_manager.subscribe([message_id], self.get_batch, history=True)
         self.current_message_id = message_id
 
-        # 해당 메시지의 모든 속성을 가져와서 QML에 전달
-        instance = self.xmlHandler.getMessageInstance(message_id)
-        fields = [field.attrib for field in instance.findall("field")]
-        for field in fields:
-            field['plot'] = True  # QML에서 플롯팅 여부
-            if 'units' not in field:
-                field['units'] = ''
-
-        meta_data = {
-            'id': message_id,
-            'name': instance.get("name"),
-            'description': instance.find("description").text,
-            'fields': fields
-        }
+        # 해당 메시지의 모든 속성을 가져와서 QML에 전달 (필드마다 plot: QML에서 플롯팅 여부)
+        schema = self.serial_manager.schemas[message_id]
+        meta_data = schema.meta_data()
+        self.current_fields = list(schema.names)
+        self.plot_fields = list(schema.numeric_names)
+
+        # rad, rad/s 단위 필드는 그래프에 degree로 표시
+        units = {field['name']: field['units'] for field in meta_data['fields']}
+        self.plot_scale = np.array([
+            180 / math.pi if units[name] in ('rad', 'rad/s') else 1.0 for name in self.plot_fields
+        ])
+        self.x_index = self.plot_fields.index('time_boot_ms') if 'time_boot_ms' in self.plot_fields else None
+        self._sample_count = 0
+        self.plot_buffer.set_columns([name for i, name in enumerate(self.plot_fields) if i != self.x_index])
+        if self.graph_stream is not None:
+            self.graph_stream.set_columns(self.STREAM_CHANNEL, self.plot_fields)
+
         return meta_data
 
     @Slot(dict)
@@ -0,0 +1,328 @@
+import os
+import mmap
+import time
+import queue
+import struct
+import threading
+from datetime import datetime
+
+import numpy as np
+
+
+# 로그 레코드: 8바이트 수신 시각(µs, big-endian) + 원본 프레임 (MAVLink tlog와 동일한 구성)
+TIMESTAMP = struct.Struct(">Q")
+
+# 자작 FC 프레임: 원본 바이트가 없으므로 'ML' + msg_id + 값 개수 + float64 값들로 저장
+MINILINK_MAGIC = b"ML"
+MINILINK_HEADER = struct.Struct("<2sHH")
+
+# 인덱스 파일 (<로그 파일>.idx): 헤더 + 레코드별 (수신 시각, msg_id, 프레임 위치, 프레임 길이)
+INDEX_MAGIC = b"NALDAIDX"
+INDEX_HEADER = struct.Struct("<8sHH")  # magic, version, kind
+INDEX_VERSION = 1
+INDEX_DTYPE = np.dtype([
+    ('time_us', '<u8'),
+    ('msg_id', '<u4'),
+    ('offset', '<u8'),
+    ('length', '<u4'),
+])
+
+KIND_MAVLINK = 0
+KIND_MINILINK = 1
+
+
+def encode_minilink_frame(msg_id: int, values: list) -> bytes:
+    return MINILINK_HEADER.pack(MINILINK_MAGIC, msg_id, len(values)) + struct.pack(f"<{len(values)}d", *values)
+
+
+def decode_minilink_frame(frame) -> tuple:
+    """
+    자작 FC 프레임을 (msg_id, 값 목록)으로 변환합니다.
+    """
+    _, msg_id, count = MINILINK_HEADER.unpack_from(frame)
+    values = struct.unpack_from(f"<{count}d", frame, MINILINK_HEADER.size)
+    return msg_id, list(values)
+
+
+def mavlink_frame_source(frame) -> tuple:
+    """
+    MAVLink 원본 프레임 헤더에서 송신자 (sysid, compid)를 읽습니다. (디코딩 없이)
+    """
+    if frame[0] == 0xFD:  # MAVLink v2
+        return frame[5], frame[6]
+    return frame[3], frame[4]
+
+
+def default_log_path(kind: int) -> str:
+    """
+    logs/ 아래에 현재 시각으로 로그 파일 경로를 만듭니다.
+    """
+    ext = "tlog" if kind == KIND_MAVLINK else "mlog"
+    return os.path.join(os.getcwd(), "logs", datetime.now().strftime(f"%Y%m%d_%H%M%S.{ext}"))
+
+
+class FlightRecorder:
+    """
+    텔레메트리 비행 기록기
+     - 데이터 읽기 스레드는 record()로 큐에 넣기만 하고, 디스크 쓰기는 전용 스레드에서 처리
+     - PX4는 tlog 형식(수신 시각 + MAVLink 원본 프레임)으로 저장하여 다른 도구에서도 열 수 있음
+     - 쓰는 동안 레코드별 인덱스를 <로그 파일>.idx에 함께 저장하여, 재생 시 바로 탐색 가능
+     - 쓰기 오류(디스크 가득 참 등)가 나면 기록을 멈추고 on_error(메시지)를 기록 스레드에서 호출
+    """
+
+    def __init__(self, flush_interval: float = 1.0, on_error=None):
+        self.flush_interval = flush_interval
+        self.on_error = on_error
+        self.path = None
+        self.kind = KIND_MAVLINK
+        self.record_count = 0
+        self.error = None  # 마지막 쓰기 오류 메시지
+
+        self._queue = None
+        self._thread = None
+        self._recording = False
+
+    def is_recording(self) -> bool:
+        return self._recording
+
+    def start(self, kind: int, path: str = None) -> str:
+        """
+        기록을 시작하고 로그 파일 경로를 반환합니다.
+        """
+        if self._recording:
+            self.stop()
+
+        self.kind = kind
+        self.path = path or default_log_path(kind)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        self.record_count = 0
+        self.error = None
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write_loop, args=(self.path, self._queue), daemon=True)
+        self._thread.start()
+        self._recording = True
+        return self.path
+
+    def stop(self):
+        """
+        남은 레코드를 모두 쓰고 기록을 종료합니다.
+        """
+        if self._thread is None:
+            return
+
+        # 쓰기 오류로 기록 스레드가 먼저 끝난 경우에는 _queue가 이미 None
+        self._recording = False
+        records = self._queue
+        if records is not None:
+            records.put(None)
+        self._thread.join()
+        self._thread = None
+        self._queue = None
+
+    def record(self, msg_id: int, frame, t: float = None):
+        """
+        프레임 1개를 기록합니다. (데이터 읽기 스레드에서 호출)
+        frame은 MAVLink 원본 바이트 또는 자작 FC 값 목록입니다.
+        """
+        # stop()이 GUI 스레드에서 _queue를 None으로 바꿀 수 있으므로 지역 변수로 한 번만 읽음
+        # (종료 표시 뒤에 들어간 레코드는 쓰지 않고 버려짐)
+        records = self._queue
+        if records is None:
+            return
+        if t is None:
+            t = time.time()
+        records.put((int(t * 1e6), msg_id, frame))
+
+    def _write_loop(self, path: str, records: queue.SimpleQueue):
+        """
+        기록 전용 스레드의 메인 루프
+        쓰기 오류가 나면 record()가 더 이상 큐에 넣지 않도록 기록을 멈추고 오류를 알립니다.
+        """
+        try:
+            self._write_records(path, records)
+        except OSError as e:
+            self._recording = False
+            self._queue = None
+            self.error = f"{path}: {e}"
+            print(f"[FlightRecorder] 기록 중 쓰기 오류로 기록을 중단합니다: {self.error}")
+            if self.on_error:
+                self.on_error(self.error)
+
+    def _write_records(self, path: str, records: queue.SimpleQueue):
+        index = np.empty(4096, dtype=INDEX_DTYPE)
+        index_count = 0
+        offset = 0
+        last_flush = time.monotonic()
+
+        with open(path, "wb") as data_file, open(path + ".idx", "wb") as index_file:
+            index_file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.kind))
+
+            while True:
+                try:
+                    item = records.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    item = ()
+
+                if item:
+                    time_us, msg_id, frame = item
+                    if not isinstance(frame, (bytes, bytearray)):
+                        frame = encode_minilink_frame(msg_id, frame)
+
+                    data_file.write(TIMESTAMP.pack(time_us))
+                    data_file.write(frame)
+
+                    index[index_count] = (time_us, msg_id, offset + TIMESTAMP.size, len(frame))
+                    index_count += 1
+                    offset += TIMESTAMP.size + len(frame)
+                    self.record_count += 1
+
+                # 인덱스 버퍼가 찼거나, 일정 시간이 지났거나, 종료 요청 시 디스크에 반영
+                now = time.monotonic()
+                if item is None or index_count == len(index) or now - last_flush > self.flush_interval:
+                    index_file.write(index[:index_count].tobytes())
+                    index_count = 0
+                    data_file.flush()
+                    index_file.flush()
+                    last_flush = now
+
+                if item is None:
+                    break
+
+
+class TelemetryLog:
+    """
+    기록된 로그 파일을 메모리 맵으로 열어 읽는 클래스
+     - 인덱스(<로그 파일>.idx)를 이용해 원하는 시각으로 즉시 탐색
+     - 인덱스가 없는 tlog(다른 GCS에서 저장한 파일 등)는 처음 열 때 한 번 스캔하여 인덱스를 만듦
+     - 인덱스가 없는 자작 FC 로그(.mlog)나 MAVLink 프레임으로 시작하지 않는 파일은 열지 않음 (ValueError)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        try:
+            self.kind, self.index = self._load_index()
+        except Exception:
+            self.close()
+            raise
+        self._msg_index = {}  # msg_id: 해당 메시지 레코드 번호 배열 (필요할 때 생성)
+        # 로그에 들어 있는 msg_id 목록 (열 때 한 번만 계산, QML 메시지 목록 갱신마다 인덱스 전체를 훑지 않도록)
+        self._msg_ids = [int(msg_id) for msg_id in np.unique(self.index['msg_id'])]
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def start_time(self) -> float:
+        return int(self.index['time_us'][0]) / 1e6 if len(self.index) else 0.0
+
+    @property
+    def end_time(self) -> float:
+        return int(self.index['time_us'][-1]) / 1e6 if len(self.index) else 0.0
+
+    def msg_ids(self) -> list:
+        return list(self._msg_ids)
+
+    def msg_records(self, msg_id: int) -> np.ndarray:
+        """
+        msg_id에 해당하는 레코드 번호 배열 (시간순)
+        """
+        records = self._msg_index.get(msg_id)
+        if records is None:
+            records = self._msg_index[msg_id] = np.flatnonzero(self.index['msg_id'] == msg_id)
+        return records
+
+    def seek(self, t: float, msg_id: int = None) -> int:
+        """
+        시각 t(초) 이후 첫 레코드 번호를 반환합니다. msg_id를 주면 해당 메시지 중에서 찾습니다.
+        """
+        time_us = int(t * 1e6)
+        if msg_id is None:
+            return int(np.searchsorted(self.index['time_us'], time_us))
+
+        records = self.msg_records(msg_id)
+        pos = np.searchsorted(self.index['time_us'][records], time_us)
+        return int(records[pos]) if pos < len(records) else len(self.index)
+
+    def record(self, i: int) -> tuple:
+        """
+        i번째 레코드를 (수신 시각(초), msg_id, 프레임 바이트)로 반환합니다.
+        """
+        entry = self.index[i]
+        offset, length = int(entry['offset']), int(entry['length'])
+        return int(entry['time_us']) / 1e6, int(entry['msg_id']), self._data[offset:offset + length]
+
+    def iter_from(self, i: int = 0):
+        for j in range(i, len(self.index)):
+            yield self.record(j)
+
+    def _load_index(self):
+        index_path = self.path + ".idx"
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                magic, version, kind = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+            if magic == INDEX_MAGIC and version == INDEX_VERSION:
+                index = np.memmap(index_path, dtype=INDEX_DTYPE, mode="r", offset=INDEX_HEADER.size) \
+                    if os.path.getsize(index_path) > INDEX_HEADER.size else np.empty(0, dtype=INDEX_DTYPE)
+                return kind, index
+
+        # 인덱스가 없으면 tlog만 스캔하여 생성 (자작 FC 로그를 MAVLink로 잘못 색인하지 않도록 확인)
+        if self.path.lower().endswith(".mlog") or self._is_minilink_data():
+            raise ValueError(f"인덱스 파일({index_path})이 없는 자작 FC 로그는 열 수 없습니다.")
+        if len(self._data) and not self._is_mavlink_data():
+            raise ValueError(f"MAVLink tlog 형식이 아닌 파일입니다: {self.path}")
+        index = self._scan_tlog()
+        try:
+            with open(index_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, KIND_MAVLINK))
+                f.write(index.tobytes())
+        except OSError:
+            pass
+        return KIND_MAVLINK, index
+
+    def _is_minilink_data(self) -> bool:
+        """
+        첫 레코드가 자작 FC 프레임('ML')인지 확인합니다.
+        """
+        start = TIMESTAMP.size
+        return self._data[start:start + len(MINILINK_MAGIC)] == MINILINK_MAGIC
+
+    def _is_mavlink_data(self) -> bool:
+        """
+        첫 레코드가 MAVLink v1/v2 프레임으로 시작하는지 확인합니다.
+        """
+        return len(self._data) > TIMESTAMP.size and self._data[TIMESTAMP.size] in (0xFE, 0xFD)
+
+    def _scan_tlog(self) -> np.ndarray:
+        """
+        tlog 파일을 처음부터 읽어 인덱스를 만듭니다.
+        """
+        data = self._data
+        entries = []
+        pos = 0
+        while pos + TIMESTAMP.size + 8 <= len(data):
+            (time_us,) = TIMESTAMP.unpack_from(data, pos)
+            start = pos + TIMESTAMP.size
+            magic = data[start]
+            if magic == 0xFE:    # MAVLink v1
+                length = 6 + data[start + 1] + 2
+                msg_id = data[start + 5]
+            elif magic == 0xFD:  # MAVLink v2
+                length = 10 + data[start + 1] + 2 + (13 if data[start + 2] & 0x01 else 0)
+                msg_id = int.from_bytes(data[start + 7:start + 10], "little")
+            else:
+                break
+            if start + length > len(data):
+                break
+            entries.append((time_us, msg_id, start, length))
+            pos = start + length
+        return np.array(entries, dtype=INDEX_DTYPE)
@@ -1,10 +1,13 @@
 # 모든 backend작업 총괄을 여기서 진행
+import math
 import time
-from datetime import datetime  # 시간 기록을 위해 추가
 
-from PySide6.QtCore import QObject, Signal, Slot, QThread, Property, Qt
-from PySide6.QtPositioning import QGeoCoordinate
+from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer
 
+from .track_model import TrackModel
+from .track_lod import TrackLod
+from .track_simplifier import EARTH_RADIUS
+from .track_store import TrackStore
 from windows.location_history_window import LocationHistoryWindow
 from windows.manual_gps_window import ManualGpsWindow
 
@@ -12,23 +15,53 @@ from windows.manual_gps_window import ManualGpsWindow
 class GpsManager(QObject):
     """
     GCS 백엔드 클래스
-     - 시리얼 포트에서 GPS 데이터를 읽어 QML로 전송
+     - SerialManager에서 GLOBAL_POSITION_INT/GPS_RAW_INT를 받아 기체별 경로를 기록하고 현재 위치를 QML로 전송
      - QML에서 받은 데이터를 FC로 전송
     """
-    # GPS 데이터 변경 시그널 정의 (실시간 위치 정보 변경에대한 시그널 - 경로점 기록시 사용)
+
+    # 구독 메시지 (MAVLink, 자작 FC도 같은 ID/필드 이름을 사용)
+    MSG_GPS_RAW_INT = 24
+    MSG_GLOBAL_POSITION_INT = 33
+    MESSAGE_IDS = (MSG_GPS_RAW_INT, MSG_GLOBAL_POSITION_INT)
+
+    UNKNOWN_HEADING = 65535  # hdg/cog를 알 수 없을 때 (UINT16_MAX)
+    FIX_TYPE_2D = 2
+
+    # 경로 기록 간격 (50Hz로 수신해도 움직인 만큼만 기록)
+    RECORD_DISTANCE = 1.0       # 수평 이동 거리 (m)
+    RECORD_ALTITUDE = 1.0       # 고도 변화 (m)
+    RECORD_INTERVAL = 0.1       # 최소 기록 간격 (초)
+    RECORD_MAX_INTERVAL = 10.0  # 정지 중에도 이 간격마다 1번 기록 (초)
+
+    DISPLAY_INTERVAL_MS = 100   # 현재 위치 표시 주기 (gpsDataChanged 최대 10Hz)
+
+    # GPS 데이터 변경 시그널 정의 (실시간 위치 정보 변경에대한 시그널 - 지도 중심/현재 위치 표시에 사용)
     gpsDataChanged = Signal(float, float, float, float)
-    # 경로 데이터 변경 시그널 정의  (누적 위치 정보 변경에대한 시그널 - 경로점 이을때 사용)
-    pathDataChanged = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.gps_reader = None
-        self.monitoring_thread = None
-        self._path_data = []  # 경로 데이터를 저장할 리스트 (구조 변경)
+        self._position = None      # 선택된 기체의 마지막 위치 (lat, lon, alt, hdg)
+        self._last_fixes = {}      # 기체별 마지막 기록 지점 (monotonic 시각, lat, lon, alt, hdg)
+        self._global_position_sources = set()  # GLOBAL_POSITION_INT를 보내는 기체
+
+        # 표시 타이머 (위치를 받은 뒤 DISPLAY_INTERVAL_MS 안에 마지막 위치만 전달)
+        self._display_timer = QTimer(self)
+        self._display_timer.setSingleShot(True)
+        self._display_timer.setInterval(self.DISPLAY_INTERVAL_MS)
+        self._display_timer.timeout.connect(self._emitPosition)
+        # 기체 (sysid, compid)별 경로 데이터, None은 기체 구분이 없는 경로 (수동 입력, 자작 FC)
+        self._paths = {None: TrackStore()}
+        self._active_vehicle = None
+        self._path_data = self._paths[None]  # 선택된 기체의 경로 데이터
+
+        # 선택된 기체의 경로를 QML에 보여주는 모델 (지점 추가 시 추가된 행만 알림)
+        self.track_model = TrackModel(self)
+        self.track_model.set_store(self._path_data)
+        # 지도 확대 수준/화면 범위에 맞춰 단순화한 경로 선과 마커
+        self.track_lod = TrackLod(self.track_model, self)
 
         # 초기 인하대 좌표를 경로에 추가
         self.add_path_point(37.450767, 126.657016, 0, 0)
-        self.pathDataChanged.emit()  # 초기 경로 데이터 변경 알림
 
         # Location History 창을 관리하기 위한 변수
         self.history_window = LocationHistoryWindow(self)
@@ -39,80 +72,89 @@ class GpsManager(QObject):
         # self.manual_gps_window.show()
         self.manual_gps_window.hide()
 
-    # QML에서 지도 표시에 사용할 좌표 리스트를 위한 프로퍼티
-
-    @Property(list, notify=pathDataChanged)
-    def pathCoordinates(self):
-        return [item['coordinate'] for item in self._path_data]
-
-    # QML의 History 창에서 사용할 전체 데이터 리스트를 위한 프로퍼티
-    @Property(list, notify=pathDataChanged)
-    def pathData(self):
-        return self._path_data
-
-    def add_path_point(self, lat, lon, alt, hdg):
-        """경로 지점을 상세 정보와 함께 추가하는 헬퍼 함수"""
-        new_point = {
-            'timestamp': datetime.now().strftime("%H:%M:%S"),
-            'lat': round(lat, 7),
-            'lon': round(lon, 7),
-            'alt': round(alt, 2),
-            'hdg': round(hdg, 2),
-            'coordinate': QGeoCoordinate(lat, lon, alt)
-        }
-        self._path_data.append(new_point)
-
-    # @Slot(str, int)
-    # def start_gps_monitoring(self, port, baudrate):
-    #     """
-    #     GPS 데이터 모니터링 시작
-    #      - 새로운 스레드에서 GPS 데이터를 계속 읽어옴
-    #     """
-    #     if self.monitoring_thread and self.monitoring_thread.isRunning():
-    #         print("모니터링이 이미 실행 중입니다.")
-    #         return
-
-    #     self.gps_reader = MAVLink(port, baudrate)
-    #     self.monitoring_thread = QThread()
-    #     self.gps_reader.moveToThread(self.monitoring_thread)
-
-    #     # 스레드가 시작될 때 run_monitoring 실행
-    #     self.monitoring_thread.started.connect(self.run_monitoring)
-
-    #     self.monitoring_thread.start()
-    #     print(f"{port}에서 GPS 데이터 모니터링 시작...")
-
-    # def run_monitoring(self):
-    #     """
-    #     실제 GPS 데이터를 읽고 시그널을 발생시키는 메서드
-    #     """
-    #     while self.monitoring_thread and self.monitoring_thread.isRunning():
-    #         if self.gps_reader.getData():  # getData()가 성공적으로 데이터를 읽고 파싱했을 때
-    #             lat = self.gps_reader.lat
-    #             lon = self.gps_reader.lon
-    #             alt = self.gps_reader.alt
-    #             hdg = self.gps_reader.hdg
-
-    #             self.gpsDataChanged.emit(lat, lon, alt, hdg)
-
-    #             # 경로 데이터에 추가
-    #             self.add_path_point(lat, lon, alt, hdg)
-    #             self.pathDataChanged.emit()  # 경로 데이터 변경 알림
-
-    #         time.sleep(0.1)  # 0.1초 간격으로 데이터 확인
-
-    # @Slot()
-    # def stop_gps_monitoring(self):
-    #     """
-    #     GPS 데이터 모니터링 중지
-    #     """
-    #     if self.monitoring_thread and self.monitoring_thread.isRunning():
-    #         self.monitoring_thread.quit()
-    #         self.monitoring_thread.wait()
-    #         self.monitoring_thread = None
-    #         print("GPS 데이터 모니터링 중지.")
-    #     else:
-    #         print("모니터링이 실행 중이지 않습니다.")
+    # QML의 지도 경로와 History 창에서 사용할 경로 모델
+    @Property(QObject, constant=True)
+    def trackModel(self):
+        return self.track_model
+
+    @Property(QObject, constant=True)
+    def trackLod(self):
+        return self.track_lod
+
+    def add_path_point(self, lat, lon, alt, hdg, vehicle=None):
+        """경로 지점을 추가하는 헬퍼 함수 (vehicle이 없으면 선택된 기체의 경로에 추가, 표시 문자열은 QML이 요청할 때 만듦)"""
+        path = self._path_data if vehicle is None else self._paths.setdefault(vehicle, TrackStore())
+        if path is self._path_data:
+            self.track_model.append(time.time(), lat, lon, alt, hdg)  # 표시 중인 경로는 모델을 통해 추가 (추가된 행만 QML에 알림)
+        else:
+            path.append(time.time(), lat, lon, alt, hdg)
+            self.track_lod.update_store(path)  # 표시 중이 아닌 경로도 단순화를 미리 계산 (기체 전환 시 멈춤 방지)
+
+    def get_data(self, message_id: int, view):
+        """
+        SerialManager에서 구독한 위치 메시지가 전달되면 호출되는 함수 (모든 기체, view.source로 구분)
+         - 경로는 기체별로 RECORD_DISTANCE/RECORD_ALTITUDE 이상 움직였을 때만 기록 (RECORD_INTERVAL 간격 이상)
+         - 선택된 기체의 현재 위치는 캐시에만 저장하고 gpsDataChanged는 표시 타이머에서 1번만 발생
+        """
+        vehicle = view.source
+        if message_id == self.MSG_GLOBAL_POSITION_INT:
+            self._global_position_sources.add(vehicle)
+            if view['lat'] == 0 and view['lon'] == 0:  # 위치 없음 (GPS 미수신)
+                return
+            # lat/lon: degE7, relative_alt: mm, hdg: cdeg (UINT16_MAX = 알 수 없음)
+            lat, lon = view['lat'] / 1e7, view['lon'] / 1e7
+            alt = view['relative_alt'] / 1000.0
+            hdg = view.get('hdg', self.UNKNOWN_HEADING)
+
+        elif message_id == self.MSG_GPS_RAW_INT:
+            # GLOBAL_POSITION_INT를 보내는 기체는 GPS_RAW_INT를 사용하지 않음 (추정 위치가 더 정확)
+            if vehicle in self._global_position_sources or view.get('fix_type', 0) < self.FIX_TYPE_2D:
+                return
+            lat, lon = view['lat'] / 1e7, view['lon'] / 1e7
+            alt = view['alt'] / 1000.0
+            hdg = view.get('cog', self.UNKNOWN_HEADING)
+
+        else:
+            return
+
+        last = self._last_fixes.get(vehicle)
+        if hdg == self.UNKNOWN_HEADING:
+            hdg = last[4] if last else 0.0
+        else:
+            hdg = hdg / 100.0
+
+        now = time.monotonic()
+        if self._shouldRecord(last, now, lat, lon, alt):
+            self._last_fixes[vehicle] = (now, lat, lon, alt, hdg)
+            is_active = vehicle is None or vehicle == self._active_vehicle
+            self.add_path_point(lat, lon, alt, hdg, vehicle=None if is_active else vehicle)
+
+        if vehicle is None or vehicle == self._active_vehicle:
+            self._position = (lat, lon, alt, hdg)
+            if not self._display_timer.isActive():
+                self._display_timer.start()
+
+    def _shouldRecord(self, last, now: float, lat: float, lon: float, alt: float) -> bool:
+        """
+        마지막 기록 지점에서 충분히 움직였는지 확인합니다. (정지 중에는 RECORD_MAX_INTERVAL마다 1번)
+        """
+        if last is None:
+            return True
+        elapsed = now - last[0]
+        if elapsed < self.RECORD_INTERVAL:
+            return False
+        if elapsed >= self.RECORD_MAX_INTERVAL:
+            return True
+        dy = math.radians(lat - last[1]) * EARTH_RADIUS
+        dx = math.radians(lon - last[2]) * EARTH_RADIUS * math.cos(math.radians(lat))
+        return math.hypot(dx, dy) >= self.RECORD_DISTANCE or abs(alt - last[3]) >= self.RECORD_ALTITUDE
+
+    def _emitPosition(self):
+        """
+        표시 타이머: 마지막으로 받은 위치만 QML에 전달합니다.
+        """
+        if self._position is not None:
+            self.gpsDataChanged.emit(*self._position)
 
     @Slot(float, float, float, float)
     def updateGpsManual(self, lat: float, lon: float, alt: float, hdg: float):
@@ -124,7 +166,6 @@ class GpsManager(QObject):
 
         # 경로 데이터에 추가
         self.add_path_point(lat, lon, alt, hdg)
-        self.pathDataChanged.emit()  # 경로 데이터 변경 알림
 
     @Slot()
     def clearPath(self):
@@ -132,11 +173,26 @@ class GpsManager(QObject):
         경로 데이터를 초기화하는 슬롯
         """
         self._path_data.clear()
+        self._last_fixes.pop(self._active_vehicle, None)  # 다음 위치는 바로 기록
+        self.track_model.set_store(self._path_data)
         # 경로 초기화 후 초기점 다시 추가
         self.add_path_point(37.450767, 126.657016, 0, 0)
-        self.pathDataChanged.emit()
         print("GPS path cleared.")
 
+    @Slot(int, int)
+    def setActiveVehicle(self, sysid: int, compid: int):
+        """
+        지도에 표시할 기체의 경로로 전환하는 슬롯 (SerialManager.activeVehicleChanged에 연결)
+        """
+        vehicle = (sysid, compid)
+        if vehicle == self._active_vehicle:
+            return
+        self._active_vehicle = vehicle
+        self._position = None
+        self._display_timer.stop()
+        self._path_data = self._paths.setdefault(vehicle, TrackStore())
+        self.track_model.set_store(self._path_data)
+
     @Slot()
     def showLocationHistory(self):
         """Location History 창을 띄우는 슬롯"""
@@ -145,16 +201,16 @@ class GpsManager(QObject):
     # QML에서 직접 GPS 데이터를 가져갈 수 있도록 하는 슬롯들
     @Slot(result=float)
     def getLatitude(self):
-        return self.gps_reader.lat if self.gps_reader else 0.0
+        return self._position[0] if self._position else 0.0
 
     @Slot(result=float)
     def getLongitude(self):
-        return self.gps_reader.lon if self.gps_reader else 0.0
+        return self._position[1] if self._position else 0.0
 
     @Slot(result=float)
     def getAltitude(self):
-        return self.gps_reader.alt if self.gps_reader else 0.0
+        return self._position[2] if self._position else 0.0
 
     @Slot(result=float)
     def getHeading(self):
-        return self.gps_reader.hdg if self.gps_reader else 0.0
+        return self._position[3] if self._position else 0.0
@@ -0,0 +1,149 @@
+import json
+import math
+import struct
+
+import numpy as np
+from PySide6.QtCore import QObject, QByteArray
+from PySide6.QtNetwork import QHostAddress
+from PySide6.QtWebSockets import QWebSocketServer
+
+
+# 바이너리 프레임: 헤더 + float64 열(column) 데이터 (열 우선, little-endian)
+# 헤더 길이를 8의 배수로 맞춰 JS에서 복사 없이 Float64Array(buffer, 16)로 읽을 수 있도록 함
+FRAME_MAGIC = b"NGSF"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<4sHHII")  # magic, version, 종류, 열 개수, 행(샘플) 개수
+FRAME_LIVE = 0   # 실시간 수신 샘플
+FRAME_RANGE = 1  # 구간 조회 응답 (확대/이동 시 요청한 구간의 축소된 데이터)
+
+
+class GraphStreamServer(QObject):
+    """
+    그래프 WebView로 수신 데이터를 바이너리로 전달하는 로컬 WebSocket 서버
+     - runJavaScript(JSON.stringify(...)) 대신 프레임마다 float64 열 묶음 1개를 바이너리 메시지로 전송
+     - WebView는 접속 후 {"subscribe": 채널 이름}을 보내 원하는 채널만 받음
+     - 채널별 열 이름은 텍스트 메시지 {"columns": [...], "history": bool}로 한 번만 보내고, 이후에는 값만 전송
+     - history를 지원하는 채널은 {"range": {"x0", "x1", "points"}} 요청에 FRAME_RANGE 프레임으로 응답
+     - 모든 처리는 GUI 스레드에서 동작 (구독 콜백과 같은 스레드)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._server = QWebSocketServer("NALDA Graph Stream", QWebSocketServer.NonSecureMode, self)
+        self._server.newConnection.connect(self._on_new_connection)
+
+        self._clients = {}  # QWebSocket: 구독 중인 채널 이름 (구독 전에는 None)
+        self._columns = {}  # 채널 이름: 열 이름 목록
+        self._range_handlers = {}  # 채널 이름: 구간 조회 함수 (x0, x1, points) -> (열 개수, 점 개수) 배열
+
+        # 다른 프로그램과 충돌하지 않도록 로컬 주소의 빈 포트 사용
+        if not self._server.listen(QHostAddress.LocalHost, 0):
+            print(f"[GraphStream] 서버 시작 실패: {self._server.errorString()}")
+
+    @property
+    def port(self) -> int:
+        return self._server.serverPort()
+
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}" if self._server.isListening() else ""
+
+    def close(self):
+        for client in list(self._clients):
+            client.close()
+        self._clients = {}
+        self._server.close()
+
+    def has_subscribers(self, channel: str) -> bool:
+        return channel in self._clients.values()
+
+    def set_columns(self, channel: str, names: list):
+        """
+        채널의 열 이름 목록을 설정하고 구독자에게 알립니다.
+        """
+        self._columns[channel] = list(names)
+        message = self._columns_message(channel)
+        for client, subscribed in self._clients.items():
+            if subscribed == channel:
+                client.sendTextMessage(message)
+
+    def set_range_handler(self, channel: str, handler):
+        """
+        구간 조회 요청을 처리할 함수를 등록합니다. handler(x0, x1, points) -> (열 개수, 점 개수) 배열
+        """
+        self._range_handlers[channel] = handler
+
+    def publish(self, channel: str, columns: np.ndarray):
+        """
+        (열 개수, 샘플 개수) 모양의 배열을 바이너리 프레임 1개로 전송합니다.
+        """
+        if not self.has_subscribers(channel):
+            return
+
+        frame = self._frame(FRAME_LIVE, columns)
+        for client, subscribed in self._clients.items():
+            if subscribed == channel:
+                client.sendBinaryMessage(frame)
+
+    @staticmethod
+    def _frame(kind: int, columns: np.ndarray) -> QByteArray:
+        columns = np.ascontiguousarray(columns, dtype='<f8')
+        n_columns, n_rows = columns.shape
+        return QByteArray(FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, kind, n_columns, n_rows) + columns.tobytes())
+
+    def _columns_message(self, channel: str) -> str:
+        return json.dumps({'columns': self._columns[channel], 'history': channel in self._range_handlers})
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            client = self._server.nextPendingConnection()
+            self._clients[client] = None
+            client.textMessageReceived.connect(lambda message, client=client: self._on_text_message(client, message))
+            client.disconnected.connect(lambda client=client: self._on_disconnected(client))
+
+    def _on_text_message(self, client, message: str):
+        try:
+            request = json.loads(message)
+        except ValueError:
+            return
+
+        if 'range' in request:
+            self._on_range_request(client, request['range'])
+            return
+
+        channel = request.get('subscribe')
+        if channel is None:
+            return
+        self._clients[client] = channel
+        if channel in self._columns:
+            client.sendTextMessage(self._columns_message(channel))
+
+    def _on_range_request(self, client, request: dict):
+        """
+        구간 조회 요청을 처리하여 요청한 클라이언트에게만 응답합니다.
+        """
+        handler = self._range_handlers.get(self._clients.get(client))
+        if handler is None:
+            return
+        try:
+            # x0, x1이 없으면(null) 전체 구간
+            x0 = -math.inf if request.get('x0') is None else float(request['x0'])
+            x1 = math.inf if request.get('x1') is None else float(request['x1'])
+            columns = handler(x0, x1, int(request.get('points', 1000)))
+        except Exception as e:
+            print(f"[GraphStream] 구간 조회 실패: {str(e)}")
+            return
+        client.sendBinaryMessage(self._frame(FRAME_RANGE, columns))
+
+    def _on_disconnected(self, client):
+        self._clients.pop(client, None)
+        client.deleteLater()
+
+
+def batch_to_columns(batch: list, names: list) -> np.ndarray:
+    """
+    메시지 뷰 묶음을 (필드 개수, 샘플 개수) 모양의 float64 배열로 변환합니다.
+    """
+    columns = np.empty((len(names), len(batch)), dtype=np.float64)
+    for j, msg in enumerate(batch):
+        columns[:, j] = [msg[name] for name in names]
+    return columns
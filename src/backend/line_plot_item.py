@@ -0,0 +1,244 @@
+import ctypes
+import math
+
+import numpy as np
+from PySide6.QtCore import Signal, Slot, Property, QObject
+from PySide6.QtGui import QColor
+from PySide6.QtQml import QmlElement
+from PySide6.QtQuick import QQuickItem, QSGGeometry, QSGGeometryNode, QSGNode, QSGVertexColorMaterial
+
+QML_IMPORT_NAME = "NaldaPlot"
+QML_IMPORT_MAJOR_VERSION = 1
+
+# QSGGeometry.ColoredPoint2D와 같은 배치 (x, y: float, r, g, b, a: uchar)
+VERTEX_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('r', 'u1'), ('g', 'u1'), ('b', 'u1'), ('a', 'u1')])
+CURSOR_COLOR = QColor("#9e9e9e")
+
+
+@QmlElement
+class LinePlot(QQuickItem):
+    """
+    PlotRingBuffer의 최근 샘플을 Qt Quick 씬 그래프로 직접 그리는 선 그래프
+     - WebEngine/uPlot 없이 NumPy 배열에서 바로 정점(vertex) 배열을 만들어 GPU로 전달
+     - 모든 선과 커서를 정점 색상이 있는 노드 1개(DrawLines)로 그려 그래프당 draw call 1번
+     - 샘플이 화면 폭보다 많으면 픽셀 열마다 (최소, 최대) 두 점만 그려서 스파이크는 유지
+     - 정점 계산은 렌더링 동기화(updatePaintNode) 중에, 축 범위 계산은 GUI 스레드에서 수행
+    """
+
+    bufferChanged = Signal()
+    fieldsChanged = Signal()
+    colorsChanged = Signal()
+    cursorXChanged = Signal()
+    rangeChanged = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFlag(QQuickItem.ItemHasContents, True)
+
+        self._buffer = None
+        self._fields = []        # 그릴 필드 이름 목록
+        self._field_index = []   # 버퍼에서 각 필드의 위치 (없으면 -1)
+        self._colors = []        # 필드별 선 색상 (r, g, b, a)
+        self._cursor_x = math.nan
+        self._x_range = (0.0, 1.0)
+        self._y_range = (0.0, 1.0)
+
+    # ---- QML 프로퍼티 ----
+    @Property(QObject, notify=bufferChanged)
+    def buffer(self):
+        return self._buffer
+
+    @buffer.setter
+    def buffer(self, buffer):
+        if buffer is self._buffer:
+            return
+        if self._buffer is not None:
+            try:
+                self._buffer.appended.disconnect(self._onAppended)
+                self._buffer.columnsChanged.disconnect(self._onColumnsChanged)
+            except RuntimeError:
+                pass  # 종료 중 버퍼가 먼저 삭제된 경우
+        self._buffer = buffer
+        if buffer is not None:
+            buffer.appended.connect(self._onAppended)
+            buffer.columnsChanged.connect(self._onColumnsChanged)
+        self.bufferChanged.emit()
+        self._onColumnsChanged()
+
+    @Property(list, notify=fieldsChanged)
+    def fields(self):
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = list(fields)
+        self.fieldsChanged.emit()
+        self._onColumnsChanged()
+
+    @Property(list, notify=colorsChanged)
+    def colors(self):
+        return [QColor(*rgba).name() for rgba in self._colors]
+
+    @colors.setter
+    def colors(self, colors):
+        self._colors = [QColor(color).getRgb() for color in colors]
+        self.colorsChanged.emit()
+        self.update()
+
+    # 커서 위치 (x축 값, NaN이면 숨김). 여러 그래프가 같은 값을 바인딩하여 커서를 맞춤
+    @Property(float, notify=cursorXChanged)
+    def cursorX(self):
+        return self._cursor_x
+
+    @cursorX.setter
+    def cursorX(self, x):
+        if x == self._cursor_x or (math.isnan(x) and math.isnan(self._cursor_x)):
+            return
+        self._cursor_x = x
+        self.cursorXChanged.emit()
+        self.update()
+
+    @Property(float, notify=rangeChanged)
+    def xMin(self):
+        return self._x_range[0]
+
+    @Property(float, notify=rangeChanged)
+    def xMax(self):
+        return self._x_range[1]
+
+    @Property(float, notify=rangeChanged)
+    def yMin(self):
+        return self._y_range[0]
+
+    @Property(float, notify=rangeChanged)
+    def yMax(self):
+        return self._y_range[1]
+
+    # ---- QML에서 호출 ----
+    @Slot(float, result=float)
+    def xAt(self, px: float) -> float:
+        """
+        그래프 안의 가로 위치(px)를 x축 값으로 변환합니다.
+        """
+        x0, x1 = self._x_range
+        return x0 + (x1 - x0) * px / max(1.0, self.width())
+
+    @Slot(float, result=list)
+    def valuesAt(self, x: float) -> list:
+        """
+        x에 가장 가까운 샘플의 필드별 값을 반환합니다. (커서 범례 표시용)
+        """
+        if self._buffer is None or len(self._buffer) == 0 or math.isnan(x):
+            return []
+        xs = self._buffer.x_view()
+        i = min(int(np.searchsorted(xs, x)), len(xs) - 1)
+        if i > 0 and x - xs[i - 1] < xs[i] - x:
+            i -= 1
+        return [float(self._buffer.y_view(k)[i]) if k >= 0 else math.nan for k in self._field_index]
+
+    # ---- 데이터 갱신 ----
+    def _onColumnsChanged(self):
+        names = self._buffer.names if self._buffer is not None else []
+        self._field_index = [names.index(name) if name in names else -1 for name in self._fields]
+        self._onAppended()
+
+    def _onAppended(self):
+        """
+        축 범위를 다시 계산하고 다음 프레임에 다시 그리도록 예약합니다.
+        (update()는 프레임마다 1번으로 합쳐지므로 수신 주기와 관계없이 최대 화면 주사율로 그림)
+        """
+        x_range, y_range = (0.0, 1.0), (0.0, 1.0)
+        if self._buffer is not None and len(self._buffer):
+            xs = self._buffer.x_view()
+            x_range = (float(xs[0]), float(xs[-1]) if xs[-1] > xs[0] else float(xs[0]) + 1.0)
+
+            ys = [self._buffer.y_view(k) for k in self._field_index if k >= 0]
+            if ys:
+                y0 = min(float(np.nanmin(y)) for y in ys)
+                y1 = max(float(np.nanmax(y)) for y in ys)
+                if not (math.isfinite(y0) and math.isfinite(y1)):
+                    y0, y1 = 0.0, 1.0
+                elif y1 == y0:
+                    y0, y1 = y0 - 1.0, y1 + 1.0
+                else:
+                    pad = (y1 - y0) * 0.05
+                    y0, y1 = y0 - pad, y1 + pad
+                y_range = (y0, y1)
+
+        if (x_range, y_range) != (self._x_range, self._y_range):
+            self._x_range, self._y_range = x_range, y_range
+            self.rangeChanged.emit()
+        self.update()
+
+    # ---- 렌더링 ----
+    def _seriesPoints(self, k: int, width: float):
+        """
+        k번째 필드의 (x, y) 배열을 반환합니다. 화면 폭보다 샘플이 많으면 픽셀 열마다 (최소, 최대)로 줄입니다.
+        """
+        xs = self._buffer.x_view()
+        ys = self._buffer.y_view(k)
+        n = len(xs)
+        bucket = int(math.ceil(n / max(1.0, width)))
+        if bucket <= 2:
+            return xs, ys
+
+        starts = np.arange(0, n, bucket)
+        ends = np.minimum(starts + bucket - 1, n - 1)
+        x = np.empty(2 * len(starts))
+        y = np.empty(2 * len(starts))
+        x[0::2] = xs[starts]
+        x[1::2] = xs[ends]
+        y[0::2] = np.minimum.reduceat(ys, starts)
+        y[1::2] = np.maximum.reduceat(ys, starts)
+        return x, y
+
+    def updatePaintNode(self, node, data):
+        width, height = self.width(), self.height()
+        if node is None:
+            node = QSGGeometryNode()
+            geometry = QSGGeometry(QSGGeometry.defaultAttributes_ColoredPoint2D(), 0)
+            geometry.setDrawingMode(QSGGeometry.DrawingMode.DrawLines)
+            geometry.setVertexDataPattern(QSGGeometry.DataPattern.StreamPattern)
+            node.setGeometry(geometry)
+            node.setFlag(QSGNode.OwnsGeometry)
+            node.setMaterial(QSGVertexColorMaterial())
+            node.setFlag(QSGNode.OwnsMaterial)
+        geometry = node.geometry()
+
+        # 선마다 (점 개수 - 1)개의 선분을 정점 2개씩으로 그림
+        x0, x1 = self._x_range
+        y0, y1 = self._y_range
+        sx, sy = width / (x1 - x0), height / (y1 - y0)
+        series = []
+        if self._buffer is not None and len(self._buffer) > 1 and width > 0 and height > 0:
+            for i, k in enumerate(self._field_index):
+                if k < 0:
+                    continue
+                x, y = self._seriesPoints(k, width)
+                color = self._colors[i % len(self._colors)] if self._colors else (255, 255, 255, 255)
+                series.append(((x - x0) * sx, height - (y - y0) * sy, color))
+
+        cursor = math.isfinite(self._cursor_x) and x0 <= self._cursor_x <= x1
+        count = sum(2 * (len(px) - 1) for px, _, _ in series) + (2 if cursor else 0)
+        if geometry.vertexCount() != count:
+            geometry.allocate(count)
+
+        if count:
+            address = int(geometry.vertexData())
+            vertices = np.frombuffer((ctypes.c_char * (count * VERTEX_DTYPE.itemsize)).from_address(address), dtype=VERTEX_DTYPE)
+            pos = 0
+            for px, py, color in series:
+                # 점 0, 1, 1, 2, 2, 3, ... 순서로 선분 정점 배치
+                order = np.repeat(np.arange(len(px)), 2)[1:-1]
+                end = pos + len(order)
+                vertices['x'][pos:end] = px[order]
+                vertices['y'][pos:end] = py[order]
+                for channel, value in zip('rgba', color):
+                    vertices[channel][pos:end] = value
+                pos = end
+            if cursor:
+                cx = (self._cursor_x - x0) * sx
+                vertices[pos:pos + 2] = [(cx, 0.0) + CURSOR_COLOR.getRgb(), (cx, height) + CURSOR_COLOR.getRgb()]
+
+        node.markDirty(QSGNode.DirtyGeometry)
+        return node
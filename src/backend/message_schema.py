@@ -0,0 +1,241 @@
+import os
+import glob
+import pickle
+import struct
+import hashlib
+import threading
+
+from pymavlink import mavutil
+
+from .utils import data_path
+
+# 메시지 정의 캐시 (XML 파싱 결과를 저장하여 다음 실행부터는 XML을 읽지 않음)
+CATALOG_CACHE_VERSION = 1
+MINILINK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MiniLink")
+
+
+def numeric_fields(fields: list) -> list:
+    """
+    메시지 필드 정의(XML 속성 dict 목록)에서 그래프로 그릴 수 있는 숫자 스칼라 필드 이름만 고릅니다.
+    (배열 필드 float[4], 문자열 필드 char[50] 등은 제외)
+    """
+    names = []
+    for field in fields:
+        field_type = field.get('type', '')
+        if '[' in field_type or field_type.startswith('char'):
+            continue
+        names.append(field['name'])
+    return names
+
+
+class MessageSchema:
+    """
+    메시지 1종류의 정의 (처음 조회할 때 한 번만 만들어 재사용)
+     - names: 필드 이름 튜플 (수신 값 목록과 같은 순서), index: {필드 이름: 위치}
+     - numeric_names: 그래프로 그릴 수 있는 숫자 스칼라 필드
+     - values_struct: 비행 기록(mlog)의 값 목록(float64 × 필드 개수)을 한 번에 읽는 struct.Struct
+    """
+
+    __slots__ = ('id', 'name', 'description', 'fields', 'names', 'index', 'numeric_names', 'values_struct')
+
+    def __init__(self, msg_id: int, name: str, description: str, fields: list):
+        self.id = msg_id
+        self.name = name
+        self.description = description
+        self.fields = tuple(dict(field) for field in fields)
+        self.names = tuple(field['name'] for field in self.fields)
+        self.index = {name: idx for idx, name in enumerate(self.names)}
+        self.numeric_names = tuple(numeric_fields(self.fields))
+        self.values_struct = struct.Struct(f"<{len(self.names)}d")
+
+    def __reduce__(self):
+        # struct.Struct는 pickle할 수 없으므로 원본 정의만 저장하고 나머지는 불러올 때 다시 계산
+        return MessageSchema, (self.id, self.name, self.description, list(self.fields))
+
+    def field_list(self) -> list:
+        """
+        QML에 넘길 필드 속성 목록 (QML에서 plot 등을 바꾸므로 매번 복사본을 만듦)
+        """
+        return [dict(field, plot=True, units=field.get('units', '')) for field in self.fields]
+
+    def meta_data(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description,
+            'fields': self.field_list()
+        }
+
+
+class MessageSchemaRegistry:
+    """
+    msg_id별 MessageSchema 저장소
+     - MiniLink XML 정의(XmlHandler)에서 찾고, 없으면 pymavlink의 MAVLink 정의를 사용
+     - 한 번 만든 정의는 dict에 보관하여 이후 조회는 O(1) (XML 트리를 다시 탐색하지 않음)
+     - XML은 캐시에 없는 정의를 처음 조회할 때 한 번만 읽음 (xml_handler_factory)
+     - cache_path가 있으면 만든 정의를 pickle로 저장하고, XML 파일이 그대로이면 다음 실행에서 불러옴
+       (조회 중에는 변경 표시만 하고, save()에서 한 번에 저장 - 수신 스레드에서 디스크에 쓰지 않음)
+     - 데이터 읽기 스레드와 GUI 스레드에서 함께 조회할 수 있음
+    """
+
+    def __init__(self, xml_handler_factory=None, cache_path: str = None, xml_dir: str = MINILINK_DIR):
+        self._xml_handler_factory = xml_handler_factory
+        self._xml_handler = None
+        self._xml_dir = xml_dir
+        self._cache_path = cache_path
+        self._signature = None
+        self._lock = threading.Lock()
+        self._schemas = {}
+        self._missing = set()  # 어디에도 정의가 없는 msg_id (반복 탐색 방지)
+        self._dirty = False    # 캐시 파일에 저장하지 않은 정의가 있는지
+        if cache_path:
+            self._loadCache()
+
+    def get(self, msg_id: int):
+        """
+        msg_id의 정의를 반환합니다. 정의가 없으면 None
+        """
+        schema = self._schemas.get(msg_id)
+        if schema is None and msg_id not in self._missing:
+            with self._lock:
+                schema = self._schemas.get(msg_id)
+                if schema is None and msg_id not in self._missing:
+                    schema = self._build(msg_id)
+                    if schema is None:
+                        self._missing.add(msg_id)
+                    else:
+                        self._schemas[msg_id] = schema
+                    self._dirty = True
+        return schema
+
+    def preload(self, msg_ids):
+        """
+        msg_ids의 정의를 미리 만들고 캐시 파일에 저장합니다. (연결 직후 메시지 목록을 받았을 때 사용)
+        """
+        for msg_id in msg_ids:
+            self.get(msg_id)
+        self.save()
+
+    def save(self):
+        """
+        새로 만든 정의가 있으면 캐시 파일에 저장합니다. (preload 후, 프로그램 종료 시)
+        """
+        with self._lock:
+            if self._dirty:
+                self._saveCache()
+                self._dirty = False
+
+    def __getitem__(self, msg_id: int) -> MessageSchema:
+        schema = self.get(msg_id)
+        if schema is None:
+            raise KeyError(msg_id)
+        return schema
+
+    def __contains__(self, msg_id: int) -> bool:
+        return self.get(msg_id) is not None
+
+    def _build(self, msg_id: int):
+        return self._buildFromXml(msg_id) or self._buildFromMavlink(msg_id)
+
+    def _xmlHandler(self):
+        """
+        XmlHandler를 처음 필요할 때 만들고 XML 정의를 읽습니다.
+        """
+        if self._xml_handler is None and self._xml_handler_factory is not None:
+            handler = self._xml_handler_factory()
+            handler.loadMessageListFromXML({})
+            self._xml_handler = handler
+        return self._xml_handler
+
+    def _buildFromXml(self, msg_id: int):
+        xml_handler = self._xmlHandler()
+        if xml_handler is None:
+            return None
+        instance = xml_handler.getMessageInstance(msg_id)
+        if instance is None:
+            return None
+        description = instance.find("description")
+        return MessageSchema(
+            msg_id,
+            instance.get("name"),
+            description.text if description is not None else "",
+            [field.attrib for field in instance.findall("field")]
+        )
+
+    @staticmethod
+    def _buildFromMavlink(msg_id: int):
+        msg_def = mavutil.mavlink.mavlink_map.get(msg_id)
+        if msg_def is None:
+            return None
+        fields = []
+        for name, field_type, length in zip(msg_def.fieldnames, msg_def.fieldtypes, msg_def.array_lengths):
+            fields.append({
+                'name': name,
+                'type': f"{field_type}[{length}]" if length else field_type,
+                'units': msg_def.fieldunits_by_name.get(name, ''),
+            })
+        description = " ".join((msg_def.__doc__ or "").split())
+        return MessageSchema(msg_id, msg_def.msgname, description, fields)
+
+    # ---- 디스크 캐시 ----
+    def _sourceSignature(self) -> str:
+        """
+        정의 원본의 식별값 (MiniLink XML 파일 경로/크기/수정 시각 + pymavlink 방언)
+        XML 내용을 읽지 않고 파일 정보만으로 계산하므로 빠름
+        """
+        digest = hashlib.sha1(f"{CATALOG_CACHE_VERSION}:{mavutil.mavlink.__name__}:{len(mavutil.mavlink.mavlink_map)}".encode())
+        for path in sorted(glob.glob(os.path.join(self._xml_dir, "**", "*.xml"), recursive=True)):
+            stat = os.stat(path)
+            digest.update(f"{os.path.relpath(path, self._xml_dir)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+
+    def _loadCache(self):
+        try:
+            self._signature = self._sourceSignature()
+            with open(self._cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+            return
+        if isinstance(cached, dict) and cached.get('signature') == self._signature:
+            self._schemas.update(cached['schemas'])
+            self._missing.update(cached['missing'])
+
+    def _saveCache(self):
+        """
+        지금까지 만든 정의를 저장합니다. (save()에서 호출, 임시 파일에 쓰고 교체)
+        """
+        if not self._cache_path:
+            return
+        tmp_path = f"{self._cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'signature': self._signature, 'schemas': dict(self._schemas), 'missing': set(self._missing)}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+        except OSError as e:
+            print(f"메시지 정의 캐시 저장 실패: {e}")
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def _createXmlHandler():
+    from .MiniLink.lib.xmlHandler import XmlHandler
+    return XmlHandler()
+
+
+def default_cache_path() -> str:
+    return data_path(os.path.join("cache", "message_catalog.pickle"))
+
+
+def message_catalog() -> MessageSchemaRegistry:
+    """
+    프로세스 전체에서 공유하는 메시지 정의 저장소를 반환합니다. (처음 호출할 때 생성)
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = MessageSchemaRegistry(_createXmlHandler, default_cache_path())
+    return _catalog
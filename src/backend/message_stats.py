@@ -0,0 +1,195 @@
+import time
+
+
+class MessageRateTracker:
+    """
+    msg_id 하나의 수신 주기 통계
+     - 최근 window개의 수신 시각을 링 버퍼에 저장하여 현재 Hz와 최대 간격을 계산
+     - 수신 간격의 지터는 EWMA로 추적 (RFC 3550 방식)
+     - 메시지 수신마다 O(1)로 갱신
+    """
+
+    __slots__ = ('times', 'window', 'cursor', 'size', 'count', 'mean_dt', 'jitter')
+
+    def __init__(self, window: int = 64):
+        self.times = [0.0] * window  # 최근 수신 시각 링 버퍼
+        self.window = window
+        self.cursor = 0              # 다음에 기록할 위치
+        self.size = 0                # 링 버퍼에 채워진 개수
+        self.count = 0               # 전체 수신 횟수
+        self.mean_dt = 0.0           # 수신 간격 EWMA (초)
+        self.jitter = 0.0            # 수신 간격 변동 EWMA (초)
+
+    def update(self, t: float):
+        if self.size:
+            dt = t - self.times[self.cursor - 1]
+            if self.count == 1:
+                self.mean_dt = dt
+            else:
+                self.jitter += (abs(dt - self.mean_dt) - self.jitter) / 16
+                self.mean_dt += (dt - self.mean_dt) / 8
+
+        self.times[self.cursor] = t
+        self.cursor = (self.cursor + 1) % self.window
+        self.size = min(self.size + 1, self.window)
+        self.count += 1
+
+    def last_time(self) -> float:
+        return self.times[self.cursor - 1] if self.size else 0.0
+
+    def first_time(self) -> float:
+        return self.times[(self.cursor - self.size) % self.window] if self.size else 0.0
+
+    def hz(self, now: float) -> float:
+        """
+        최근 window 구간의 수신 주기(Hz)
+        수신이 끊기면 마지막 수신 이후 경과 시간을 반영하여 0으로 수렴합니다.
+        """
+        if self.size < 2:
+            return 0.0
+
+        first, last = self.first_time(), self.last_time()
+        span = last - first
+        idle = now - last
+        if span <= 0:
+            return 0.0
+        if idle > 2 * span / (self.size - 1):
+            # 평소 간격의 2배 이상 수신이 없으면 경과 시간까지 포함
+            span = now - first
+        return (self.size - 1) / span
+
+    def max_gap(self, now: float) -> float:
+        """
+        최근 window 구간에서 가장 긴 수신 간격 (현재 대기 중인 간격 포함)
+        """
+        if self.size < 2:
+            return 0.0
+
+        start = self.cursor - self.size
+        gap = now - self.last_time()
+        for i in range(1, self.size):
+            dt = self.times[(start + i) % self.window] - self.times[(start + i - 1) % self.window]
+            if dt > gap:
+                gap = dt
+        return gap
+
+
+class LinkSequenceTracker:
+    """
+    링크별 MAVLink 송신자(sysid, compid)의 시퀀스 번호로 누락된 패킷 수를 추적
+     - seq는 링크마다 따로 증가하므로 링크를 합쳐서 추적하지 않음
+     - 차이가 0이면 중복, 128 이상(뒤로 간 번호)이면 순서가 바뀐 패킷으로 보고 누락에 더하지 않음
+     - 중복은 received에 더하지 않고 duplicates로 따로 셈 (손실률이 낮게 계산되지 않도록)
+    """
+
+    __slots__ = ('last_seq', 'received', 'dropped', 'duplicates')
+
+    REORDER_WINDOW = 128
+
+    def __init__(self):
+        self.last_seq = None
+        self.received = 0
+        self.dropped = 0
+        self.duplicates = 0
+
+    def update(self, seq: int):
+        if self.last_seq is None:
+            self.received += 1
+            self.last_seq = seq
+            return
+        delta = (seq - self.last_seq) & 0xFF
+        if delta == 0:
+            self.duplicates += 1
+            return
+        self.received += 1
+        if delta >= self.REORDER_WINDOW:
+            # 늦게 도착한 패킷: 이미 누락으로 센 것이므로 1개 되돌림 (last_seq는 그대로)
+            if self.dropped > 0:
+                self.dropped -= 1
+            return
+        self.dropped += delta - 1
+        self.last_seq = seq
+
+
+class MessageStats:
+    """
+    메시지 통계 관리 클래스
+     - 데이터 읽기 스레드에서 update()로 O(1) 갱신
+     - QML에서는 snapshot()을 폴링하며, 결과는 일정 시간 동안 캐시하여 재사용
+    """
+
+    def __init__(self, window: int = 64, snapshot_ttl: float = 0.2):
+        self._window = window
+        self._snapshot_ttl = snapshot_ttl
+        self.reset()
+
+    def reset(self):
+        self._trackers = {}   # msg_id: MessageRateTracker
+        self._links = {}      # (link_id, sysid, compid): LinkSequenceTracker
+        self._snapshot = {}
+        self._snapshot_time = 0.0
+
+    def update(self, msg_id: int, seq: int = None, source: tuple = None, link_id: str = None, t: float = None):
+        """
+        메시지 1개 수신을 기록합니다. (데이터 읽기 스레드에서 호출)
+        msg_id가 None이면 링크별 시퀀스 번호만 기록합니다.
+        """
+        if msg_id is not None:
+            if t is None:
+                t = time.monotonic()
+            tracker = self._trackers.get(msg_id)
+            if tracker is None:
+                tracker = self._trackers.setdefault(msg_id, MessageRateTracker(self._window))
+            tracker.update(t)
+
+        if seq is not None:
+            key = (link_id,) + source
+            link = self._links.get(key)
+            if link is None:
+                link = self._links.setdefault(key, LinkSequenceTracker())
+            link.update(seq)
+
+    def __contains__(self, msg_id: int) -> bool:
+        return msg_id in self._trackers
+
+    def hz(self, msg_id: int) -> float:
+        return self.snapshot().get(msg_id, {}).get('hz', 0.0)
+
+    def snapshot(self) -> dict:
+        """
+        msg_id별 통계 스냅샷 ({msg_id: {'hz', 'jitter', 'max_gap', 'count'}})
+        snapshot_ttl 동안은 같은 결과를 반환하므로, QML에서 자주 호출해도 비용이 작습니다.
+        """
+        now = time.monotonic()
+        if now - self._snapshot_time < self._snapshot_ttl:
+            return self._snapshot
+
+        snapshot = {}
+        for msg_id, tracker in list(self._trackers.items()):
+            snapshot[msg_id] = {
+                'hz': tracker.hz(now),
+                'jitter': tracker.jitter,
+                'max_gap': tracker.max_gap(now),
+                'count': tracker.count,
+            }
+        self._snapshot = snapshot
+        self._snapshot_time = now
+        return snapshot
+
+    def link_snapshot(self) -> list:
+        """
+        링크별 MAVLink 송신자의 수신/누락 통계 목록
+        """
+        links = []
+        for (link_id, sysid, compid), link in list(self._links.items()):
+            total = link.received + link.dropped
+            links.append({
+                'link': link_id or '',
+                'sysid': sysid,
+                'compid': compid,
+                'received': link.received,
+                'dropped': link.dropped,
+                'duplicates': link.duplicates,
+                'loss': link.dropped / total if total else 0.0,
+            })
+        return links
@@ -0,0 +1,95 @@
+from collections.abc import Mapping
+
+
+class MessageView(Mapping):
+    """
+    수신한 메시지를 dict로 복사하지 않고 감싸서 보여주는 읽기 전용 뷰
+     - 구독자가 실제로 읽는 필드만 꺼내므로, 메시지마다 dict를 만드는 비용이 없음
+     - QML로 넘길 때는 to_dict(fields)로 필요한 필드만 dict로 만듦
+    """
+
+    __slots__ = ()
+
+    @property
+    def source(self):
+        """
+        메시지를 보낸 기체 (sysid, compid), 구분할 수 없으면 None
+        """
+        return None
+
+    def to_dict(self, fields=None) -> dict:
+        """
+        fields에 해당하는 필드만 dict로 만듭니다. fields가 없으면 모든 필드를 만듭니다.
+        """
+        if fields is None:
+            fields = self
+        return {name: self[name] for name in fields if name in self}
+
+
+class MavlinkMessageView(MessageView):
+    """
+    pymavlink 메시지용 뷰 (msg.to_dict() 대신 필요한 속성만 getattr)
+    필드 이름 집합은 메시지 클래스별로 한 번만 만들어 재사용합니다. (get_fieldnames()는 list라 검색이 O(n))
+    """
+
+    __slots__ = ('_msg', '_fields')
+
+    _field_sets: dict = {}
+
+    def __init__(self, msg):
+        self._msg = msg
+        fields = self._field_sets.get(type(msg))
+        if fields is None:
+            fields = self._field_sets[type(msg)] = frozenset(msg.get_fieldnames())
+        self._fields = fields
+
+    @property
+    def msg(self):
+        return self._msg
+
+    @property
+    def source(self):
+        return self._msg.get_srcSystem(), self._msg.get_srcComponent()
+
+    def __getitem__(self, key):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self._msg, key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def __iter__(self):
+        return iter(self._msg.get_fieldnames())
+
+    def __len__(self):
+        return len(self._fields)
+
+
+class MiniLinkMessageView(MessageView):
+    """
+    MiniLink 수신 데이터(list)용 뷰 (필드 이름과 값을 zip하여 dict를 만들지 않음)
+    field_index는 메시지 종류별로 한 번만 만들어 재사용합니다. ({필드 이름: 인덱스})
+    """
+
+    __slots__ = ('_field_index', '_values')
+
+    def __init__(self, field_index: dict, values: list):
+        self._field_index = field_index
+        self._values = values
+
+    def __getitem__(self, key):
+        idx = self._field_index[key]
+        if idx >= len(self._values):
+            raise KeyError(key)
+        return self._values[idx]
+
+    def __contains__(self, key):
+        idx = self._field_index.get(key)
+        return idx is not None and idx < len(self._values)
+
+    def __iter__(self):
+        return (name for name, idx in self._field_index.items() if idx < len(self._values))
+
+    def __len__(self):
+        return min(len(self._field_index), len(self._values))
@@ -0,0 +1,158 @@
+from collections import deque
+
+
+class MiniLinkPollScheduler:
+    """
+    자작 FC(MiniLink) 메시지 요청 스케줄러
+     - 구독 중인 메시지는 목표 주기(Hz)에 맞춰 가중치 우선순위로 요청
+     - 구독하지 않은 메시지는 여유가 있을 때만 순서대로 요청
+     - 최대 max_in_flight개의 요청을 응답 대기 상태로 유지 (파이프라이닝)
+
+    MiniLink 응답에는 msg_id가 없으므로 응답의 값 개수(reply size)로 요청과 짝을 맞춥니다.
+     - 값 개수가 같은 요청은 동시에 하나만 응답 대기 상태로 두므로, 응답 하나는 항상 요청 하나와만 짝지어짐
+     - FC는 요청 순서대로 응답하므로, 짝이 맞은 요청보다 앞선 요청은 유실된 것으로 봄
+     - reply_timeout 동안 응답이 없는 요청은 유실된 것으로 보고, 늦게 온 응답이 새 요청과 짝지어지지 않도록
+       같은 값 개수의 요청을 reply_timeout 동안 보내지 않음
+    """
+
+    def __init__(self, max_in_flight: int = 4, reply_timeout: float = 0.2, default_rate_hz: float = 50.0):
+        self.max_in_flight = max_in_flight
+        self.reply_timeout = reply_timeout
+        self.default_rate_hz = default_rate_hz
+
+        self._priority_rates = {}   # 구독 중인 msg_id: 목표 주기(Hz)
+        self.reset([])
+
+    def reset(self, message_ids: list, reply_sizes: dict = None):
+        """
+        요청 가능한 메시지 목록과 메시지별 응답 값 개수({msg_id: 개수})를 설정하고 상태를 초기화합니다.
+        값 개수를 모르는 메시지는 요청하지 않습니다.
+        """
+        self._reply_sizes = dict(reply_sizes or {})
+        self._message_ids = [msg_id for msg_id in message_ids if msg_id in self._reply_sizes]
+        self._background_idx = 0
+        self._last_request = {}     # msg_id: 마지막 요청 시각
+        self._in_flight = deque()   # (msg_id, 응답 값 개수, 요청 시각)
+        self._blocked_sizes = {}    # 응답이 만료된 값 개수: 다시 요청할 수 있는 시각
+        self.lost = 0               # 응답이 오지 않은 요청 수
+
+    def set_priority(self, rates: dict):
+        """
+        구독 중인 메시지와 목표 주기를 설정합니다. ({msg_id: Hz}, Hz가 None이면 기본값)
+        GUI 스레드에서 호출되므로 dict를 통째로 교체합니다.
+        """
+        self._priority_rates = {
+            msg_id: rate_hz or self.default_rate_hz for msg_id, rate_hz in rates.items()
+        }
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _busy_sizes(self, now: float) -> set:
+        """
+        지금 요청하면 응답을 구분할 수 없는 값 개수 집합 (응답 대기 중이거나 최근 만료된 요청)
+        """
+        busy = {size for _, size, _ in self._in_flight}
+        busy.update(size for size, until in self._blocked_sizes.items() if now < until)
+        return busy
+
+    def next_request(self, now: float):
+        """
+        지금 요청할 msg_id를 반환합니다. 요청할 메시지가 없으면 None
+        """
+        if len(self._in_flight) >= self.max_in_flight:
+            return None
+
+        busy = self._busy_sizes(now)
+        sizes = self._reply_sizes
+
+        # 1. 구독 중인 메시지: 목표 주기 대비 가장 늦어진 메시지 선택
+        best_id, best_score = None, 1.0
+        for msg_id, rate_hz in self._priority_rates.items():
+            size = sizes.get(msg_id)
+            if size is None or size in busy:
+                continue
+            last = self._last_request.get(msg_id)
+            if last is None:
+                return msg_id
+            score = (now - last) * rate_hz  # 1 이상이면 요청 시점이 지남
+            if score >= best_score:
+                best_id, best_score = msg_id, score
+        if best_id is not None:
+            return best_id
+
+        # 2. 나머지 메시지: 대기 중인 요청이 없을 때만 순서대로 하나씩
+        if self._in_flight or not self._message_ids:
+            return None
+        for _ in range(len(self._message_ids)):
+            msg_id = self._message_ids[self._background_idx]
+            self._background_idx = (self._background_idx + 1) % len(self._message_ids)
+            if msg_id not in self._priority_rates and sizes[msg_id] not in busy:
+                return msg_id
+        return None
+
+    def time_until_next(self, now: float) -> float:
+        """
+        다음 요청 또는 응답 만료 처리까지 남은 시간(초)
+        응답을 기다리는 동안 이 시간만큼 잠들 수 있습니다.
+        """
+        wait = float('inf')
+        if self._in_flight:
+            wait = self._in_flight[0][2] + self.reply_timeout - now
+        if len(self._in_flight) < self.max_in_flight:
+            busy = self._busy_sizes(now)
+            for msg_id, rate_hz in self._priority_rates.items():
+                size = self._reply_sizes.get(msg_id)
+                if size is None:
+                    continue
+                if size in busy:
+                    # 만료로 막힌 값 개수는 풀리는 시각까지 (응답 대기 중인 것은 응답/만료 시각에 다시 확인)
+                    until = self._blocked_sizes.get(size)
+                    if until is not None and until > now:
+                        wait = min(wait, until - now)
+                    continue
+                last = self._last_request.get(msg_id)
+                if last is None:
+                    return 0.0
+                wait = min(wait, last + 1 / rate_hz - now)
+        return max(0.0, wait)
+
+    def clear_in_flight(self, now: float = None):
+        """
+        응답 대기 중인 요청을 모두 버립니다. (수신 버퍼를 비워 응답 순서가 어긋났을 때 사용)
+        now를 주면 버린 요청의 값 개수는 만료와 같이 reply_timeout 동안 다시 요청하지 않습니다.
+        """
+        self.lost += len(self._in_flight)
+        if now is not None:
+            for _, size, _ in self._in_flight:
+                self._blocked_sizes[size] = now + self.reply_timeout
+        self._in_flight.clear()
+
+    def on_request(self, msg_id: int, now: float):
+        self._in_flight.append((msg_id, self._reply_sizes[msg_id], now))
+        self._last_request[msg_id] = now
+
+    def on_reply(self, size: int, now: float):
+        """
+        값 개수가 size인 응답 1개를 받았을 때 호출하며, 짝이 맞는 msg_id를 반환합니다.
+        짝이 맞는 요청이 없으면 (만료 후 늦게 온 응답 등) None
+        """
+        for i, (msg_id, request_size, _) in enumerate(self._in_flight):
+            if request_size == size:
+                # 앞선 요청은 응답 없이 지나간 것이므로 만료와 같이 유실로 처리
+                for _ in range(i):
+                    _, skipped_size, _ = self._in_flight.popleft()
+                    self._blocked_sizes[skipped_size] = now + self.reply_timeout
+                self.lost += i
+                self._in_flight.popleft()
+                return msg_id
+        return None
+
+    def expire(self, now: float):
+        """
+        reply_timeout이 지난 요청을 제거합니다.
+        """
+        while self._in_flight and now - self._in_flight[0][2] > self.reply_timeout:
+            _, size, _ = self._in_flight.popleft()
+            self._blocked_sizes[size] = now + self.reply_timeout
+            self.lost += 1
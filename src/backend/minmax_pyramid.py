@@ -0,0 +1,211 @@
+import numpy as np
+
+
+class _Level:
+    """
+    피라미드 한 단계 (구간마다 시작/끝 x와 필드별 최소/최대값)
+    0단계는 원본 샘플이므로 시작=끝, 최소=최대 배열을 공유합니다.
+    """
+
+    __slots__ = ('x_start', 'x_end', 'mn', 'mx', 'length', 'raw')
+
+    def __init__(self, n_fields: int, capacity: int, raw: bool = False):
+        self.raw = raw
+        self.length = 0
+        self.x_start = np.empty(capacity, dtype=np.float64)
+        self.mn = np.empty((n_fields, capacity), dtype=np.float32)
+        if raw:
+            self.x_end = self.x_start
+            self.mx = self.mn
+        else:
+            self.x_end = np.empty(capacity, dtype=np.float64)
+            self.mx = np.empty((n_fields, capacity), dtype=np.float32)
+
+    def reserve(self, n: int):
+        """
+        n개를 더 쓸 수 있도록 필요하면 용량을 2배씩 늘립니다.
+        """
+        capacity = len(self.x_start)
+        if self.length + n <= capacity:
+            return
+        while capacity < self.length + n:
+            capacity *= 2
+
+        def grow(arr):
+            new = np.empty(arr.shape[:-1] + (capacity,), dtype=arr.dtype)
+            new[..., :self.length] = arr[..., :self.length]
+            return new
+
+        self.x_start = grow(self.x_start)
+        self.mn = grow(self.mn)
+        if self.raw:
+            self.x_end = self.x_start
+            self.mx = self.mn
+        else:
+            self.x_end = grow(self.x_end)
+            self.mx = grow(self.mx)
+
+    def append(self, x_start, x_end, mn, mx):
+        n = len(x_start)
+        self.reserve(n)
+        end = self.length + n
+        self.x_start[self.length:end] = x_start
+        self.mn[:, self.length:end] = mn
+        if not self.raw:
+            self.x_end[self.length:end] = x_end
+            self.mx[:, self.length:end] = mx
+        self.length = end
+
+    def drop_front(self, n: int):
+        """
+        앞쪽 n개를 버리고 나머지를 앞으로 당깁니다.
+        """
+        if n <= 0:
+            return
+        remain = self.length - n
+        self.x_start[:remain] = self.x_start[n:self.length]
+        self.mn[:, :remain] = self.mn[:, n:self.length]
+        if not self.raw:
+            self.x_end[:remain] = self.x_end[n:self.length]
+            self.mx[:, :remain] = self.mx[:, n:self.length]
+        self.length = remain
+
+
+class MinMaxPyramid:
+    """
+    긴 시간 구간의 센서 데이터를 화면 폭에 맞게 줄여서 보여주기 위한 다중 해상도 저장소
+     - 0단계는 원본 샘플, k단계는 원본 factor^k개마다 (최소, 최대)를 저장
+     - 조회 시 요청한 점 개수 이하가 되는 가장 세밀한 단계를 골라 반환하므로
+       10^6개 이상의 샘플도 화면 폭 정도의 점만 그리면서 순간적인 스파이크는 그대로 보임
+     - 원본이 max_samples를 넘으면 오래된 절반을 버림
+    x는 샘플 시각(또는 순번)이며 증가하는 순서로 추가되어야 합니다.
+    """
+
+    def __init__(self, n_fields: int, factor: int = 4, max_samples: int = 1 << 21, initial_capacity: int = 4096):
+        self.n_fields = n_fields
+        self.factor = factor
+        self.max_samples = max_samples
+        self._initial_capacity = initial_capacity
+        self.levels = [_Level(n_fields, initial_capacity, raw=True)]
+
+    def __len__(self):
+        return self.levels[0].length
+
+    def clear(self):
+        self.levels = [_Level(self.n_fields, self._initial_capacity, raw=True)]
+
+    def x_range(self) -> tuple:
+        raw = self.levels[0]
+        if raw.length == 0:
+            return 0.0, 0.0
+        return float(raw.x_start[0]), float(raw.x_start[raw.length - 1])
+
+    def append(self, x: np.ndarray, values: np.ndarray):
+        """
+        샘플 묶음을 추가합니다. x: (샘플 개수,), values: (필드 개수, 샘플 개수)
+        """
+        n = len(x)
+        if n == 0:
+            return
+        if len(self) + n > self.max_samples:
+            self._drop_oldest()
+
+        self.levels[0].append(x, x, values, values)
+        self._build_levels()
+
+    def _build_levels(self):
+        """
+        아래 단계에 factor개가 새로 모일 때마다 위 단계 구간을 만듭니다.
+        """
+        f = self.factor
+        k = 1
+        while True:
+            lower = self.levels[k - 1]
+            complete = lower.length // f
+            if complete == 0:
+                break
+            if k == len(self.levels):
+                self.levels.append(_Level(self.n_fields, max(16, lower.length // f)))
+            level = self.levels[k]
+
+            start = level.length
+            if complete > start:
+                count = complete - start
+                seg = slice(start * f, complete * f)
+                mn = lower.mn[:, seg].reshape(self.n_fields, count, f).min(axis=2)
+                mx = lower.mx[:, seg].reshape(self.n_fields, count, f).max(axis=2)
+                level.append(lower.x_start[seg][::f], lower.x_end[seg][f - 1::f], mn, mx)
+            k += 1
+
+    def _drop_oldest(self):
+        """
+        오래된 샘플 절반을 버립니다.
+        구간 경계가 유지되도록 버리는 개수 이하인 가장 큰 구간 크기의 배수로 버리고, 그보다 위 단계는 다시 만듭니다.
+        """
+        half = len(self) // 2
+        j = 0
+        while j + 1 < len(self.levels) and self.factor ** (j + 1) <= half:
+            j += 1
+        drop = half // self.factor ** j * self.factor ** j
+
+        del self.levels[j + 1:]
+        for k, level in enumerate(self.levels):
+            level.drop_front(drop // self.factor ** k)
+        self._build_levels()
+
+    def query(self, x0: float, x1: float, max_points: int):
+        """
+        [x0, x1] 구간을 max_points개 이하의 점으로 반환합니다.
+        (x 배열, (필드 개수, 점 개수) 배열), 1단계 이상은 구간마다 (시작 x, 최소), (끝 x, 최대) 두 점을 반환
+        """
+        raw = self.levels[0]
+        if raw.length == 0:
+            return np.empty(0), np.empty((self.n_fields, 0), dtype=np.float32)
+
+        # 화면 가장자리까지 선이 이어지도록 구간 밖의 점을 하나씩 포함
+        xs = raw.x_start[:raw.length]
+        i0 = max(0, int(np.searchsorted(xs, x0, 'left')) - 1)
+        i1 = min(raw.length, int(np.searchsorted(xs, x1, 'right')) + 1)
+
+        # 점 개수가 max_points 이하가 되는 가장 세밀한 단계 선택
+        k = 0
+        while k + 1 < len(self.levels) and self._points(k, i0, i1) > max_points:
+            k += 1
+
+        # k단계 구간 + 아직 k단계로 묶이지 않은 최근 샘플(아래 단계에서 가져옴)
+        segments = []
+        covered = i0  # 지금까지 반환한 원본 샘플 위치
+        for j in range(k, -1, -1):
+            size = self.factor ** j
+            level = self.levels[j]
+            b0 = covered // size
+            b1 = min(level.length, -(-i1 // size))
+            if b1 > b0:
+                segments.append(self._segment(level, b0, b1))
+                covered = b1 * size
+            if covered >= i1:
+                break
+
+        x = np.concatenate([seg[0] for seg in segments])
+        values = np.concatenate([seg[1] for seg in segments], axis=1)
+        return x, values
+
+    def _points(self, k: int, i0: int, i1: int) -> int:
+        size = self.factor ** k
+        b1 = min(self.levels[k].length, -(-i1 // size))
+        count = max(0, b1 - i0 // size)
+        return count if k == 0 else 2 * count
+
+    @staticmethod
+    def _segment(level: _Level, b0: int, b1: int):
+        if level.raw:
+            return level.x_start[b0:b1].copy(), level.mn[:, b0:b1].copy()
+
+        n = b1 - b0
+        x = np.empty(2 * n, dtype=np.float64)
+        x[0::2] = level.x_start[b0:b1]
+        x[1::2] = level.x_end[b0:b1]
+        values = np.empty((level.mn.shape[0], 2 * n), dtype=np.float32)
+        values[:, 0::2] = level.mn[:, b0:b1]
+        values[:, 1::2] = level.mx[:, b0:b1]
+        return x, values
@@ -1,5 +1,8 @@
 import math
-from PySide6.QtCore import QObject, Signal, QTimer, Slot
+import time
+from PySide6.QtCore import QObject, Signal, QTimer, Slot, Property, Qt
+
+from .telemetry_smoother import SampleClock, SmoothedValue
 # from PySide6.QtQml import QmlElement
 
 # QML_IMPORT_NAME = "PFDController"
@@ -10,14 +13,33 @@ from PySide6.QtCore import QObject, Signal, QTimer, Slot
 class PFDManager(QObject):
     """
     PFD (Primary Flight Display) 데이터를 처리하고 QML과 통신하는 컨트롤러
+     - ATTITUDE/VFR_HUD/GLOBAL_POSITION_INT 수신값은 최신값 캐시(SmoothedValue)에만 저장 (수신 시 시그널 없음)
+     - 표시 타이머(60fps)가 캐시에서 현재 시각의 값을 보간/외삽하여 QML로 전달
+     - 움직일 값이 없으면 표시 타이머를 멈춤
+     - QML에는 모든 계기 값을 flightState 1개로 묶어 프레임당 최대 1번 전달 (임계값 미만의 변화는 전달하지 않음)
     """
 
-    # QML로 데이터를 전송하는 시그널들
-    pitchAngleChanged = Signal(float)
-    rollAngleChanged = Signal(float)
-    altitudeChanged = Signal(float)
-    airspeedChanged = Signal(float)
-    headingChanged = Signal(float)
+    # 구독 메시지 (MAVLink, 자작 FC도 같은 ID/필드 이름을 사용)
+    MSG_ATTITUDE = 30
+    MSG_GLOBAL_POSITION_INT = 33
+    MSG_VFR_HUD = 74
+    MESSAGE_IDS = (MSG_ATTITUDE, MSG_GLOBAL_POSITION_INT, MSG_VFR_HUD)
+
+    FRAME_INTERVAL_MS = 16   # 표시 주기 (약 60fps)
+    KNOTS_PER_MPS = 1.943844
+
+    # QML로 데이터를 전송하는 시그널 (모든 계기 값을 한 번에 갱신)
+    flightStateChanged = Signal()
+
+    # flightState 키: (속성 이름, 갱신 임계값)
+    # 임계값보다 작은 변화는 화면에서 1px 미만이므로 다시 그리지 않음
+    STATE_FIELDS = {
+        'pitchAngle': ('pitch_angle', 0.02),  # 도 (피치 10도 = 화면 높이의 절반)
+        'rollAngle': ('roll_angle', 0.05),    # 도
+        'altitude': ('altitude', 0.05),       # 미터
+        'airspeed': ('airspeed', 0.05),       # 노트
+        'heading': ('heading', 0.1),          # 도
+    }
 
     def __init__(self):
         super().__init__()
@@ -28,6 +50,25 @@ class PFDManager(QObject):
         self._altitude = 0.0         # 고도 (미터)
         self._airspeed = 0.0         # 대기속도 (노트)
         self._heading = 0.0          # 방위각 (도)
+        self._flight_state = {key: 0.0 for key in self.STATE_FIELDS}  # QML에 마지막으로 전달한 값
+
+        # 수신값 캐시 (속성 이름별), 표시 타이머에서 보간하여 위 값들에 반영
+        self._channels = {
+            'pitch_angle': SmoothedValue(),
+            'roll_angle': SmoothedValue(period=360.0, wrap_start=-180.0),
+            'altitude': SmoothedValue(),
+            'airspeed': SmoothedValue(),
+            'heading': SmoothedValue(period=360.0),
+        }
+        self._sample_clock = SampleClock()     # 기체 시각 → GCS 시각
+        self._has_global_position = False      # 고도는 GLOBAL_POSITION_INT를 우선 사용 (없으면 VFR_HUD)
+
+        # 표시 타이머 (수신 주기와 관계없이 일정한 주기로 화면 갱신)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setTimerType(Qt.PreciseTimer)
+        self._frame_timer.setInterval(self.FRAME_INTERVAL_MS)
+        self._frame_timer.timeout.connect(self._onFrame)
+        self._last_frame = time.monotonic()
 
         # 시뮬레이션 타이머
         self._simulation_timer = QTimer()
@@ -38,15 +79,91 @@ class PFDManager(QObject):
         self._simulation_active = False
         self._simulation_time = 0.0
 
-    @Slot(int, dict)
-    def get_data(self, message_id: int, data: dict):
+    def get_data(self, message_id: int, view):
+        """
+        SerialManager에서 구독한 메시지의 최신값이 전달되면 호출되는 슬롯
+        값은 캐시에만 저장하고, 화면 갱신은 표시 타이머에서 처리합니다.
+        """
+        now = time.monotonic()
+        if message_id == self.MSG_ATTITUDE:
+            t = self._sampleTime(view, now)
+            self._storeSample('roll_angle', math.degrees(view['roll']), math.degrees(view.get('rollspeed', 0.0)), t)
+            self._storeSample('pitch_angle', math.degrees(view['pitch']), math.degrees(view.get('pitchspeed', 0.0)), t)
+            self._storeSample('heading', math.degrees(view['yaw']) % 360.0, math.degrees(view.get('yawspeed', 0.0)), t)
+
+        elif message_id == self.MSG_GLOBAL_POSITION_INT:
+            self._has_global_position = True
+            # relative_alt: mm, vz: cm/s (아래 방향이 +)
+            self._storeSample('altitude', view['relative_alt'] / 1000.0, -view.get('vz', 0) / 100.0, self._sampleTime(view, now))
+
+        elif message_id == self.MSG_VFR_HUD:
+            # VFR_HUD에는 기체 시각이 없으므로 전달 시각 사용 (흔들림은 보간으로 완화)
+            self._storeSample('airspeed', view['airspeed'] * self.KNOTS_PER_MPS, 0.0, now)
+            if not self._has_global_position:
+                self._storeSample('altitude', view['alt'], view.get('climb', 0.0), now)
+
+    def _sampleTime(self, view, now: float) -> float:
+        boot_ms = view.get('time_boot_ms')
+        if boot_ms is None:
+            return now
+        return self._sample_clock.to_local(boot_ms / 1000.0, now)
+
+    def _storeSample(self, name: str, value: float, rate: float, t: float):
+        self._channels[name].set_sample(value, rate, t)
+        if not self._frame_timer.isActive():
+            self._last_frame = time.monotonic()
+            self._frame_timer.start()
+
+    def _onFrame(self):
+        """
+        표시 타이머: 캐시에서 현재 시각의 값을 계산하여 반영합니다.
+        """
+        now = time.monotonic()
+        dt = min(now - self._last_frame, 0.1)
+        self._last_frame = now
+        for name, channel in self._channels.items():
+            value = channel.advance(now, dt)
+            if value is not None:
+                setattr(self, name, value)
+        self._publishState()
+        if all(channel.settled(now) for channel in self._channels.values()):
+            self._frame_timer.stop()
+
+    @Slot(int, int)
+    def setActiveVehicle(self, sysid: int, compid: int):
+        """
+        표시할 기체가 바뀌면 이전 기체의 캐시를 비우는 슬롯 (SerialManager.activeVehicleChanged에 연결)
+        """
+        self._clearSamples()
+
+    def _clearSamples(self):
+        for channel in self._channels.values():
+            channel.reset()
+        self._sample_clock.reset()
+        self._has_global_position = False
+
+    @Property('QVariantMap', notify=flightStateChanged)
+    def flightState(self):
+        """
+        모든 계기 값 {pitchAngle, rollAngle, altitude, airspeed, heading}
+        """
+        return self._flight_state
+
+    def _publishState(self, force: bool = False):
         """
-        SerialManager에 메시지가 전달되면 호출되는 슬롯
+        현재 값 중 하나라도 임계값 이상 바뀌었으면 flightState를 한 번에 갱신합니다.
         """
-        # if message_id == self.current_message_id:
-        #     self.message_data = data
-        #     self.messageUpdated.emit(data)
-        pass
+        changed = force
+        for key, (name, threshold) in self.STATE_FIELDS.items():
+            diff = abs(getattr(self, name) - self._flight_state[key])
+            if key in ('rollAngle', 'heading'):
+                diff = min(diff, 360.0 - diff)
+            if diff >= threshold:
+                changed = True
+                break
+        if changed:
+            self._flight_state = {key: float(getattr(self, name)) for key, (name, _) in self.STATE_FIELDS.items()}
+            self.flightStateChanged.emit()
 
     @property
     def pitch_angle(self):
@@ -54,9 +171,7 @@ class PFDManager(QObject):
 
     @pitch_angle.setter
     def pitch_angle(self, value):
-        if self._pitch_angle != value:
-            self._pitch_angle = value
-            self.pitchAngleChanged.emit(value)
+        self._pitch_angle = value
 
     @property
     def roll_angle(self):
@@ -64,9 +179,7 @@ class PFDManager(QObject):
 
     @roll_angle.setter
     def roll_angle(self, value):
-        if self._roll_angle != value:
-            self._roll_angle = value
-            self.rollAngleChanged.emit(value)
+        self._roll_angle = value
 
     @property
     def altitude(self):
@@ -74,9 +187,7 @@ class PFDManager(QObject):
 
     @altitude.setter
     def altitude(self, value):
-        if self._altitude != value:
-            self._altitude = value
-            self.altitudeChanged.emit(value)
+        self._altitude = value
 
     @property
     def airspeed(self):
@@ -84,9 +195,7 @@ class PFDManager(QObject):
 
     @airspeed.setter
     def airspeed(self, value):
-        if self._airspeed != value:
-            self._airspeed = value
-            self.airspeedChanged.emit(value)
+        self._airspeed = value
 
     @property
     def heading(self):
@@ -94,9 +203,7 @@ class PFDManager(QObject):
 
     @heading.setter
     def heading(self, value):
-        if self._heading != value:
-            self._heading = value
-            self.headingChanged.emit(value)
+        self._heading = value
 
     def start_simulation(self):
         """시뮬레이션 시작"""
@@ -111,11 +218,13 @@ class PFDManager(QObject):
 
     def reset_display(self):
         """디스플레이 초기화"""
+        self._clearSamples()
         self.pitch_angle = 0.0
         self.roll_angle = 0.0
         self.altitude = 0.0
         self.airspeed = 0.0
         self.heading = 0.0
+        self._publishState(force=True)
         print("PFD 디스플레이 초기화")
 
     def update_flight_data(self, pitch, roll, altitude, airspeed, heading=None):
@@ -126,6 +235,7 @@ class PFDManager(QObject):
         self.airspeed = airspeed
         if heading is not None:
             self.heading = heading
+        self._publishState()
 
     def _update_simulation(self):
         """시뮬레이션 데이터 업데이트"""
@@ -150,34 +260,42 @@ class PFDManager(QObject):
         # 방위각: 0~360도 범위에서 점진적 변화
         heading = (self._simulation_time * 5) % 360
 
-        # 데이터 업데이트
-        self.update_flight_data(pitch, roll, altitude, airspeed, heading)
+        # 수신 데이터와 같이 캐시에 저장 (표시 타이머에서 보간)
+        now = time.monotonic()
+        for name, value in (('pitch_angle', pitch), ('roll_angle', roll), ('altitude', altitude),
+                            ('airspeed', airspeed), ('heading', heading)):
+            self._storeSample(name, value, 0.0, now)
 
     # QML에서 호출할 수 있는 메서드들
     @Slot(float)
     def setPitchAngle(self, angle):
         """피치 각도 설정 (QML에서 호출)"""
         self.pitch_angle = float(angle)
+        self._publishState()
 
     @Slot(float)
     def setRollAngle(self, angle):
         """롤 각도 설정 (QML에서 호출)"""
         self.roll_angle = float(angle)
+        self._publishState()
 
     @Slot(float)
     def setAltitude(self, altitude):
         """고도 설정 (QML에서 호출)"""
         self.altitude = float(altitude)
+        self._publishState()
 
     @Slot(float)
     def setAirspeed(self, airspeed):
         """대기속도 설정 (QML에서 호출)"""
         self.airspeed = float(airspeed)
+        self._publishState()
 
     @Slot(float)
     def setHeading(self, heading):
         """방위각 설정 (QML에서 호출)"""
         self.heading = float(heading)
+        self._publishState()
 
     @Slot()
     def toggleSimulation(self):
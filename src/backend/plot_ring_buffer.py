@@ -0,0 +1,120 @@
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot, Property
+
+
+class PlotRingBuffer(QObject):
+    """
+    네이티브 그래프(LinePlot)가 직접 읽는 최근 샘플 저장소
+     - x축 1개 + 필드별 y값을 미리 할당한 NumPy 배열에 보관 (추가 시 메모리 할당 없음)
+     - 배열 길이를 capacity의 2배로 잡아 같은 샘플을 i와 i + capacity에 함께 쓰므로,
+       최근 count개의 샘플이 항상 연속된 구간이 되어 복사 없이 view로 읽을 수 있음
+     - GUI 스레드에서만 쓰고, 그래프는 렌더링 동기화(GUI 스레드가 멈춘 동안)에 읽음
+    """
+
+    appended = Signal()        # 샘플이 추가됨
+    columnsChanged = Signal()  # 필드 구성이 바뀌거나 비워짐
+    capacityChanged = Signal()
+
+    MIN_CAPACITY = 200
+    MAX_CAPACITY = 1_000_000
+
+    def __init__(self, parent=None, capacity: int = 200):
+        super().__init__(parent)
+        self._names = []
+        self._capacity = capacity
+        self._allocate()
+
+    def _allocate(self):
+        self._x = np.zeros(2 * self._capacity, dtype=np.float64)
+        self._y = np.zeros((len(self._names), 2 * self._capacity), dtype=np.float64)
+        self._cursor = 0  # 다음에 쓸 위치
+        self._count = 0
+
+    def set_columns(self, names: list):
+        """
+        y축 필드 이름 목록을 설정하고 저장된 샘플을 비웁니다.
+        """
+        self._names = list(names)
+        self._allocate()
+        self.columnsChanged.emit()
+
+    @Slot()
+    def clear(self):
+        self._cursor = 0
+        self._count = 0
+        self.columnsChanged.emit()
+
+    def append(self, x: np.ndarray, values: np.ndarray):
+        """
+        샘플 묶음을 추가합니다. x: (샘플 개수,), values: (필드 개수, 샘플 개수)
+        """
+        n = len(x)
+        if n == 0:
+            return
+        # x가 되돌아가면 (FC 재부팅 등) 이전 샘플은 버림
+        if self._count and x[0] < self._x[self._cursor + self._capacity - 1]:
+            self._cursor = 0
+            self._count = 0
+        capacity = self._capacity
+        if n > capacity:
+            x = x[-capacity:]
+            values = values[:, -capacity:]
+            n = capacity
+
+        # 끝에서 잘리는 부분은 앞쪽으로 나눠서 씀
+        first = min(n, capacity - self._cursor)
+        for start, src in ((self._cursor, slice(0, first)), (0, slice(first, n))):
+            end = start + src.stop - src.start
+            if end == start:
+                continue
+            for offset in (0, capacity):
+                self._x[start + offset:end + offset] = x[src]
+                self._y[:, start + offset:end + offset] = values[:, src]
+
+        self._cursor = (self._cursor + n) % capacity
+        self._count = min(capacity, self._count + n)
+        self.appended.emit()
+
+    def column_index(self, name: str) -> int:
+        try:
+            return self._names.index(name)
+        except ValueError:
+            return -1
+
+    def x_view(self) -> np.ndarray:
+        """
+        최근 샘플의 x값 (오래된 순, 복사 없는 view)
+        """
+        end = self._cursor + self._capacity
+        return self._x[end - self._count:end]
+
+    def y_view(self, index: int) -> np.ndarray:
+        end = self._cursor + self._capacity
+        return self._y[index, end - self._count:end]
+
+    def __len__(self):
+        return self._count
+
+    @Property(list, notify=columnsChanged)
+    def names(self):
+        return list(self._names)
+
+    # QML에서 표시할 샘플 수 (그래프 가로 길이)
+    @Property(int, notify=capacityChanged)
+    def capacity(self):
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        capacity = max(self.MIN_CAPACITY, min(self.MAX_CAPACITY, int(capacity)))
+        if capacity == self._capacity:
+            return
+
+        # 최근 샘플은 유지
+        x = self.x_view().copy()
+        values = np.array([self.y_view(i) for i in range(len(self._names))]).reshape(len(self._names), len(x))
+        self._capacity = capacity
+        self._allocate()
+        self.capacityChanged.emit()
+        if len(x):
+            self.append(x, values)
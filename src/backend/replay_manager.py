@@ -0,0 +1,81 @@
+import time
+
+from .flight_recorder import TelemetryLog
+
+
+class ReplayManager:
+    """
+    기록된 로그 파일을 재생하는 클래스 (SerialManager의 연결 종류 중 하나로 사용)
+     - speed: 1.0이면 실시간, 10.0이면 10배속, 0 이하이면 대기 없이 최대 속도로 재생
+     - 재생 중에도 배속 변경, 일시정지, 탐색 가능
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self.log = TelemetryLog(path)
+        self.path = path
+        self.speed = speed
+        self.paused = False
+        self.finished = False
+        self.position = self.log.start_time  # 현재 재생 중인 로그 시각(초)
+
+        self._seek_to = None
+        self._reanchor = True
+
+    def close(self):
+        self.log.close()
+
+    @property
+    def kind(self) -> int:
+        return self.log.kind
+
+    def set_speed(self, speed: float):
+        self.speed = speed
+        self._reanchor = True
+
+    def set_paused(self, paused: bool):
+        self.paused = paused
+        self._reanchor = True
+
+    def seek(self, t: float):
+        """
+        로그 시작 기준 t초 위치로 이동합니다.
+        """
+        self._seek_to = self.log.start_time + max(0.0, t)
+
+    def run(self, stop_flag, on_record):
+        """
+        재생 메인 루프 (데이터 읽기 스레드에서 호출)
+        레코드마다 on_record(msg_id, frame)을 호출합니다.
+        """
+        log = self.log
+        i = 0
+        wall_start = log_start = 0.0
+
+        while not stop_flag.is_set():
+            if self._seek_to is not None:
+                i = log.seek(self._seek_to)
+                self._seek_to = None
+                self.finished = False
+                self._reanchor = True
+
+            if self.paused or i >= len(log):
+                self.finished = i >= len(log)
+                stop_flag.wait(0.05)
+                continue
+
+            t, msg_id, frame = log.record(i)
+
+            # 배속에 맞춰 대기 (배속/탐색/일시정지 변경 시 기준 시각을 다시 잡음)
+            if self.speed > 0:
+                if self._reanchor:
+                    wall_start, log_start = time.monotonic(), t
+                    self._reanchor = False
+                delay = wall_start + (t - log_start) / self.speed - time.monotonic()
+                if delay > 0 and stop_flag.wait(min(delay, 0.05)):
+                    break
+                if delay > 0.05:
+                    continue
+
+            self.position = t
+            on_record(msg_id, frame)
+            i += 1
@@ -1,43 +1,123 @@
-from PySide6.QtCore import QObject, Signal, Slot
-from .MiniLink.lib.xmlHandler import XmlHandler
+import numpy as np
+from PySide6.QtCore import QObject, Signal, Slot, Property
+from .graph_stream_server import batch_to_columns
+from .minmax_pyramid import MinMaxPyramid
+from .plot_ring_buffer import PlotRingBuffer
 
 
 class SensorGraphManager(QObject):
-    messageUpdated = Signal(dict)  # 메시지 업데이트 시그널
+    messageUpdated = Signal(dict)       # 메시지 업데이트 시그널 (최신값)
 
-    def __init__(self):
+    STREAM_CHANNEL = "sensorGraph"  # 그래프 WebView로 바이너리 데이터를 보내는 채널
+    TIME_FIELDS = ('time_boot_ms', 'time_usec')  # 그래프 x축으로 사용할 타임스탬프 필드
+
+    def __init__(self, serial_manager, graph_stream=None):
         super().__init__()
+        self.serial_manager = serial_manager
+        self.graph_stream = graph_stream
         self.current_message_id = None
+        self.current_fields = []  # 선택한 메시지에서 QML로 넘길 필드 이름 목록
+        self.plot_fields = []     # 그래프로 보낼 숫자 필드 이름 목록
         self.message_data = {}
 
-        self.xmlHandler = XmlHandler()
-        self.xmlHandler.loadMessageListFromXML({})
+        # 확대/이동용 전체 수신 기록 (x축을 제외한 필드별 최소/최대 피라미드)
+        self.stream_columns = []  # 그래프로 보내는 열 이름 (타임스탬프 필드가 없으면 맨 앞에 'timestamp' 추가)
+        self.x_index = 0          # stream_columns에서 x축 열의 위치
+        self.history = MinMaxPyramid(0)
+        self._synthetic_x = False  # 타임스탬프 필드가 없어 수신 순번을 x축으로 쓰는지
+        self._sample_count = 0     # 타임스탬프 필드가 없는 메시지의 x축 (수신 순번)
+
+        # 네이티브 그래프(LinePlot)가 직접 읽는 최근 샘플
+        self.plot_buffer = PlotRingBuffer(self)
+
+        if self.graph_stream is not None:
+            self.graph_stream.set_range_handler(self.STREAM_CHANNEL, self.query_history)
+
+        # 표시 기체가 바뀌면 이전 기체의 기록은 버림
+        self.serial_manager.activeVehicleChanged.connect(self.reset_history)
+
+    @Slot(int, list)
+    def get_batch(self, message_id: int, batch: list):
+        """
+        SerialManager에서 구독한 메시지의 한 프레임 동안 모인 묶음이 전달되면 호출되는 슬롯
+        표에는 최신값만 dict로 보내고, 그래프에는 전체 샘플을 열 단위 바이너리로 보냅니다.
+        """
+        self.message_data = batch[-1].to_dict(self.current_fields)
+        self.messageUpdated.emit(self.message_data)
+
+        columns = batch_to_columns(batch, self.plot_fields)
+        if self._synthetic_x:
+            x = np.arange(self._sample_count, self._sample_count + len(batch), dtype=np.float64)
+            self._sample_count += len(batch)
+            columns = np.vstack([x, columns])
+        x = columns[self.x_index]
+
+        # 타임스탬프가 되돌아가면 (FC 재부팅 등) 기록을 새로 시작
+        if len(self.history) and x[0] < self.history.x_range()[1]:
+            self.history.clear()
+        values = np.delete(columns, self.x_index, axis=0)
+        self.history.append(x, values)
+        self.plot_buffer.append(x, values)
+
+        if self.graph_stream is not None and self.graph_stream.has_subscribers(self.STREAM_CHANNEL):
+            self.graph_stream.publish(self.STREAM_CHANNEL, columns)
 
-    @Slot(int, dict)
-    def get_data(self, message_id: int, data: dict):
+    def query_history(self, x0: float, x1: float, points: int) -> np.ndarray:
         """
-        SerialManager에 메시지가 전달되면 호출되는 슬롯
+        [x0, x1] 구간의 기록을 points개 안팎의 점으로 줄여 stream_columns 순서의 열 배열로 반환합니다.
         """
-        if message_id == self.current_message_id:
-            self.message_data = data
-            self.messageUpdated.emit(data)
+        x, values = self.history.query(x0, x1, points)
+        return np.insert(values.astype(np.float64), self.x_index, x, axis=0)
+
+    @Slot()
+    def reset_history(self):
+        self.history.clear()
+        self.plot_buffer.clear()
+        self._sample_count = 0
+
+    # QML의 LinePlot에 연결할 샘플 버퍼
+    @Property(QObject, constant=True)
+    def plotBuffer(self):
+        return self.plot_buffer
+
+    @Slot(result=str)
+    def getStreamUrl(self):
+        """
+        그래프 WebView가 접속할 WebSocket 주소를 반환합니다.
+        """
+        return self.graph_stream.url() if self.graph_stream is not None else ""
+
+    @Slot(result=str)
+    def getStreamChannel(self):
+        return self.STREAM_CHANNEL
 
     @Slot(int, result=dict)
     def setTargetMessage(self, message_id: int):
+        # 이전 메시지 구독을 해제하고 선택한 메시지만 구독
+        self.serial_manager.unsubscribe(self.get_batch)
+        self.serial_manager.subscribe([message_id], self.get_batch, history=True)
         self.current_message_id = message_id
 
-        # 해당 메시지의 모든 속성을 가져와서 QML에 전달
-        instance = self.xmlHandler.getMessageInstance(message_id)
-        fields = [field.attrib for field in instance.findall("field")]
-        for field in fields:
-            field['plot'] = True  # QML에서 플롯팅 여부
-            if 'units' not in field:
-                field['units'] = ''
-
-        meta_data = {
-            'id': message_id,
-            'name': instance.get("name"),
-            'description': instance.find("description").text,
-            'fields': fields
-        }
+        # 해당 메시지의 모든 속성을 가져와서 QML에 전달 (필드마다 plot: QML에서 플롯팅 여부)
+        schema = self.serial_manager.schemas[message_id]
+        meta_data = schema.meta_data()
+        self.current_fields = list(schema.names)
+        self.plot_fields = list(schema.numeric_names)
+
+        # 타임스탬프 필드를 x축으로, 없으면 수신 순번을 'timestamp' 열로 추가
+        time_field = next((name for name in self.plot_fields if name in self.TIME_FIELDS), None)
+        self._synthetic_x = time_field is None
+        if self._synthetic_x:
+            self.stream_columns = ['timestamp'] + self.plot_fields
+            self.x_index = 0
+        else:
+            self.stream_columns = list(self.plot_fields)
+            self.x_index = self.plot_fields.index(time_field)
+        self.history = MinMaxPyramid(len(self.stream_columns) - 1)
+        self.plot_buffer.set_columns([name for i, name in enumerate(self.stream_columns) if i != self.x_index])
+        self._sample_count = 0
+
+        if self.graph_stream is not None:
+            self.graph_stream.set_columns(self.STREAM_CHANNEL, self.stream_columns)
+
         return meta_data
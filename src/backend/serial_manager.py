@@ -3,18 +3,33 @@ import struct
 import threading
 import serial.tools.list_ports
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, Signal, Slot, Property
 from pymavlink import mavutil
 
 from .MiniLink.MiniLink import MiniLink
+from .telemetry_dispatcher import TelemetryDispatcher
+from .message_view import MavlinkMessageView, MiniLinkMessageView
+from .message_stats import MessageStats
+from .minilink_poll_scheduler import MiniLinkPollScheduler
+from .serial_port_waiter import SerialPortWaiter
+from .flight_recorder import FlightRecorder, KIND_MAVLINK, KIND_MINILINK, MINILINK_HEADER, decode_minilink_frame, mavlink_frame_source
+from .replay_manager import ReplayManager
+from .transport import TransportLoop, FrameDeduplicator
+from .vehicle_registry import VehicleRegistry
+from .message_schema import message_catalog
 
 
 class SerialManager(QObject):
     """
     시리얼/UDP 연결 관리 클래스
+     - PX4(MAVLink) 링크는 TransportLoop에서 여러 개를 동시에 처리 (시리얼/UDP/TCP)
+     - 자작 FC(MiniLink)와 로그 재생은 전용 데이터 읽기 스레드에서 처리
+     - MAVLink 메시지는 송신 기체(sysid, compid)별로 구분하며, 구독자에게는 선택된 기체의 메시지만 전달
     """
 
-    messageUpdated = Signal(int, dict)  # 메시지 업데이트 시그널
+    vehiclesChanged = Signal()              # 기체 목록 변경 시그널
+    activeVehicleChanged = Signal(int, int)  # 선택된 기체 변경 시그널 (sysid, compid)
+    recordingChanged = Signal()             # 비행 기록 시작/종료/오류 시그널
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -27,18 +42,46 @@ class SerialManager(QObject):
         self.udp_ip = None
         self.udp_port = None
 
+        # 로그 재생 정보
+        self.replay = None
+
         # 자작 FC용 MiniLink 객체 및 데이터 저장
         self.minilink = MiniLink()
 
-        # PX4용 MAVLink 객체
-        self.mavlink = None
+        # 메시지 정의 (msg_id별 필드 이름/인덱스/단위, 프로세스 전체에서 공유)
+        # XML은 시작 시 읽지 않고, 캐시에 없는 정의를 처음 조회할 때 한 번만 읽음
+        self.schemas = message_catalog()
+
+        # 자작 FC 메시지 요청 스케줄러 (구독 중인 메시지 우선)
+        self.poll_scheduler = MiniLinkPollScheduler()
+        self.poll_rates = {}  # 구독 시 지정한 msg_id별 목표 요청 주기(Hz)
+
+        # 자작 FC 수신 대기 (busy-wait 방지)
+        self.port_waiter = None
+
+        # PX4용 MAVLink 링크 (시리얼/UDP/TCP 여러 개를 하나의 asyncio 스레드에서 처리)
+        self.transport = TransportLoop()
+        self.serial_link_id = None     # connectSerial로 연결한 PX4 링크
+        self.udp_link_id = None        # connectUDP로 연결한 PX4 링크
+        self._heartbeat_events = {}    # link_id: 연결 확인용 HEARTBEAT 수신 이벤트
+        self._dedup = FrameDeduplicator()  # 여러 링크로 들어온 같은 프레임 제거
+
+        # 기체별 상태 저장소 (sysid, compid)
+        self.vehicles = VehicleRegistry()
 
         # 데이터 읽기 전용 스레드 관리
         self.data_reading_thread = None
         self.data_reading_thread_stop_flag = threading.Event()
+        self._minilink_connected = False  # 자작 FC 시리얼 포트가 열려 있는지 (읽기 스레드가 끝나도 포트는 열려 있을 수 있음)
+
+        # 메시지 통계 추적 (msg_id별 Hz, 지터, 최대 간격 / 송신자별 누락 패킷)
+        self.message_stats = MessageStats()
 
-        # 메시지 통계 추적 (msg_id: {'count': int, 'start_time': float})
-        self.message_stats = {}
+        # 수신 프레임 기록기 (디스크 쓰기는 전용 스레드에서 처리)
+        self.recorder = FlightRecorder(on_error=lambda error: self.recordingChanged.emit())
+
+        # 수신 메시지를 프레임 단위로 모아 구독자에게 전달
+        self.dispatcher = TelemetryDispatcher(rate_hz=60, parent=self)
 
     @Slot(result=list)
     def getPortList(self):
@@ -67,13 +110,18 @@ class SerialManager(QObject):
         if self.port is not None or self.baudrate is not None:
             print("이미 연결된 포트가 있습니다.")
             return False
+        if not is_px4 and self.transport.links:
+            # is_px4는 연결 전체에 하나이므로 PX4 링크와 자작 FC를 동시에 사용할 수 없음
+            print("PX4 링크가 연결되어 있어 자작 FC를 연결할 수 없습니다.")
+            return False
 
         try:
             # 센서 연결
             if is_px4:
-                self._connectSerialPX4(device, baudrate)
+                self.serial_link_id = self._connectLinkPX4(f"serial:{device}:{baudrate}", serial.SerialException)
             else:
                 self._connectSerialFC(device, baudrate)
+                self._minilink_connected = True
             print(f"{device}에 성공적으로 연결되었습니다.")
 
             # 연결된 포트와 보드레이트 저장
@@ -81,13 +129,11 @@ class SerialManager(QObject):
             self.port = device
             self.baudrate = baudrate
 
-            # 데이터 읽기 스레드 시작
-            self.data_reading_thread_stop_flag = threading.Event()
-            if is_px4:
-                self.data_reading_thread = threading.Thread(target=self._getSensorDataPX4, daemon=True)
-            else:
+            # 자작 FC는 데이터 읽기 스레드 시작 (PX4는 TransportLoop에서 수신)
+            if not is_px4:
+                self.data_reading_thread_stop_flag = threading.Event()
                 self.data_reading_thread = threading.Thread(target=self._getSensorDataFC, daemon=True)
-            self.data_reading_thread.start()
+                self.data_reading_thread.start()
 
             return True
         except serial.SerialException as e:
@@ -105,24 +151,87 @@ class SerialManager(QObject):
         PX4 UDP 연결 설정
         """
 
+        if self.udp_ip is not None:
+            print("이미 연결된 UDP 포트가 있습니다.")
+            return False
+        if self._minilink_connected:
+            print("자작 FC가 연결되어 있어 PX4 UDP를 연결할 수 없습니다.")
+            return False
+
         try:
-            self._connectUDPPX4(ip, port)
+            self.udp_link_id = self._connectLinkPX4(f"udpin:{ip}:{port}", ConnectionError)
             print(f"PX4 UDP {ip}:{port}에 성공적으로 연결되었습니다.")
 
             # 연결된 IP와 포트 저장
+            self.is_px4 = True
             self.udp_ip = ip
             self.udp_port = port
-
-            # 데이터 읽기 스레드 시작
-            self.data_reading_thread_stop_flag = threading.Event()
-            self.data_reading_thread = threading.Thread(target=self._getSensorDataPX4, daemon=True)
-            self.data_reading_thread.start()
             return True
         except Exception as e:
             error_msg = f"UDP 연결 실패: {str(e)}"
             print(error_msg)
             self.udp_ip = None
             self.udp_port = None
+            return False
+
+    @Slot(str, result=str)
+    def connectLink(self, url: str):
+        """
+        PX4 MAVLink 링크를 추가로 연결하고 link_id를 반환합니다. 실패하면 빈 문자열
+        (예: serial:/dev/ttyUSB0:57600, udpin:0.0.0.0:14550, tcp:127.0.0.1:5760)
+        여러 링크를 동시에 연결하면 같은 패킷은 한 번만 처리합니다.
+        """
+
+        if self._minilink_connected:
+            print("자작 FC가 연결되어 있어 PX4 링크를 연결할 수 없습니다.")
+            return ""
+        try:
+            link_id = self._connectLinkPX4(url, ConnectionError)
+            self.is_px4 = True
+            print(f"PX4 링크 {url}에 성공적으로 연결되었습니다.")
+            return link_id
+        except Exception as e:
+            print(f"링크 연결 실패: {str(e)}")
+            return ""
+
+    @Slot(str, result=bool)
+    def disconnectLink(self, link_id: str):
+        """
+        connectLink로 연결한 링크를 해제합니다.
+        """
+
+        if link_id not in self.transport.links:
+            return False
+        self.transport.close_link(link_id)
+        if link_id == self.serial_link_id:
+            self.serial_link_id = None
+            self.port = None
+            self.baudrate = None
+        if link_id == self.udp_link_id:
+            self.udp_link_id = None
+            self.udp_ip = None
+            self.udp_port = None
+        self._resetIfDisconnected()
+        print(f"PX4 링크 {link_id} 연결이 해제되었습니다.")
+        return True
+
+    @Slot(result=list)
+    def getLinks(self):
+        """
+        연결된 PX4 링크 목록과 링크별 수신 통계를 반환합니다.
+        """
+
+        links = []
+        for link_id, link in list(self.transport.links.items()):
+            links.append({
+                'id': link_id,
+                'url': link.url,
+                'bytes_rx': link.stats.bytes_rx,
+                'bytes_tx': link.stats.bytes_tx,
+                'packets_rx': link.stats.packets_rx,
+                'parse_errors': link.stats.parse_errors,
+            })
+        return links
 
     def _connectSerialFC(self, port: str, baudrate: int):
         """
@@ -131,6 +240,7 @@ class SerialManager(QObject):
         """
 
         self.minilink.connect(port, baudrate)
+        self.port_waiter = SerialPortWaiter.from_minilink(self.minilink)
 
         # 연결 확인 코드
         # self.minilink.connect() 내부의 serial.Serial()은 시리얼 포트를 여는 코드일 뿐, 실제로 연결됐는지를 보장하지 않음
@@ -145,34 +255,105 @@ class SerialManager(QObject):
             if time.time() - start_time > 2:  # 2초 동안 데이터가 없으면 연결 실패로 간주
                 print("연결 실패")
                 raise serial.SerialException("연결 실패: 데이터 수신 대기 시간 초과")
+            self._waitMiniLinkData(0.05)
 
-    def _connectSerialPX4(self, port: str, baudrate: int):
+    def _waitMiniLinkData(self, timeout: float):
         """
-        PX4와 MAVLink로 연결을 시도합니다.
-        예외가 발생하면 상위 클래스에서 처리하도록 합니다.
+        자작 FC에서 수신 데이터가 생기거나 timeout(초)이 지날 때까지 대기합니다.
+        포트를 받지 못한 경우에는 수신을 알 수 없으므로 1ms만 쉬고 다시 읽도록 합니다.
+        (timeout만큼 잠들면 응답마다 최대 timeout의 지연이 생기고 처리량이 떨어짐)
         """
+        if self.port_waiter is None:
+            time.sleep(min(timeout, 0.001))
+            return
+        self.port_waiter.wait(timeout)
 
-        self.mavlink = mavutil.mavlink_connection(port, baud=baudrate)
+    def _connectLinkPX4(self, url: str, error_type=ConnectionError) -> str:
+        """
+        PX4와 MAVLink 링크 연결을 시도하고 link_id를 반환합니다.
+        2초 동안 HEARTBEAT를 받지 못하면 링크를 닫고 error_type 예외를 발생시킵니다.
+        """
+
+        link_id = url
+        if link_id in self.transport.links:
+            raise error_type(f"이미 연결된 링크입니다: {url}")
+
+        heartbeat = threading.Event()
+        self._heartbeat_events[link_id] = heartbeat
+        try:
+            self.transport.open_link(link_id, url, self._onMavlinkMessage, self._onLinkClosed)
+
+            # 연결 확인 코드
+            if not heartbeat.wait(timeout=2):
+                self.transport.close_link(link_id)
+                raise error_type("PX4 연결 실패: HEARTBEAT 수신 대기 시간 초과")
+        finally:
+            self._heartbeat_events.pop(link_id, None)
 
-        # 연결 확인 코드
-        heartbeat = self.mavlink.wait_heartbeat(timeout=2)
-        if not heartbeat:
-            raise serial.SerialException("PX4 연결 실패: HEARTBEAT 수신 대기 시간 초과")
         print("PX4 HEARTBEAT 수신 성공")
+        return link_id
 
-    def _connectUDPPX4(self, ip: str, port: int):
+    def _onMavlinkMessage(self, link, msg):
         """
-        PX4와 MAVLink로 UDP 연결을 시도합니다.
-        예외가 발생하면 상위 클래스에서 처리하도록 합니다.
+        PX4 링크에서 메시지를 디코딩할 때마다 호출됩니다. (TransportLoop 스레드)
         """
 
-        self.mavlink = mavutil.mavlink_connection(f'udpin:{ip}:{port}')
+        msg_id = msg.get_msgId()
+        if msg_id == 0 and link.link_id in self._heartbeat_events:
+            self._heartbeat_events[link.link_id].set()
 
-        # 연결 확인 코드
-        heartbeat = self.mavlink.wait_heartbeat(timeout=2)
-        if not heartbeat:
-            raise ConnectionError("PX4 UDP 연결 실패: HEARTBEAT 수신 대기 시간 초과")
-        print("PX4 UDP HEARTBEAT 수신 성공")
+        # 누락 패킷 통계는 링크별 seq로 추적 (링크마다 seq가 따로 증가하므로 중복 제거 전에 기록)
+        source = (msg.get_srcSystem(), msg.get_srcComponent())
+        self._update_message_stats(None, msg.get_seq(), source, link.link_id)
+
+        # 여러 링크로 같은 프레임이 들어오면 처음 것만 처리 (프레임 내용으로 비교)
+        if len(self.transport.links) > 1 and self._dedup.is_duplicate(
+                link.link_id, source, msg_id, msg.get_payload(), time.monotonic()):
+            return
+
+        # 메시지 통계 업데이트
+        self._update_message_stats(msg_id)
+
+        # 비행 기록 (tlog)
+        if self.recorder.is_recording():
+            self.recorder.record(msg_id, msg.get_msgbuf())
+
+        self._routeMavlinkMessage(msg_id, msg, source)
+
+    def _routeMavlinkMessage(self, msg_id: int, msg, source: tuple):
+        """
+        MAVLink 메시지를 송신 기체의 상태 저장소에 반영하고 구독자에게 전달합니다. (데이터 읽기 스레드)
+        """
+
+        vehicle, added = self.vehicles.update(source, msg_id, msg)
+        if added:
+            print(f"새 기체 감지: sysid={vehicle.sysid}, compid={vehicle.compid}")
+            if self.vehicles.active == vehicle.key and self.dispatcher.active_source() is None:
+                self.dispatcher.set_active_source(vehicle.key)
+                self.activeVehicleChanged.emit(vehicle.sysid, vehicle.compid)
+            self.vehiclesChanged.emit()
+
+        # 구독자가 있는 메시지만 뷰로 감싸서 전달 (to_dict() 생략, 선택되지 않은 기체는 dispatcher에서 걸러냄)
+        if self.dispatcher.is_subscribed(msg_id):
+            self.dispatcher.push(msg_id, MavlinkMessageView(msg), source)
+
+    def _onLinkClosed(self, link):
+        """
+        PX4 링크 연결이 끊겼을 때 호출됩니다. (TransportLoop 스레드)
+        """
+
+        print("[Data Reading Thread] 연결 끊김 감지!")
+        if link.link_id == self.serial_link_id:
+            self.serial_link_id = None
+            self.port = None
+            self.baudrate = None
+        if link.link_id == self.udp_link_id:
+            self.udp_link_id = None
+            self.udp_ip = None
+            self.udp_port = None
+
+        # 남은 연결이 없으면 통계와 기체 목록 초기화
+        self._resetIfDisconnected()
 
     def _getSensorDataFC(self):
         """
@@ -180,88 +361,248 @@ class SerialManager(QObject):
         """
 
         try:
-            message_list = self.getMessageList()
-            message_id_list = [msg['id'] for msg in message_list]
-            message_frame = {msg['id']: msg['fields'] for msg in message_list}
-
-            current_message_idx = 0
-            msg_id = message_id_list[current_message_idx]
-            self.minilink.chooseMessage(msg_id)
+            message_id_list = [msg['id'] for msg in self.getMessageList()]
+            schemas = self.schemas
+            schemas.preload(message_id_list)  # 수신 루프에서 정의를 만들거나 캐시를 쓰지 않도록 미리 준비
+
+            # 구독 중인 메시지는 목표 주기로, 나머지는 여유가 있을 때만 요청
+            scheduler = self.poll_scheduler
+            reply_sizes = {}
+            for msg_id in message_id_list:
+                schema = schemas.get(msg_id)
+                if schema is not None:
+                    reply_sizes[msg_id] = len(schema.names)
+            scheduler.reset(message_id_list, reply_sizes)
             while not self.data_reading_thread_stop_flag.is_set():
-                data: list = self.minilink.read(enPrint=False, enLog=False)
-                if data:
-                    # 데이터 맵핑
-                    msg = {}
-                    for key, value in zip(message_frame[msg_id], data):
-                        msg[key] = value
-
-                    # 메시지 통계 업데이트
-                    self._update_message_stats(msg_id)
+                # 응답 대기 큐가 찰 때까지 요청을 보냄
+                now = time.monotonic()
+                scheduler.expire(now)
+                msg_id = scheduler.next_request(now)
+                while msg_id is not None:
+                    self.minilink.chooseMessage(msg_id)
+                    scheduler.on_request(msg_id, now)
+                    msg_id = scheduler.next_request(now)
 
-                    self.messageUpdated.emit(msg_id, msg)
+                # 처리가 밀려 수신 버퍼가 너무 커지면 비우고 응답 대기도 초기화
+                if self.port_waiter is not None and self.port_waiter.trim_backlog():
+                    scheduler.clear_in_flight(time.monotonic())
+                    continue
 
-                    # 다음 메시지 선택
-                    current_message_idx = (current_message_idx + 1) % len(message_id_list)
-                    msg_id = message_id_list[current_message_idx]
-                    self.minilink.chooseMessage(msg_id)
+                data: list = self.minilink.read(enPrint=False, enLog=False)
+                if not data:
+                    # 수신 데이터가 없으면 다음 요청 시점까지만 대기 (정지 요청 확인을 위해 최대 50ms)
+                    self._waitMiniLinkData(min(scheduler.time_until_next(time.monotonic()), 0.05))
+                    continue
+
+                # 응답에는 msg_id가 없으므로 값 개수로 짝 맞추기
+                # (스케줄러는 값 개수가 같은 요청을 동시에 보내지 않으므로 짝이 하나로 정해짐)
+                msg_id = scheduler.on_reply(len(data), time.monotonic())
+                if msg_id is None:
+                    continue
+                schema = schemas.get(msg_id)
+
+                # 메시지 통계 업데이트
+                self._update_message_stats(msg_id)
+
+                # 비행 기록
+                if self.recorder.is_recording():
+                    self.recorder.record(msg_id, data)
+
+                # 구독자가 있는 메시지만 뷰로 감싸서 전달 (dict 맵핑 생략)
+                if self.dispatcher.is_subscribed(msg_id):
+                    self.dispatcher.push(msg_id, MiniLinkMessageView(schema.index, data))
         except Exception as e:
             print("[Data Reading Thread] 연결 끊김 감지!")
             self.port = None
             self.baudrate = None
             return
 
-    def _getSensorDataPX4(self):
+    def _getSensorDataReplay(self):
         """
-        PX4와 MAVLink로 연결한 센서 데이터를 지속적으로 읽는 메인 루프
+        기록된 로그를 재생하는 메인 루프
+        실제 연결과 같은 경로(통계, 구독 전달)로 메시지를 내보냅니다.
         """
 
         try:
-            while not self.data_reading_thread_stop_flag.is_set():
-                msg = self.mavlink.recv_match(blocking=True, timeout=1)
-                if msg:
-                    msg_id = msg.get_msgId()
-                    msg_dict = msg.to_dict()
+            if self.replay.kind == KIND_MAVLINK:
+                decoder = mavutil.mavlink.MAVLink(None)
+                decoder.robust_parsing = True
 
-                    # 메시지 통계 업데이트
+                def on_record(msg_id, frame):
                     self._update_message_stats(msg_id)
+                    # 구독자가 있는 메시지와 기체 등록용 HEARTBEAT만 디코딩
+                    if msg_id == 0 or self.dispatcher.is_subscribed(msg_id):
+                        msg = decoder.decode(bytearray(frame))
+                        self._routeMavlinkMessage(msg_id, msg, mavlink_frame_source(frame))
+            else:
+                schemas = self.schemas
 
-                    self.messageUpdated.emit(msg_id, msg_dict)
+                def on_record(msg_id, frame):
+                    self._update_message_stats(msg_id)
+                    if self.dispatcher.is_subscribed(msg_id):
+                        schema = schemas.get(msg_id)
+                        if schema is None:
+                            return
+                        # 값 개수가 정의와 같으면 미리 만든 struct로 한 번에 읽음
+                        if len(frame) == MINILINK_HEADER.size + schema.values_struct.size:
+                            values = schema.values_struct.unpack_from(frame, MINILINK_HEADER.size)
+                        else:
+                            _, values = decode_minilink_frame(frame)
+                        self.dispatcher.push(msg_id, MiniLinkMessageView(schema.index, values))
+
+            self.replay.run(self.data_reading_thread_stop_flag, on_record)
         except Exception as e:
-            print("[Data Reading Thread] 연결 끊김 감지!")
-            self.port = None
-            self.baudrate = None
+            print(f"[Data Reading Thread] 로그 재생 중 오류: {str(e)}")
             return
 
-    def _update_message_stats(self, msg_id: int):
+    def _update_message_stats(self, msg_id: int, seq: int = None, source: tuple = None, link_id: str = None):
         """
-        메시지 통계 업데이트 (count, start_time)
+        메시지 통계 업데이트 (수신 시각, 링크별 MAVLink 시퀀스 번호)
+        msg_id가 None이면 시퀀스 번호만 기록합니다.
         """
-        current_time = time.time()
-
-        if msg_id not in self.message_stats:
-            self.message_stats[msg_id] = {
-                'count': 0,
-                'start_time': current_time
-            }
-
-        self.message_stats[msg_id]['count'] += 1
+        self.message_stats.update(msg_id, seq, source, link_id)
 
     @Slot(int, result=float)
     def getMessageHz(self, msg_id: int):
         """
-        특정 메시지의 Hz(주파수)를 계산하여 반환
+        특정 메시지의 최근 수신 주기(Hz)를 반환
         """
-        if msg_id not in self.message_stats:
-            return 0.0
+        return self.message_stats.hz(msg_id)
 
-        stats = self.message_stats[msg_id]
-        elapsed_time = time.time() - stats['start_time']
+    @Slot(result=dict)
+    def getMessageStats(self):
+        """
+        메시지별 통계 스냅샷을 반환합니다.
+        {msg_id(str): {'hz', 'jitter', 'max_gap', 'count'}}, 시간 단위는 초
+        """
+        return {str(msg_id): stats for msg_id, stats in self.message_stats.snapshot().items()}
 
-        if elapsed_time <= 0:
-            return 0.0
+    @Slot(result=list)
+    def getLinkStats(self):
+        """
+        링크별 MAVLink 송신자(sysid, compid)의 수신/누락 패킷 통계를 반환합니다.
+        """
+        return self.message_stats.link_snapshot()
+
+    def subscribe(self, msg_ids, callback, history: bool = False, rate_hz: float = None, all_vehicles: bool = False):
+        """
+        msg_ids에 해당하는 메시지를 구독합니다.
+         - history=False: 프레임마다 최신값 1개를 callback(msg_id, view)로 전달
+         - history=True: 프레임마다 수신한 전체 샘플을 callback(msg_id, [view, ...])로 전달
+         - all_vehicles=True: 선택되지 않은 기체의 메시지도 기체별로 전달 (view.source로 구분)
+        전달되는 값은 MessageView이므로, 필요한 필드만 읽거나 to_dict(fields)로 변환해서 사용합니다.
+        rate_hz는 자작 FC에서 해당 메시지를 요청할 목표 주기이며, 없으면 스케줄러 기본값을 사용합니다.
+        """
+        if rate_hz is not None:
+            for msg_id in msg_ids:
+                self.poll_rates[msg_id] = max(rate_hz, self.poll_rates.get(msg_id, 0))
+        self.dispatcher.subscribe(msg_ids, callback, history, all_vehicles)
+        self._update_poll_priority()
+
+    def unsubscribe(self, callback, msg_ids=None):
+        """
+        구독을 해제합니다. msg_ids가 없으면 callback의 모든 구독을 해제합니다.
+        """
+        self.dispatcher.unsubscribe(callback, msg_ids)
+        self._update_poll_priority()
+
+    def _update_poll_priority(self):
+        """
+        구독 중인 메시지를 자작 FC 요청 스케줄러의 우선순위 목록에 반영합니다.
+        """
+        self.poll_scheduler.set_priority({
+            msg_id: self.poll_rates.get(msg_id) for msg_id in self.dispatcher.subscribed_ids()
+        })
 
-        hz = stats['count'] / elapsed_time
-        return hz
+    @Slot(result=list)
+    def getVehicleList(self):
+        """
+        감지된 기체 목록을 반환합니다.
+        [{'sysid', 'compid', 'type', 'autopilot', 'age', 'message_count', 'active'}, ...]
+        """
+        return self.vehicles.snapshot()
+
+    @Slot(result=list)
+    def getActiveVehicle(self):
+        """
+        선택된 기체 [sysid, compid]를 반환합니다. 없으면 빈 목록
+        """
+        return list(self.vehicles.active) if self.vehicles.active is not None else []
+
+    @Slot(int, int, result=bool)
+    def setActiveVehicle(self, sysid: int, compid: int):
+        """
+        화면에 표시할 기체를 선택합니다.
+        선택한 기체의 마지막 메시지를 바로 전달하여 다음 수신을 기다리지 않고 화면을 갱신합니다.
+        """
+        key = (sysid, compid)
+        if not self.vehicles.set_active(key):
+            return False
+
+        self.dispatcher.set_active_source(key)
+        vehicle = self.vehicles.get(key)
+        for msg_id, msg in list(vehicle.latest.items()):
+            if self.dispatcher.is_subscribed(msg_id):
+                self.dispatcher.push(msg_id, MavlinkMessageView(msg), key)
+
+        self.activeVehicleChanged.emit(sysid, compid)
+        return True
+
+    @Slot(str, result=str)
+    def startRecording(self, path: str = ""):
+        """
+        수신 데이터 기록을 시작하고 로그 파일 경로를 반환합니다.
+        경로가 비어 있으면 logs/ 아래에 현재 시각으로 생성합니다.
+        """
+        try:
+            kind = KIND_MAVLINK if self.is_px4 or self.udp_ip is not None else KIND_MINILINK
+            path = self.recorder.start(kind, path or None)
+            print(f"비행 기록 시작: {path}")
+            self.recordingChanged.emit()
+            return path
+        except Exception as e:
+            print(f"비행 기록 시작 실패: {str(e)}")
+            self.recorder.error = str(e)
+            self.recordingChanged.emit()
+            return ""
+
+    @Slot()
+    def stopRecording(self):
+        """
+        수신 데이터 기록을 종료합니다. (쓰기 오류로 먼저 멈춘 기록도 정리)
+        """
+        was_recording = self.recorder.is_recording()
+        self.recorder.stop()
+        if was_recording:
+            print(f"비행 기록 종료: {self.recorder.path} ({self.recorder.record_count}개)")
+            self.recordingChanged.emit()
+
+    @Slot(result=bool)
+    def isRecording(self):
+        return self.recorder.is_recording()
+
+    # 비행 기록 중인지 (QML 기록 버튼)
+    @Property(bool, notify=recordingChanged)
+    def recording(self):
+        return self.recorder.is_recording()
+
+    # 비행 기록 상태 문구 (기록 중인 파일 경로 또는 오류)
+    @Property(str, notify=recordingChanged)
+    def recordingStatus(self):
+        if self.recorder.error:
+            return f"기록 오류: {self.recorder.error}"
+        if self.recorder.is_recording():
+            return f"기록 중: {self.recorder.path}"
+        if self.recorder.path:
+            return f"기록 저장됨: {self.recorder.path} ({self.recorder.record_count}개)"
+        return ""
+
+    @Slot(float)
+    def setDispatchRate(self, rate_hz: float):
+        """
+        수신 메시지를 GUI로 전달하는 주기(Hz)를 설정합니다.
+        """
+        self.dispatcher.setRate(rate_hz)
 
     @Slot(result=bool)
     def disconnectSerial(self):
@@ -269,26 +610,32 @@ class SerialManager(QObject):
         시리얼 연결 해제 슬롯
         """
 
-        # 스레드 종료를 위한 이벤트 설정
-        self.data_reading_thread_stop_flag.set()
+        # serial_link_id는 링크가 끊기면 None이 되므로 실제로 열려 있는 연결 종류로 구분
+        if self._minilink_connected:
+            # 스레드 종료를 위한 이벤트 설정
+            self.data_reading_thread_stop_flag.set()
 
-        # 스레드 종료 대기
-        self.data_reading_thread.join()
+            # 스레드 종료 대기 (연결이 끊겨 이미 끝났을 수 있음)
+            if self.data_reading_thread is not None:
+                self.data_reading_thread.join()
+                self.data_reading_thread = None
 
-        # 시리얼 연결 해제
-        if self.is_px4:
-            self.mavlink.close()
-        else:
+            # 자작 FC 시리얼 연결 해제
             res = self.minilink.disconnect()
+            self.port_waiter = None
+            self._minilink_connected = False
             if not res:
                 print("시리얼 연결 해제에 실패했습니다.")
                 return False
+        elif self.serial_link_id is not None:
+            # PX4 시리얼 링크 해제
+            self.transport.close_link(self.serial_link_id)
+            self.serial_link_id = None
 
-        self.mavlink = None
         self.port = None
         self.baudrate = None
-        self.message_stats = {}  # 통계 초기화
-        print("PX4 시리얼 연결이 해제되었습니다.")
+        self._resetIfDisconnected()
+        print("시리얼 연결이 해제되었습니다.")
         return True
 
     @Slot(result=bool)
@@ -297,21 +644,119 @@ class SerialManager(QObject):
         UDP 연결 해제 슬롯
         """
 
-        # 스레드 종료를 위한 이벤트 설정
-        self.data_reading_thread_stop_flag.set()
-
-        # 스레드 종료 대기
-        self.data_reading_thread.join()
+        # UDP 링크 해제
+        if self.udp_link_id is not None:
+            self.transport.close_link(self.udp_link_id)
+            self.udp_link_id = None
 
-        # UDP 연결 해제
-        self.mavlink.close()
-        self.mavlink = None
         self.udp_ip = None
         self.udp_port = None
-        self.message_stats = {}  # 통계 초기화
+        self._resetIfDisconnected()
         print("PX4 UDP 연결이 해제되었습니다.")
         return True
 
+    def _resetIfDisconnected(self):
+        """
+        남은 연결이 없으면 비행 기록을 종료하고 통계와 전달 버퍼를 초기화합니다.
+        """
+
+        if self.port is not None or self._minilink_connected or self.transport.links or self.replay is not None:
+            return
+
+        # 진행 중인 비행 기록 종료
+        self.stopRecording()
+
+        self.message_stats.reset()  # 통계 초기화
+        self.dispatcher.clear()
+        self._dedup.clear()
+
+        # 기체 목록 초기화
+        self.vehicles.clear()
+        self.dispatcher.set_active_source(None)
+        self.vehiclesChanged.emit()
+
+    @Slot(str, float, result=bool)
+    def connectReplay(self, path: str, speed: float = 1.0):
+        """
+        기록된 로그 파일을 연결처럼 재생합니다.
+        speed: 1.0 실시간, N.0 N배속, 0 이하는 최대 속도
+        """
+
+        if self.port is not None or self._minilink_connected or self.transport.links or self.replay is not None:
+            print("이미 연결된 장치가 있습니다.")
+            return False
+
+        try:
+            self.replay = ReplayManager(path, speed)
+            self.is_px4 = self.replay.kind == KIND_MAVLINK
+            print(f"로그 재생 시작: {path} ({len(self.replay.log)}개, {speed}배속)")
+
+            # 데이터 읽기 스레드 시작
+            self.data_reading_thread_stop_flag = threading.Event()
+            self.data_reading_thread = threading.Thread(target=self._getSensorDataReplay, daemon=True)
+            self.data_reading_thread.start()
+            return True
+        except Exception as e:
+            print(f"로그 재생 실패: {str(e)}")
+            if self.replay is not None:
+                self.replay.close()
+            self.replay = None
+            return False
+
+    @Slot(result=bool)
+    def disconnectReplay(self):
+        """
+        로그 재생 종료 슬롯
+        """
+
+        if self.replay is None:
+            return False
+
+        self.data_reading_thread_stop_flag.set()
+        self.data_reading_thread.join()
+
+        self.replay.close()
+        self.replay = None
+        self._resetIfDisconnected()
+        print("로그 재생이 종료되었습니다.")
+        return True
+
+    @Slot(float)
+    def setReplaySpeed(self, speed: float):
+        if self.replay is not None:
+            self.replay.set_speed(speed)
+
+    @Slot(bool)
+    def setReplayPaused(self, paused: bool):
+        if self.replay is not None:
+            self.replay.set_paused(paused)
+
+    @Slot(float)
+    def seekReplay(self, t: float):
+        """
+        로그 시작 기준 t초 위치로 이동합니다.
+        """
+        if self.replay is not None:
+            self.replay.seek(t)
+
+    @Slot(result=dict)
+    def getReplayStatus(self):
+        """
+        재생 상태를 반환합니다. (시간 단위는 로그 시작 기준 초)
+        """
+        if self.replay is None:
+            return {}
+
+        log = self.replay.log
+        return {
+            'path': self.replay.path,
+            'speed': self.replay.speed,
+            'paused': self.replay.paused,
+            'finished': self.replay.finished,
+            'position': self.replay.position - log.start_time,
+            'duration': log.end_time - log.start_time,
+        }
+
     @Slot(result=dict)
     def getCurrentConnection(self):
         """
@@ -324,7 +769,9 @@ class SerialManager(QObject):
             'port': self.port,
             'baudrate': self.baudrate,
             'udp_ip': self.udp_ip,
-            'udp_port': self.udp_port
+            'udp_port': self.udp_port,
+            'is_replay': self.replay is not None,
+            'replay_path': self.replay.path if self.replay is not None else None
         }
 
     @Slot(result=list)
@@ -334,22 +781,20 @@ class SerialManager(QObject):
         """
 
         message_list = []
+        stats = self.message_stats.snapshot()
 
         if self.is_px4:
-            # PX4 MAVLink 메시지 목록
-            if self.mavlink:
-                mavlink_messages = self.mavlink.messages
-                for msg_name, msg_def in mavlink_messages.items():
-                    if '[' in msg_name:
-                        continue
-                    if hasattr(msg_def, 'get_msgId') and hasattr(msg_def, 'fieldnames'):
-                        if msg_def.get_msgId() == 0:
-                            continue
-                        message_list.append({
-                            'id': msg_def.get_msgId(),
-                            'name': msg_name,
-                            'rate': self.getMessageHz(msg_def.get_msgId())
-                        })
+            # PX4 MAVLink 메시지 목록 (수신한 메시지 또는 재생 중인 tlog에 기록된 메시지)
+            msg_ids = self.replay.log.msg_ids() if self.replay is not None else list(stats)
+            for msg_id in msg_ids:
+                msg_def = mavutil.mavlink.mavlink_map.get(msg_id)
+                if msg_def is None or msg_id == 0:
+                    continue
+                message_list.append({
+                    'id': msg_id,
+                    'name': msg_def.msgname,
+                    'rate': stats.get(msg_id, {}).get('hz', 0.0)
+                })
         else:
             # 자작 FC 메시지 목록
             if self.minilink:
@@ -357,7 +802,7 @@ class SerialManager(QObject):
                     message_list.append({
                         'id': key,
                         'name': value[0],
-                        'rate': self.getMessageHz(key)
+                        'rate': stats.get(key, {}).get('hz', 0.0)
                     })
 
         message_list.sort(key=lambda x: x['id'])
@@ -0,0 +1,70 @@
+import os
+import time
+import select
+
+import serial
+
+
+class SerialPortWaiter:
+    """
+    MiniLink가 사용하는 시리얼 포트에 수신 데이터가 생길 때까지 대기하는 클래스
+     - MiniLink.read()는 데이터가 없으면 바로 반환하므로, 그대로 반복하면 CPU 코어 하나를 점유함
+     - POSIX에서는 select()로 포트가 읽기 가능해질 때까지 잠들고, 그 외에는 in_waiting을 짧은 간격으로 확인
+     - 수신 버퍼에 max_backlog 바이트 이상 쌓이면 오래된 데이터를 버려 지연이 계속 늘지 않도록 제한
+    """
+
+    def __init__(self, port, max_backlog: int = 64 * 1024, poll_interval: float = 0.001):
+        self.port = port
+        self.max_backlog = max_backlog
+        self.poll_interval = poll_interval
+
+        self._fd = None
+        if os.name == 'posix':
+            try:
+                self._fd = port.fileno()
+            except Exception:
+                self._fd = None
+
+    @classmethod
+    def from_minilink(cls, minilink, **kwargs):
+        """
+        MiniLink.getSerialPort()로 열린 pyserial 포트를 받아 SerialPortWaiter를 만듭니다.
+        (MiniLink 내부 속성을 뒤지지 않음) 포트를 받을 수 없으면 None을 반환하며,
+        이 경우 SerialManager는 1ms 간격으로 수신을 확인합니다.
+        """
+        get_port = getattr(minilink, 'getSerialPort', None)
+        port = get_port() if callable(get_port) else None
+        if not isinstance(port, serial.SerialBase):
+            print("[SerialPortWaiter] MiniLink.getSerialPort()가 없어 1ms 간격으로 수신을 확인합니다.")
+            return None
+        return cls(port, **kwargs)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        수신 데이터가 생기거나 timeout(초)이 지날 때까지 대기합니다.
+        데이터가 있으면 True를 반환합니다.
+        """
+        if self.port.in_waiting:
+            return True
+        if timeout <= 0:
+            return False
+
+        if self._fd is not None:
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+            return bool(readable)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            if self.port.in_waiting:
+                return True
+        return False
+
+    def trim_backlog(self) -> bool:
+        """
+        수신 버퍼가 max_backlog를 넘으면 비웁니다. 비웠으면 True를 반환합니다.
+        """
+        if self.port.in_waiting > self.max_backlog:
+            self.port.reset_input_buffer()
+            return True
+        return False
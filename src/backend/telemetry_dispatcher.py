@@ -0,0 +1,163 @@
+import threading
+from collections import deque
+
+from PySide6.QtCore import QObject, Slot, QTimer
+
+
+class TelemetryDispatcher(QObject):
+    """
+    데이터 읽기 스레드에서 수신한 메시지를 모아 GUI 스레드로 프레임 단위 전달하는 클래스
+     - 메시지마다 시그널을 보내지 않고, 설정한 주기(기본 60Hz)마다 한 번에 전달
+     - msg_id별 구독 테이블을 두어, 구독자가 있는 메시지만 버퍼에 저장
+     - 최신값 구독자: msg_id별 마지막 샘플만 전달 (callback(msg_id, data))
+     - 이력 구독자(history=True): 해당 프레임 동안 수신한 샘플 전체를 전달 (callback(msg_id, batch))
+     - 여러 기체가 연결된 경우 선택된 기체(active_source)의 메시지만 전달
+       (all_vehicles=True 구독자는 기체별로 따로 전달받으며, 기체 구분은 data.source로 확인)
+    """
+
+    def __init__(self, rate_hz: float = 60.0, max_batch: int = 1000, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+
+        # 구독 테이블 (msg_id: [(callback, history, all_vehicles), ...]) - GUI 스레드에서만 수정
+        self._subscribers = {}
+        # 데이터 읽기 스레드가 참조하는 구독 msg_id 집합 (교체 방식으로 갱신)
+        self._subscribed_ids = frozenset()
+        self._history_ids = frozenset()
+        self._all_vehicle_ids = frozenset()
+
+        # 선택된 기체 (sysid, compid), None이면 모든 송신자의 메시지를 전달
+        self._active_source = None
+
+        # 데이터 읽기 스레드가 채우는 버퍼 ((msg_id, source): 샘플)
+        self._latest = {}
+        self._batches = {}
+        self._max_batch = max_batch  # msg_id별 한 프레임에 보관할 최대 샘플 수
+
+        # GUI 스레드에서 동작하는 전달 타이머
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._flush)
+        self.setRate(rate_hz)
+        self._timer.start()
+
+    @Slot(float)
+    def setRate(self, rate_hz: float):
+        """
+        GUI로 전달하는 주기(Hz)를 설정합니다.
+        """
+        rate_hz = max(1.0, float(rate_hz))
+        self._rate_hz = rate_hz
+        self._timer.setInterval(max(1, round(1000 / rate_hz)))
+
+    @Slot(result=float)
+    def getRate(self):
+        return self._rate_hz
+
+    def subscribe(self, msg_ids, callback, history: bool = False, all_vehicles: bool = False):
+        """
+        msg_ids에 해당하는 메시지를 callback으로 받도록 등록합니다.
+        callback은 GUI 스레드에서 호출됩니다.
+        """
+        for msg_id in msg_ids:
+            entries = self._subscribers.setdefault(msg_id, [])
+            if (callback, history, all_vehicles) not in entries:
+                entries.append((callback, history, all_vehicles))
+        self._update_subscribed_ids()
+
+    def unsubscribe(self, callback, msg_ids=None):
+        """
+        callback의 구독을 해제합니다. msg_ids가 없으면 모든 메시지에서 해제합니다.
+        """
+        targets = list(self._subscribers) if msg_ids is None else msg_ids
+        for msg_id in targets:
+            entries = [entry for entry in self._subscribers.get(msg_id, []) if entry[0] != callback]
+            if entries:
+                self._subscribers[msg_id] = entries
+            else:
+                self._subscribers.pop(msg_id, None)
+        self._update_subscribed_ids()
+
+    def _update_subscribed_ids(self):
+        self._subscribed_ids = frozenset(self._subscribers)
+        self._history_ids = frozenset(
+            msg_id for msg_id, entries in self._subscribers.items()
+            if any(history for _, history, _ in entries)
+        )
+        self._all_vehicle_ids = frozenset(
+            msg_id for msg_id, entries in self._subscribers.items()
+            if any(all_vehicles for _, _, all_vehicles in entries)
+        )
+
+    def is_subscribed(self, msg_id: int) -> bool:
+        return msg_id in self._subscribed_ids
+
+    def subscribed_ids(self) -> frozenset:
+        return self._subscribed_ids
+
+    def set_active_source(self, source):
+        """
+        전달할 기체 (sysid, compid)를 선택합니다. None이면 모든 송신자의 메시지를 전달합니다.
+        """
+        self._active_source = source
+
+    def active_source(self):
+        return self._active_source
+
+    def push(self, msg_id: int, data: dict, source: tuple = None):
+        """
+        데이터 읽기 스레드에서 호출합니다.
+        구독자가 없는 메시지는 버리고, 있는 메시지는 버퍼에만 저장하므로 GUI 이벤트 큐가 쌓이지 않습니다.
+        선택되지 않은 기체의 메시지는 기체별 구독자(all_vehicles)가 있을 때만 저장합니다.
+        """
+        if msg_id not in self._subscribed_ids:
+            return
+        active = self._active_source
+        if source is not None and active is not None and source != active and msg_id not in self._all_vehicle_ids:
+            return
+
+        key = (msg_id, source)
+        with self._lock:
+            self._latest[key] = data
+            if msg_id in self._history_ids:
+                batch = self._batches.get(key)
+                if batch is None:
+                    batch = self._batches[key] = deque(maxlen=self._max_batch)
+                batch.append(data)
+
+    def clear(self):
+        """
+        아직 전달되지 않은 버퍼를 비웁니다. (연결 해제 시 사용)
+        """
+        with self._lock:
+            self._latest = {}
+            self._batches = {}
+
+    def _flush(self):
+        """
+        타이머 주기마다 GUI 스레드에서 호출되어 모인 메시지를 구독자에게 전달합니다.
+        """
+        if not self._latest:
+            return
+
+        # 버퍼를 통째로 교체하여 잠금 구간을 최소화
+        with self._lock:
+            latest, self._latest = self._latest, {}
+            batches, self._batches = self._batches, {}
+
+        active = self._active_source
+        for key, data in latest.items():
+            msg_id, source = key
+            is_active = source is None or active is None or source == active
+            for callback, history, all_vehicles in self._subscribers.get(msg_id, ()):
+                # 프레임 도중 기체 선택이 바뀐 경우 이전 기체의 샘플은 전달하지 않음
+                if not (is_active or all_vehicles):
+                    continue
+                try:
+                    if history:
+                        batch = batches.get(key)
+                        if batch:
+                            callback(msg_id, list(batch))
+                    else:
+                        callback(msg_id, data)
+                except Exception as e:
+                    print(f"[Dispatcher] 메시지 {msg_id} 전달 실패: {str(e)}")
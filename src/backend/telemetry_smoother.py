@@ -0,0 +1,100 @@
+import math
+
+
+class SampleClock:
+    """
+    기체 시각(time_boot_ms)을 GCS의 time.monotonic() 기준 시각으로 바꾸는 변환기
+     - 수신 시각은 전송 지연과 디스패처 프레임(60Hz) 때문에 흔들리므로, 기체 시각 간격을 그대로 사용
+     - 두 시계의 차이(offset)는 지금까지 관측한 (수신 시각 - 기체 시각)의 최솟값 = 지연이 가장 짧았던 샘플 기준
+     - 두 시계의 속도 차이를 따라가도록 offset은 초당 DRIFT만큼 늦춰질 수 있음
+     - 여러 메시지(ATTITUDE, GLOBAL_POSITION_INT 등)가 시계 하나를 같이 쓰므로 기체 시각이 조금씩 뒤섞여 들어옴
+       REBOOT_JUMP초 넘게 되돌아갈 때만 기체 재부팅으로 봄
+    """
+
+    DRIFT = 0.001       # 초당 허용하는 offset 증가량 (s)
+    REBOOT_JUMP = 3.0   # 재부팅으로 보는 기체 시각 역행 (s)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._offset = None
+        self._last_boot = None
+        self._last_arrival = None
+
+    def to_local(self, boot_s: float, arrival: float) -> float:
+        """
+        기체 시각 boot_s(초)에 해당하는 GCS 시각을 반환합니다. arrival은 수신(전달) 시각입니다.
+        """
+        raw = arrival - boot_s
+        if self._offset is None or boot_s < self._last_boot - self.REBOOT_JUMP:
+            # 첫 샘플 또는 기체 재부팅
+            self._offset = raw
+            self._last_boot = boot_s
+        else:
+            self._offset = min(self._offset + self.DRIFT * (arrival - self._last_arrival), raw)
+            self._last_boot = max(self._last_boot, boot_s)
+        self._last_arrival = arrival
+        return boot_s + self._offset
+
+
+class SmoothedValue:
+    """
+    표시 주기(60fps)에 맞춰 부드럽게 움직이는 값 1개
+     - 최신 샘플의 값과 변화율(rate)로 현재 시각의 값을 예측 (최대 max_extrapolation초까지만 외삽)
+     - 표시값은 예측값을 시정수 time_constant로 따라가므로 새 샘플이 와도 튀지 않음
+     - period가 있으면 각도처럼 한 바퀴(예: 360)를 넘어가는 값으로 보고 짧은 방향으로 보간
+       (표시값 범위는 [wrap_start, wrap_start + period))
+    """
+
+    SETTLE_EPSILON = 1e-3
+
+    def __init__(self, period: float = None, wrap_start: float = 0.0, max_extrapolation: float = 0.1, time_constant: float = 0.05):
+        self.period = period
+        self.wrap_start = wrap_start
+        self.max_extrapolation = max_extrapolation
+        self.time_constant = time_constant
+        self.reset()
+
+    def reset(self):
+        self.value = None   # 표시값 (샘플을 받기 전에는 None)
+        self._sample = 0.0
+        self._rate = 0.0
+        self._time = 0.0
+        self._error = 0.0   # 마지막 advance에서의 (예측값 - 표시값)
+
+    def set_sample(self, value: float, rate: float, t: float):
+        """
+        시각 t(GCS 기준)의 샘플 값과 변화율(단위/초)을 저장합니다.
+        """
+        self._sample = value
+        self._rate = rate
+        self._time = t
+        if self.value is None:
+            self.value = value
+            self._error = 0.0
+
+    def predict(self, now: float) -> float:
+        elapsed = min(max(now - self._time, 0.0), self.max_extrapolation)
+        return self._sample + self._rate * elapsed
+
+    def advance(self, now: float, dt: float):
+        """
+        표시값을 dt초만큼 예측값 쪽으로 옮기고 반환합니다.
+        """
+        if self.value is None:
+            return None
+        error = self.predict(now) - self.value
+        if self.period is not None:
+            error = (error + self.period / 2) % self.period - self.period / 2
+        self._error = error
+        self.value += error * (1.0 - math.exp(-dt / self.time_constant))
+        if self.period is not None:
+            self.value = (self.value - self.wrap_start) % self.period + self.wrap_start
+        return self.value
+
+    def settled(self, now: float) -> bool:
+        """
+        더 이상 움직이지 않는지 (외삽이 끝났고 표시값이 예측값에 도달함)
+        """
+        return self.value is None or (now - self._time >= self.max_extrapolation and abs(self._error) < self.SETTLE_EPSILON)
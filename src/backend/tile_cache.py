@@ -0,0 +1,391 @@
+import math
+import os
+import re
+import sqlite3
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from PySide6.QtCore import QObject, Signal, Slot, Property, QTimer, QUrl
+from PySide6.QtNetwork import QHostAddress, QNetworkAccessManager, QNetworkReply, QNetworkRequest, QTcpServer
+
+from .utils import data_path
+
+OSM_TILE_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+# 원본 타일 서버 ({z}/{x}/{y}), 대량으로 미리 받으려면 NALDA_TILE_URL로 자체/유료 타일 서버를 지정
+TILE_UPSTREAM = os.environ.get("NALDA_TILE_URL", OSM_TILE_URL)
+# OSM 타일 사용 정책: 앱을 식별하고 연락할 수 있는 User-Agent 필수
+TILE_USER_AGENT = b"NALDA-GCS/1.0 (+https://github.com/NARAE-INHA-UNIV/NALDA)"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# OSM 타일 사용 정책: 오프라인용으로 확대 수준 13 이상 타일을 약 250개 넘게 받지 않음 (대량 다운로드 금지)
+OSM_PREFETCH_MIN_ZOOM = 13
+OSM_PREFETCH_LIMIT = 250
+
+
+def default_tile_cache_path() -> str:
+    return data_path(os.path.join("cache", "tiles.mbtiles"))
+
+
+def is_public_osm(url: str) -> bool:
+    """
+    OSM 재단의 공개 타일 서버인지 확인합니다. (미리 받기 개수 제한 대상)
+    """
+    host = urlparse(url).hostname or ""
+    return host == "openstreetmap.org" or host.endswith(".openstreetmap.org")
+
+
+def tile_range(north: float, west: float, south: float, east: float, zoom: int):
+    """
+    위도/경도 범위를 덮는 타일 번호 범위 (x0, y0, x1, y1, 양 끝 포함, Web Mercator/XYZ)
+    """
+    def to_tile(lat, lon):
+        n = 2 ** zoom
+        lat = max(min(lat, 85.0511), -85.0511)
+        x = int((lon + 180.0) / 360.0 * n)
+        y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+        return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+    x0, y0 = to_tile(north, west)
+    x1, y1 = to_tile(south, east)
+    return x0, y0, x1, y1
+
+
+class TileStore:
+    """
+    지도 타일 디스크 저장소 (MBTiles 형식 SQLite 파일)
+     - tiles 테이블은 MBTiles 규격 (tile_row는 TMS 방향), 다른 MBTiles 도구로도 열 수 있음
+     - 타일마다 마지막 사용 시각/크기를 함께 저장하고, 전체 크기가 max_bytes를 넘으면
+       오래 사용하지 않은 타일부터 EVICT_RATIO까지 지움 (LRU)
+     - 사용 시각 갱신은 바로 commit하지 않고 flush()/put()에서 한 번에 commit
+     - GUI 스레드에서만 사용 (TileCacheServer와 같은 스레드)
+    """
+
+    EVICT_RATIO = 0.9
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, "
+            "tile_data BLOB, last_access REAL, size INTEGER, "
+            "PRIMARY KEY (zoom_level, tile_column, tile_row))"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS tiles_last_access ON tiles (last_access)")
+        self._db.executemany(
+            "INSERT OR IGNORE INTO metadata (name, value) VALUES (?, ?)",
+            [("name", "NALDA tile cache"), ("format", "png"), ("type", "baselayer")],
+        )
+        self._db.commit()
+        self._total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM tiles").fetchone()[0]
+        self._dirty = False
+
+    @staticmethod
+    def _key(z: int, x: int, y: int):
+        return z, x, (1 << z) - 1 - y  # XYZ → TMS
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def get(self, z: int, x: int, y: int):
+        """
+        저장된 타일 (없으면 None), 사용 시각을 갱신합니다.
+        """
+        key = self._key(z, x, y)
+        row = self._db.execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", key
+        ).fetchone()
+        if row is None:
+            return None
+        self._db.execute(
+            "UPDATE tiles SET last_access=? WHERE zoom_level=? AND tile_column=? AND tile_row=?", (time.time(), *key)
+        )
+        self._dirty = True
+        return row[0]
+
+    def contains(self, z: int, x: int, y: int) -> bool:
+        return self._db.execute(
+            "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", self._key(z, x, y)
+        ).fetchone() is not None
+
+    def put(self, z: int, x: int, y: int, data: bytes):
+        key = self._key(z, x, y)
+        old = self._db.execute(
+            "SELECT size FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", key
+        ).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data, last_access, size) "
+            "VALUES (?, ?, ?, ?, ?, ?)", (*key, sqlite3.Binary(data), time.time(), len(data))
+        )
+        self._total_bytes += len(data) - (old[0] if old else 0)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+        # 받은 타일은 종료 시에도 남도록 바로 commit (사용 시각 갱신도 같이 반영됨)
+        self._db.commit()
+        self._dirty = False
+
+    def _evict(self):
+        """
+        오래 사용하지 않은 타일부터 지워 전체 크기를 max_bytes * EVICT_RATIO 이하로 줄입니다.
+        """
+        target = self.max_bytes * self.EVICT_RATIO
+        cursor = self._db.execute("SELECT zoom_level, tile_column, tile_row, size FROM tiles ORDER BY last_access")
+        victims = []
+        total = self._total_bytes
+        for z, x, row, size in cursor:
+            if total <= target:
+                break
+            victims.append((z, x, row))
+            total -= size
+        cursor.close()
+        self._db.executemany("DELETE FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", victims)
+        self._total_bytes = total
+
+    def flush(self):
+        if self._dirty:
+            self._db.commit()
+            self._dirty = False
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+
+class TileCacheServer(QObject):
+    """
+    지도(QtLocation osm 플러그인)에 타일을 제공하는 로컬 HTTP 서버
+     - QML Plugin의 osm.mapping.custom.host를 url로 지정하면 모든 타일 요청이 이 서버로 옴
+     - 저장소(TileStore)에 있는 타일은 바로 응답하고, 없는 타일만 원본 서버에서 받아 저장 후 응답
+       (오프라인이면 받은 적 있는 타일만 표시, 같은 타일을 다시 받지 않음)
+     - 같은 타일의 동시 요청은 원본 요청 1번으로 처리
+     - prefetchRegion()으로 웨이포인트 주변을 확대 수준별로 미리 받아 둠 (PREFETCH_CONCURRENCY개씩 순서대로)
+       원본이 공개 OSM 서버이면 사용 정책에 맞춰 확대 수준 13 이상은 실행 중 OSM_PREFETCH_LIMIT개까지만 받고
+       prefetchWarning으로 알림 (더 받으려면 NALDA_TILE_URL로 다른 타일 서버 지정)
+     - 모든 처리는 GUI 스레드의 이벤트 루프에서 비동기로 동작
+    """
+
+    REQUEST_PATTERN = re.compile(rb"^GET /(\d+)/(\d+)/(\d+)\.png")
+    FLUSH_INTERVAL_MS = 2000
+    PREFETCH_CONCURRENCY = 2     # OSM 타일 사용 정책에 맞춰 동시 요청 수 제한
+    MAX_PREFETCH_TILES = 10000   # 한 번에 미리 받을 수 있는 최대 타일 수 (공개 OSM 서버가 아닐 때)
+    MAX_ZOOM = 19
+
+    prefetchChanged = Signal()
+
+    def __init__(self, store: TileStore = None, upstream: str = TILE_UPSTREAM, parent=None):
+        super().__init__(parent)
+        self._store = store if store is not None else TileStore(default_tile_cache_path())
+        self._upstream = upstream
+        self._network = QNetworkAccessManager(self)
+
+        self._buffers = {}   # 연결된 소켓: 받은 요청 데이터
+        self._waiting = {}   # (z, x, y): 타일을 기다리는 소켓 목록 (원본 요청 중)
+
+        self._prefetch_queue = deque()
+        self._prefetching = set()   # 미리 받기로 요청 중인 타일
+        self._prefetch_active = 0
+        self._prefetch_done = 0
+        self._prefetch_total = 0
+        self._prefetch_warning = ""
+        self._osm_prefetched = 0    # 공개 OSM 서버에서 미리 받기로 요청한 확대 수준 13 이상 타일 수
+
+        # 사용 시각 갱신은 모아서 commit
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._store.flush)
+        self._flush_timer.start()
+
+        self._server = QTcpServer(self)
+        self._server.newConnection.connect(self._onNewConnection)
+        # 다른 프로그램과 충돌하지 않도록 로컬 주소의 빈 포트 사용
+        if not self._server.listen(QHostAddress.LocalHost, 0):
+            print(f"[TileCache] 서버 시작 실패: {self._server.errorString()}")
+
+    @property
+    def store(self) -> TileStore:
+        return self._store
+
+    # QML Plugin의 osm.mapping.custom.host 값 (끝의 /까지 포함)
+    @Property(str, constant=True)
+    def url(self):
+        return f"http://127.0.0.1:{self._server.serverPort()}/" if self._server.isListening() else ""
+
+    def close(self):
+        for socket in list(self._buffers):
+            socket.disconnected.disconnect()
+            socket.abort()
+        self._buffers = {}
+        self._waiting = {}
+        self._server.close()
+        self._prefetch_queue.clear()
+        self._store.close()
+
+    # ---- 지도 요청 처리 ----
+
+    def _onNewConnection(self):
+        while self._server.hasPendingConnections():
+            socket = self._server.nextPendingConnection()
+            self._buffers[socket] = b""
+            socket.readyRead.connect(lambda s=socket: self._onReadyRead(s))
+            socket.disconnected.connect(lambda s=socket: self._onDisconnected(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _onDisconnected(self, socket):
+        self._buffers.pop(socket, None)
+        for sockets in self._waiting.values():
+            if socket in sockets:
+                sockets.remove(socket)
+
+    def _onReadyRead(self, socket):
+        data = self._buffers.get(socket, b"") + socket.readAll().data()
+        # keep-alive 연결은 재사용되지만 QtLocation은 응답을 받은 뒤에 다음 요청을 보냄 (파이프라이닝 없음)
+        while b"\r\n\r\n" in data:
+            request, data = data.split(b"\r\n\r\n", 1)
+            match = self.REQUEST_PATTERN.match(request)
+            if match is None:
+                self._respond(socket, None)
+                continue
+            z, x, y = (int(value) for value in match.groups())
+            tile = self._store.get(z, x, y)
+            if tile is not None:
+                self._respond(socket, tile)
+            else:
+                self._fetch((z, x, y), socket)
+        if socket in self._buffers:
+            self._buffers[socket] = data
+
+    def _respond(self, socket, tile):
+        if socket not in self._buffers:
+            return  # 응답 전에 연결이 끊김
+        if tile is None:
+            header = b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n"
+            socket.write(header)
+        else:
+            header = f"HTTP/1.1 200 OK\r\nContent-Type: image/png\r\nContent-Length: {len(tile)}\r\n\r\n"
+            socket.write(header.encode() + bytes(tile))
+
+    def _fetch(self, tile, socket=None):
+        """
+        원본 서버에서 타일을 받습니다. 이미 요청 중이면 기다리는 소켓만 추가합니다.
+        """
+        sockets = self._waiting.get(tile)
+        if sockets is not None:
+            if socket is not None:
+                sockets.append(socket)
+            return
+        self._waiting[tile] = [socket] if socket is not None else []
+        z, x, y = tile
+        request = QNetworkRequest(QUrl(self._upstream.format(z=z, x=x, y=y)))
+        request.setRawHeader(b"User-Agent", TILE_USER_AGENT)
+        reply = self._network.get(request)
+        reply.finished.connect(lambda r=reply, t=tile: self._onFetched(r, t))
+
+    def _onFetched(self, reply, tile):
+        data = None
+        if reply.error() == QNetworkReply.NoError:
+            data = reply.readAll().data()
+            if data:
+                self._store.put(*tile, data)
+        reply.deleteLater()
+
+        for socket in self._waiting.pop(tile, []):
+            self._respond(socket, data or None)
+        if tile in self._prefetching:
+            self._prefetching.discard(tile)
+            self._prefetch_active -= 1
+            self._prefetch_done += 1
+            self._prefetchNext()
+            self.prefetchChanged.emit()
+
+    # ---- 미리 받기 ----
+
+    @Slot('QVariantList', int, int, float)
+    def prefetchRegion(self, coordinates, min_zoom: int, max_zoom: int, margin_m: float = 500.0):
+        """
+        웨이포인트 목록({latitude, longitude})을 둘러싼 범위(+margin_m)의 타일을 min_zoom~max_zoom에서 미리 받습니다.
+        이미 저장된 타일은 건너뜁니다. (QML에서 호출)
+        """
+        points = [(float(c["latitude"]), float(c["longitude"])) for c in coordinates]
+        if not points:
+            return
+        min_zoom, max_zoom = max(min(min_zoom, max_zoom), 0), min(max(min_zoom, max_zoom), self.MAX_ZOOM)
+        lats = [lat for lat, _ in points]
+        lons = [lon for _, lon in points]
+        margin_lat = margin_m / 111320.0
+        margin_lon = margin_m / (111320.0 * max(math.cos(math.radians(sum(lats) / len(lats))), 0.01))
+        north, south = max(lats) + margin_lat, min(lats) - margin_lat
+        west, east = min(lons) - margin_lon, max(lons) + margin_lon
+
+        tiles = []
+        for zoom in range(min_zoom, max_zoom + 1):
+            x0, y0, x1, y1 = tile_range(north, west, south, east, zoom)
+            count = (x1 - x0 + 1) * (y1 - y0 + 1)
+            if len(tiles) + count > self.MAX_PREFETCH_TILES:
+                print(f"[TileCache] 타일이 너무 많아 확대 수준 {zoom - 1}까지만 받습니다.")
+                break
+            tiles.extend((zoom, x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+
+        queued = set(self._prefetch_queue) | self._prefetching
+        tiles = [t for t in tiles if t not in queued and not self._store.contains(*t)]
+
+        self._prefetch_warning = ""
+        if is_public_osm(self._upstream):
+            # 확대 수준 순서이므로 낮은 확대 수준부터 남은 개수만큼만 받음
+            remaining = OSM_PREFETCH_LIMIT - self._osm_prefetched
+            low = [t for t in tiles if t[0] < OSM_PREFETCH_MIN_ZOOM]
+            high = [t for t in tiles if t[0] >= OSM_PREFETCH_MIN_ZOOM]
+            if len(high) > remaining:
+                self._prefetch_warning = (
+                    f"공개 OSM 서버는 확대 수준 {OSM_PREFETCH_MIN_ZOOM} 이상을 {OSM_PREFETCH_LIMIT}개까지만 미리 받습니다. "
+                    f"({len(high) - max(remaining, 0)}개 제외, NALDA_TILE_URL로 다른 타일 서버 지정)"
+                )
+                print(f"[TileCache] {self._prefetch_warning}")
+                high = high[:max(remaining, 0)]
+            self._osm_prefetched += len(high)
+            tiles = low + high
+        self._prefetch_queue.extend(tiles)
+        self._prefetch_total += len(tiles)
+        self._prefetchNext()
+        self.prefetchChanged.emit()
+
+    @Slot()
+    def cancelPrefetch(self):
+        self._prefetch_total -= len(self._prefetch_queue)
+        self._prefetch_queue.clear()
+        self.prefetchChanged.emit()
+
+    def _prefetchNext(self):
+        while self._prefetch_queue and self._prefetch_active < self.PREFETCH_CONCURRENCY:
+            tile = self._prefetch_queue.popleft()
+            if self._store.contains(*tile):
+                self._prefetch_done += 1
+                continue
+            # 지도가 이미 요청 중인 타일이면 _fetch는 새로 요청하지 않고 그 결과를 같이 사용
+            self._prefetching.add(tile)
+            self._prefetch_active += 1
+            self._fetch(tile)
+        if not self._prefetch_queue and self._prefetch_active == 0:
+            # 끝나면 진행 상황을 초기화 (다음 미리 받기는 0부터)
+            self._prefetch_done = self._prefetch_total = 0
+
+    @Property(str, notify=prefetchChanged)
+    def prefetchWarning(self):
+        return self._prefetch_warning
+
+    @Property(bool, notify=prefetchChanged)
+    def prefetching(self):
+        return self._prefetch_total > 0
+
+    @Property(int, notify=prefetchChanged)
+    def prefetchDone(self):
+        return self._prefetch_done
+
+    @Property(int, notify=prefetchChanged)
+    def prefetchTotal(self):
+        return self._prefetch_total
@@ -0,0 +1,282 @@
+import math
+
+import numpy as np
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QTimer, Qt, Signal, Slot, Property
+from PySide6.QtPositioning import QGeoCoordinate
+
+from .track_simplifier import TrackSimplifier, EARTH_RADIUS
+from .track_store import TrackStore
+
+
+def _runs(mask: np.ndarray) -> list:
+    """
+    mask에서 True가 연속된 구간 [(start, stop), ...]
+    """
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], mask.astype(np.int8), [0]))))
+    return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+
+
+class TrackMarkerModel(QAbstractListModel):
+    """
+    지도에 표시할 과거 경로 지점 마커 목록 (화면 안의 지점만, 최대 개수 제한)
+     - 목록이 바뀌면 빠진/새로 생긴 행만 알려서 화면 이동 중에도 기존 마커 delegate를 다시 만들지 않음
+    """
+
+    MAX_DIFF_RUNS = 32  # 바뀐 구간이 이보다 많으면 (확대 수준 변경 등) 전체를 다시 만듦
+
+    CoordinateRole = Qt.UserRole + 1
+    NumberRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = np.empty(0, dtype=np.int64)  # 경로에서의 지점 번호
+        self._lat = np.empty(0)
+        self._lon = np.empty(0)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def roleNames(self):
+        return {self.CoordinateRole: b'coordinate', self.NumberRole: b'number'}
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = index.row()
+        if role == self.CoordinateRole:
+            return QGeoCoordinate(float(self._lat[row]), float(self._lon[row]))
+        if role == self.NumberRole:
+            return int(self._rows[row]) + 1  # 경로 순서 (1부터 시작)
+        return None
+
+    def set_markers(self, rows: np.ndarray, lat: np.ndarray, lon: np.ndarray):
+        """
+        마커 목록을 바꿉니다. (rows는 오름차순 지점 번호)
+        """
+        if np.array_equal(rows, self._rows):
+            return
+        kept = np.isin(self._rows, rows)
+        removed = _runs(~kept)
+        added = _runs(~np.isin(rows, self._rows[kept]))
+        if len(removed) + len(added) > self.MAX_DIFF_RUNS:
+            self.beginResetModel()
+            self._rows, self._lat, self._lon = rows, lat, lon
+            self.endResetModel()
+            return
+
+        # 빠진 행은 뒤에서부터 제거
+        for start, stop in reversed(removed):
+            self.beginRemoveRows(QModelIndex(), start, stop - 1)
+            self._rows = np.delete(self._rows, np.s_[start:stop])
+            self._lat = np.delete(self._lat, np.s_[start:stop])
+            self._lon = np.delete(self._lon, np.s_[start:stop])
+            self.endRemoveRows()
+        # 남은 행은 새 목록의 부분 수열이므로, 새 행을 앞에서부터 최종 위치에 삽입
+        for start, stop in added:
+            self.beginInsertRows(QModelIndex(), start, stop - 1)
+            self._rows = np.insert(self._rows, start, rows[start:stop])
+            self._lat = np.insert(self._lat, start, lat[start:stop])
+            self._lon = np.insert(self._lon, start, lon[start:stop])
+            self.endInsertRows()
+
+    def append(self, row: int, lat: float, lon: float):
+        count = len(self._rows)
+        self.beginInsertRows(QModelIndex(), count, count)
+        self._rows = np.append(self._rows, row)
+        self._lat = np.append(self._lat, lat)
+        self._lon = np.append(self._lon, lon)
+        self.endInsertRows()
+
+
+class TrackLod(QObject):
+    """
+    지도 확대 수준과 화면 범위에 맞춰 경로를 단순화하여 보여주는 객체 (ND 지도용)
+     - 경로 선: 약 1px 오차 이내로 단순화한 지점만 전달 (MapPolyline은 점 개수의 제곱에 비례하여 느려짐)
+       MAX_PATH_POINTS개를 넘으면 화면 밖은 OUTSIDE_PIXELS배 오차로, 그래도 넘으면 오차를 2배씩 늘림
+     - 과거 지점 마커: 화면 안의 지점 중 MARKER_SPACING px 격자 칸마다 1개, 최대 MAX_MARKERS개
+       (격자는 지도 좌표 기준이므로 화면을 이동해도 이미 보이는 마커는 바뀌지 않음)
+     - 화면 이동/확대는 REFRESH_INTERVAL_MS마다 최대 1번 반영
+     - 지점 추가는 QML이 별도의 짧은 꼬리 선에 바로 이어 붙이고 (TrackModel.rowsInserted),
+       REFRESH_POINTS개가 쌓일 때마다 단순화한 경로로 교체 (선택된 지점이 그대로이면 교체하지 않음)
+    """
+
+    pathChanged = Signal()
+
+    REFRESH_INTERVAL_MS = 50
+    REFRESH_POINTS = 64
+    MAX_PATH_POINTS = 400
+    PIXEL_TOLERANCE = 1.0
+    OUTSIDE_PIXELS = 16.0
+    MARKER_SPACING = 24.0
+    MAX_MARKERS = 300
+    DEFAULT_ZOOM = 17.0  # 지도에서 화면 범위를 받기 전의 확대 수준
+    VIEW_MARGIN = 0.1  # 화면 범위를 가로/세로 10%씩 넓혀서 판단
+
+    def __init__(self, track_model, parent=None):
+        super().__init__(parent)
+        self._track_model = track_model
+        self._simplifiers = {}   # TrackStore별 단순화기 (기체를 다시 선택해도 처음부터 계산하지 않음)
+        self._viewport = None    # (zoom, north, west, south, east)
+        self._path = []
+        self._rows = None  # 경로 선에 전달한 지점 번호
+        self._appended = 0
+        self._cell_size = None       # 마커 격자 칸 크기 (m)
+        self._marker_cells = set()   # 마커가 있는 격자 칸
+        self.marker_model = TrackMarkerModel(self)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        track_model.rowsInserted.connect(self._onRowsInserted)
+        track_model.modelReset.connect(self.refresh)
+
+    @Property(list, notify=pathChanged)
+    def path(self):
+        return self._path
+
+    @Property(QObject, constant=True)
+    def markerModel(self):
+        return self.marker_model
+
+    @Slot(float, float, float, float, float)
+    def setViewport(self, zoom: float, north: float, west: float, south: float, east: float):
+        """
+        지도의 확대 수준과 화면 범위를 받는 슬롯 (QML Map에서 이동/확대할 때 호출)
+        """
+        if any(math.isnan(value) for value in (zoom, north, west, south, east)):
+            return
+        self._viewport = (zoom, north, west, south, east)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _store(self) -> TrackStore:
+        return self._track_model.store
+
+    def update_store(self, store: TrackStore):
+        """
+        store에 지점이 추가될 때마다 호출하여 단순화기를 미리 갱신합니다. (표시 중이 아닌 기체도 GpsManager에서 호출)
+        구간(BLOCK개)이 찰 때마다 조금씩 계산하므로, 기체를 전환할 때 쌓인 지점을 한 번에 계산하지 않음
+        """
+        self._simplifier(store).update(store)
+
+    def _simplifier(self, store: TrackStore) -> TrackSimplifier:
+        simplifier = self._simplifiers.get(store)
+        if simplifier is None:
+            simplifier = self._simplifiers[store] = TrackSimplifier()
+        return simplifier
+
+    def _bounds(self):
+        zoom, north, west, south, east = self._viewport
+        margin_lat = (north - south) * self.VIEW_MARGIN
+        margin_lon = (east - west) * self.VIEW_MARGIN
+        return north + margin_lat, west - margin_lon, south - margin_lat, east + margin_lon
+
+    def _inside(self, lat, lon) -> bool:
+        if self._viewport is None:
+            return True
+        north, west, south, east = self._bounds()
+        return south <= lat <= north and west <= lon <= east
+
+    def _onRowsInserted(self, parent, first: int, last: int):
+        # 새 지점 앞의 지점은 과거 지점이 되므로, 화면 안에 있으면 마커 추가
+        store = self._store()
+        for row in range(max(first - 1, 0), last):
+            _, lat, lon, _, _ = store.row(row)
+            if self.marker_model.rowCount() >= self.MAX_MARKERS or not self._inside(lat, lon):
+                continue
+            cell = self._cells(store, np.array([lat]), np.array([lon]))[0]
+            if cell not in self._marker_cells:
+                self._marker_cells.add(cell)
+                self.marker_model.append(row, lat, lon)
+
+        self.update_store(store)
+        self._appended += last - first + 1
+        if self._appended >= self.REFRESH_POINTS and not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    @Slot()
+    def refresh(self):
+        """
+        현재 확대 수준/화면 범위로 경로 선과 마커를 다시 계산합니다.
+        """
+        self._refresh_timer.stop()
+        self._appended = 0
+        store = self._store()
+        if len(store) == 0:
+            self._path = []
+            self._rows = None
+            self.marker_model.set_markers(np.empty(0, dtype=np.int64), np.empty(0), np.empty(0))
+            self.pathChanged.emit()
+            return
+
+        lat = store.column(TrackStore.LAT)
+        lon = store.column(TrackStore.LON)
+        alt = store.column(TrackStore.ALT)
+        simplifier = self._simplifier(store)
+        if self._viewport is None:
+            meters_per_pixel = self._metersPerPixel(self.DEFAULT_ZOOM, float(lat[-1]))
+            rows = self._selectRows(store, simplifier, meters_per_pixel, None)
+            markers = np.arange(len(store) - 1)
+        else:
+            zoom, north, west, south, east = self._viewport
+            meters_per_pixel = self._metersPerPixel(zoom, (north + south) / 2)
+            bounds = self._bounds()
+            rows = self._selectRows(store, simplifier, meters_per_pixel, bounds)
+            b_north, b_west, b_south, b_east = bounds
+            inside = (lat[:-1] <= b_north) & (lat[:-1] >= b_south) & (lon[:-1] >= b_west) & (lon[:-1] <= b_east)
+            markers = np.flatnonzero(inside)
+
+        # 격자 칸마다 첫 지점만 마커로 표시 (겹치는 마커 제거)
+        self._cell_size = self.MARKER_SPACING * meters_per_pixel
+        gx, gy = self._cellIndices(store, lat[markers], lon[markers])
+        _, first = np.unique((gx << 32) | (gy & 0xFFFFFFFF), return_index=True)  # 칸 번호 2개를 int64 1개로 묶어 1차원 정렬
+        markers = markers[np.sort(first)]
+        if len(markers) > self.MAX_MARKERS:
+            markers = markers[np.linspace(0, len(markers) - 1, self.MAX_MARKERS).astype(np.int64)]
+        self._marker_cells = set(self._cells(store, lat[markers], lon[markers]))
+        self.marker_model.set_markers(markers, lat[markers], lon[markers])
+
+        if self._rows is not None and np.array_equal(rows, self._rows):
+            return
+        self._rows = rows
+        self._path = [QGeoCoordinate(a, b, c) for a, b, c in zip(lat[rows].tolist(), lon[rows].tolist(), alt[rows].tolist())]
+        self.pathChanged.emit()
+
+    def _selectRows(self, store: TrackStore, simplifier: TrackSimplifier, meters_per_pixel: float, bounds) -> np.ndarray:
+        """
+        경로 선에 넣을 지점 번호 (MAX_PATH_POINTS개 이하가 될 때까지 오차를 늘림)
+        """
+        tolerance = self.PIXEL_TOLERANCE * meters_per_pixel
+        rows = simplifier.select(store, tolerance)
+        if len(rows) > self.MAX_PATH_POINTS and bounds is not None:
+            rows = simplifier.select(store, tolerance, tolerance * self.OUTSIDE_PIXELS, bounds)
+        while len(rows) > self.MAX_PATH_POINTS:
+            tolerance *= 2
+            rows = simplifier.select(store, tolerance, tolerance * self.OUTSIDE_PIXELS, bounds)
+        return rows
+
+    def _cellIndices(self, store: TrackStore, lat: np.ndarray, lon: np.ndarray):
+        """
+        지점이 속한 마커 격자 칸 번호 배열 (gx, gy) (격자 원점은 지도 좌표에 고정)
+        """
+        origin = float(store.row(0)[TrackStore.LAT])
+        if self._cell_size is None:
+            self._cell_size = self.MARKER_SPACING * self._metersPerPixel(self.DEFAULT_ZOOM, origin)
+        scale = math.cos(math.radians(origin))
+        gx = np.floor(np.radians(lon) * EARTH_RADIUS * scale / self._cell_size).astype(np.int64)
+        gy = np.floor(np.radians(lat) * EARTH_RADIUS / self._cell_size).astype(np.int64)
+        return gx, gy
+
+    def _cells(self, store: TrackStore, lat: np.ndarray, lon: np.ndarray) -> list:
+        """
+        지점이 속한 마커 격자 칸 [(gx, gy), ...]
+        """
+        gx, gy = self._cellIndices(store, lat, lon)
+        return list(zip(gx.tolist(), gy.tolist()))
+
+    @staticmethod
+    def _metersPerPixel(zoom: float, latitude: float) -> float:
+        # Web 메르카토르 (256px 타일) 기준
+        return 156543.03392 * math.cos(math.radians(latitude)) / 2 ** zoom
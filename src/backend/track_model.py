@@ -0,0 +1,102 @@
+from datetime import datetime
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt, Signal, Slot, Property
+from PySide6.QtPositioning import QGeoCoordinate
+
+from .track_store import TrackStore
+
+
+class TrackModel(QAbstractListModel):
+    """
+    지도(ND)와 경로 기록 창에 표시할 경로 지점 목록 (추가 전용)
+     - 지점을 추가하면 rowsInserted로 새 행만 알리므로, QML은 추가된 지점만 처리 (경로 전체를 다시 보내지 않음)
+     - 기체 전환/경로 초기화 때만 modelReset
+     - 지점은 GpsManager의 TrackStore를 그대로 사용 (복사하지 않음)
+     - 표시 문자열과 QGeoCoordinate는 QML이 요청한 행(화면에 보이는 delegate)만 그때 만듦
+    """
+
+    TimestampRole = Qt.UserRole + 1
+    LatRole = Qt.UserRole + 2
+    LonRole = Qt.UserRole + 3
+    AltRole = Qt.UserRole + 4
+    HdgRole = Qt.UserRole + 5
+    CoordinateRole = Qt.UserRole + 6
+
+    ROLE_NAMES = {
+        TimestampRole: b'timestamp',
+        LatRole: b'lat',
+        LonRole: b'lon',
+        AltRole: b'alt',
+        HdgRole: b'hdg',
+        CoordinateRole: b'coordinate',
+    }
+
+    countChanged = Signal()
+    lastCoordinateChanged = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._store = TrackStore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._store)
+
+    def roleNames(self):
+        return self.ROLE_NAMES
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._store):
+            return None
+        t, lat, lon, alt, hdg = self._store.row(index.row())
+        if role == self.TimestampRole:
+            return datetime.fromtimestamp(t).strftime("%H:%M:%S")
+        if role == self.LatRole:
+            return round(float(lat), 7)
+        if role == self.LonRole:
+            return round(float(lon), 7)
+        if role == self.AltRole:
+            return round(float(alt), 2)
+        if role == self.HdgRole:
+            return round(float(hdg), 2)
+        if role == self.CoordinateRole:
+            return QGeoCoordinate(lat, lon, alt)
+        return None
+
+    def set_store(self, store: TrackStore):
+        """
+        표시할 경로를 바꿉니다. (기체 전환, 초기화)
+        """
+        self.beginResetModel()
+        self._store = store
+        self.endResetModel()
+        self.countChanged.emit()
+        self.lastCoordinateChanged.emit()
+
+    def append(self, t: float, lat: float, lon: float, alt: float, hdg: float):
+        """
+        경로 끝에 지점을 추가하고 추가된 행만 알립니다.
+        """
+        row = len(self._store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._store.append(t, lat, lon, alt, hdg)
+        self.endInsertRows()
+        self.countChanged.emit()
+        self.lastCoordinateChanged.emit()
+
+    @property
+    def store(self) -> TrackStore:
+        return self._store
+
+    @Property(int, notify=countChanged)
+    def count(self):
+        return len(self._store)
+
+    # 현재 위치 (마지막 지점)
+    @Property(QGeoCoordinate, notify=lastCoordinateChanged)
+    def lastCoordinate(self):
+        return self.coordinateAt(-1) if len(self._store) else QGeoCoordinate()
+
+    @Slot(int, result=QGeoCoordinate)
+    def coordinateAt(self, row: int):
+        _, lat, lon, alt, _ = self._store.row(row)
+        return QGeoCoordinate(lat, lon, alt)
@@ -0,0 +1,134 @@
+import math
+
+import numpy as np
+
+from .track_store import TrackStore
+
+EARTH_RADIUS = 6378137.0
+MIN_IMPORTANCE = 0.05  # 이보다 작은 오차는 구분하지 않음 (m, 최대 확대에서도 1px 미만)
+
+
+def douglas_peucker_importance(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Douglas–Peucker로 각 점의 중요도(그 점이 필요해지는 최대 허용 오차, 미터)를 계산합니다.
+    허용 오차 tol로 단순화한 결과는 중요도 >= tol인 점들과 같습니다. (양 끝점은 inf)
+    자식 점의 중요도는 부모보다 크지 않도록 제한하여 tol을 줄이면 점이 추가되기만 함
+    구간의 최대 오차가 MIN_IMPORTANCE보다 작으면 더 나누지 않고 구간 안의 점에 같은 중요도를 줌
+    """
+    n = len(x)
+    importance = np.full(n, np.inf)
+    stack = [(0, n - 1, np.inf)]
+    while stack:
+        i, j, limit = stack.pop()
+        if j - i < 2:
+            continue
+        dx, dy = x[j] - x[i], y[j] - y[i]
+        px, py = x[i + 1:j] - x[i], y[i + 1:j] - y[i]
+        length = dx * dx + dy * dy
+        if length > 0:
+            t = np.clip((px * dx + py * dy) / length, 0.0, 1.0)
+            dist = np.hypot(px - t * dx, py - t * dy)
+        else:
+            dist = np.hypot(px, py)
+        k = int(np.argmax(dist))
+        value = min(float(dist[k]), limit)
+        if value < MIN_IMPORTANCE:
+            importance[i + 1:j] = value
+            continue
+        m = i + 1 + k
+        importance[m] = value
+        stack.append((i, m, value))
+        stack.append((m, j, value))
+    return importance
+
+
+class TrackSimplifier:
+    """
+    TrackStore 1개의 지점별 중요도를 지점이 추가되는 대로 미리 계산해 두는 단순화기
+     - BLOCK개 구간이 채워질 때마다 그 구간만 Douglas–Peucker로 계산 (이전 구간은 다시 계산하지 않음)
+     - 구간 끝점은 BLOCK개가 모이면 상위 단계에서 다시 Douglas–Peucker로 중요도를 정함 (계층 구조)
+     - 아직 구간이 채워지지 않은 최근 지점과 상위 단계 대기 중인 끝점은 중요도 inf (항상 표시)
+     - select()는 중요도 배열 비교만 하므로 지점 수에 비례하는 NumPy 연산 1번으로 끝남
+    """
+
+    BLOCK = 256
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._importance = np.empty(0)
+        self._count = 0      # 중요도 배열에 반영된 지점 수
+        self._done = 0       # 0단계 구간 계산이 끝난 마지막 지점
+        self._pending = []   # 단계별로 상위 단계 계산을 기다리는 구간 끝점 목록
+        self._origin = None  # 투영 기준 (위도 cos)
+
+    def update(self, store: TrackStore):
+        """
+        store에 새로 추가된 지점을 반영합니다. (지점이 줄었으면 처음부터 다시 계산)
+        """
+        n = len(store)
+        if n < self._count:
+            self.reset()
+        if n == self._count:
+            return
+        if self._origin is None:
+            self._origin = math.cos(math.radians(store.row(0)[TrackStore.LAT]))
+        if n > len(self._importance):
+            grown = np.full(max(n, 2 * len(self._importance), self.BLOCK), np.inf)
+            grown[:self._count] = self._importance[:self._count]
+            self._importance = grown
+        self._importance[self._count:n] = np.inf
+        self._count = n
+
+        while self._done + self.BLOCK < n:
+            start, stop = self._done, self._done + self.BLOCK
+            self._assign(store, np.arange(start, stop + 1), 0)
+            self._done = stop
+
+    def _project(self, store: TrackStore, indices: np.ndarray):
+        start, stop = int(indices[0]), int(indices[-1]) + 1
+        offsets = indices - start
+        lat = store.column(TrackStore.LAT, start, stop)[offsets]
+        lon = store.column(TrackStore.LON, start, stop)[offsets]
+        return np.radians(lon) * EARTH_RADIUS * self._origin, np.radians(lat) * EARTH_RADIUS
+
+    def _assign(self, store: TrackStore, indices: np.ndarray, level: int):
+        x, y = self._project(store, indices)
+        self._importance[indices[1:-1]] = douglas_peucker_importance(x, y)[1:-1]
+
+        # 구간 끝점을 상위 단계로 넘김
+        if len(self._pending) <= level:
+            self._pending.append([])
+        pending = self._pending[level]
+        if not pending:
+            pending.append(int(indices[0]))
+        pending.append(int(indices[-1]))
+        if len(pending) == self.BLOCK + 1:
+            self._pending[level] = [pending[-1]]
+            self._assign(store, np.array(pending), level + 1)
+
+    def select(self, store: TrackStore, tolerance: float, outside_tolerance: float = None, bounds=None) -> np.ndarray:
+        """
+        표시할 지점 번호를 반환합니다.
+         - bounds (north, west, south, east) 안쪽(과 바로 옆 지점)은 tolerance, 바깥은 outside_tolerance로 단순화
+         - 처음과 마지막 지점은 항상 포함
+        """
+        self.update(store)
+        n = self._count
+        if n == 0:
+            return np.empty(0, dtype=np.int64)
+        importance = self._importance[:n]
+        keep = importance >= tolerance
+        if bounds is not None and outside_tolerance is not None:
+            north, west, south, east = bounds
+            lat = store.column(TrackStore.LAT)
+            lon = store.column(TrackStore.LON)
+            inside = (lat <= north) & (lat >= south) & (lon >= west) & (lon <= east)
+            # 경계를 지나는 선분이 끊기지 않도록 안쪽 지점의 이웃도 안쪽으로 취급
+            near = inside.copy()
+            near[1:] |= inside[:-1]
+            near[:-1] |= inside[1:]
+            keep = np.where(near, keep, importance >= outside_tolerance)
+        keep[0] = keep[-1] = True
+        return np.flatnonzero(keep)
@@ -0,0 +1,89 @@
+import tempfile
+
+import numpy as np
+
+
+class TrackStore:
+    """
+    기체 1대의 경로 지점 저장소 (열 단위 NumPy 배열)
+     - 지점마다 (시각(epoch), 위도, 경도, 고도, 방위각)을 float64 5개(40바이트)로 저장
+     - CHUNK_SIZE개씩 미리 할당한 청크를 이어 붙이므로, 지점이 늘어도 기존 데이터를 복사하지 않음
+     - 메모리에 둔 청크가 max_memory_chunks개를 넘으면 가장 오래된 청크를 임시 파일로 옮기고
+       np.memmap으로 읽음 (행 번호는 그대로, 긴 비행에서도 메모리 사용량이 일정)
+     - 표시용 문자열/QGeoCoordinate는 저장하지 않음 (TrackModel에서 필요한 행만 만듦)
+    """
+
+    COLUMNS = ('time', 'lat', 'lon', 'alt', 'hdg')
+    TIME, LAT, LON, ALT, HDG = range(len(COLUMNS))
+    CHUNK_SIZE = 4096
+
+    def __init__(self, max_memory_chunks: int = 64):
+        self.max_memory_chunks = max_memory_chunks
+        self._chunks = []       # (CHUNK_SIZE, 5) 배열 목록 (앞쪽은 memmap일 수 있음)
+        self._count = 0
+        self._spill_file = None
+        self._spilled = 0       # 파일로 옮긴 청크 개수
+
+    def __len__(self):
+        return self._count
+
+    def append(self, t: float, lat: float, lon: float, alt: float, hdg: float):
+        offset = self._count % self.CHUNK_SIZE
+        if offset == 0:
+            self._chunks.append(np.empty((self.CHUNK_SIZE, len(self.COLUMNS)), dtype=np.float64))
+            self._spillOldChunks()
+        self._chunks[-1][offset] = (t, lat, lon, alt, hdg)
+        self._count += 1
+
+    def row(self, index: int) -> np.ndarray:
+        """
+        index번째 지점 (time, lat, lon, alt, hdg). 음수 index는 뒤에서부터
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        chunk, offset = divmod(index, self.CHUNK_SIZE)
+        return self._chunks[chunk][offset]
+
+    def column(self, column: int, start: int = 0, stop: int = None) -> np.ndarray:
+        """
+        [start, stop) 구간의 한 열을 연속된 배열로 반환합니다. (복사본)
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        if start >= stop:
+            return np.empty(0, dtype=np.float64)
+        parts = []
+        first, last = start // self.CHUNK_SIZE, (stop - 1) // self.CHUNK_SIZE
+        for chunk in range(first, last + 1):
+            base = chunk * self.CHUNK_SIZE
+            lo = max(start - base, 0)
+            hi = min(stop - base, self.CHUNK_SIZE)
+            parts.append(self._chunks[chunk][lo:hi, column])
+        return np.concatenate(parts)
+
+    def clear(self):
+        self._chunks = []
+        self._count = 0
+        self._spilled = 0
+        if self._spill_file is not None:
+            self._spill_file.close()  # 임시 파일은 닫으면 삭제됨
+            self._spill_file = None
+
+    def _spillOldChunks(self):
+        """
+        메모리에 있는 청크가 너무 많으면 가장 오래된 (가득 찬) 청크를 파일로 옮깁니다.
+        """
+        if self.max_memory_chunks is None:
+            return
+        while len(self._chunks) - self._spilled > self.max_memory_chunks:
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile(prefix="nalda_track_")
+            chunk = self._chunks[self._spilled]
+            offset = self._spilled * chunk.nbytes
+            self._spill_file.seek(offset)
+            self._spill_file.write(chunk.tobytes())
+            self._spill_file.flush()
+            self._chunks[self._spilled] = np.memmap(self._spill_file, dtype=np.float64, mode='r',
+                                                    offset=offset, shape=chunk.shape)
+            self._spilled += 1
@@ -0,0 +1,342 @@
+import os
+import zlib
+import asyncio
+import threading
+
+import serial
+from pymavlink import mavutil
+
+
+class LinkStats:
+    """
+    링크별 수신 통계
+    """
+
+    __slots__ = ('bytes_rx', 'packets_rx', 'parse_errors', 'bytes_tx', 'last_rx')
+
+    def __init__(self):
+        self.bytes_rx = 0
+        self.packets_rx = 0
+        self.parse_errors = 0
+        self.bytes_tx = 0
+        self.last_rx = 0.0
+
+
+class MavlinkLink:
+    """
+    MAVLink 링크 1개 (시리얼/UDP/TCP 공통)
+     - 링크마다 별도의 MAVLink 디코더와 통계를 가짐
+     - 모든 입출력은 TransportLoop의 asyncio 이벤트 루프 스레드에서 처리
+     - 메시지를 디코딩하면 on_message(link, msg)를 이벤트 루프 스레드에서 호출
+    """
+
+    def __init__(self, link_id: str, url: str, on_message, on_closed=None):
+        self.link_id = link_id
+        self.url = url
+        self.on_message = on_message
+        self.on_closed = on_closed
+
+        self.decoder = mavutil.mavlink.MAVLink(None)
+        self.decoder.robust_parsing = True
+        self.stats = LinkStats()
+        self.closed = False
+
+    async def open(self):
+        raise NotImplementedError
+
+    def send(self, data: bytes):
+        raise NotImplementedError
+
+    def _close_transport(self):
+        pass
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self._close_transport()
+
+    def feed(self, data: bytes):
+        """
+        수신한 바이트를 디코딩하여 메시지마다 on_message를 호출합니다.
+        """
+        stats = self.stats
+        stats.bytes_rx += len(data)
+        stats.last_rx = asyncio.get_running_loop().time()
+
+        msgs = self.decoder.parse_buffer(data)
+        if not msgs:
+            return
+        for msg in msgs:
+            if msg.get_type() == 'BAD_DATA':
+                stats.parse_errors += 1
+                continue
+            stats.packets_rx += 1
+            self.on_message(self, msg)
+
+    def _lost(self, error=None):
+        """
+        연결이 끊겼을 때 호출됩니다.
+        """
+        if self.closed:
+            return
+        self.close()
+        print(f"[Transport] 링크 {self.link_id} 연결 끊김: {error or ''}")
+        if self.on_closed:
+            self.on_closed(self)
+
+
+class SerialLink(MavlinkLink):
+    """
+    시리얼 링크 (url: serial:<device>:<baudrate>)
+    POSIX에서는 이벤트 루프가 포트 fd를 직접 감시하고, 그 외에는 짧은 주기로 수신 버퍼를 확인합니다.
+    """
+
+    def __init__(self, link_id, url, device: str, baudrate: int, on_message, on_closed=None):
+        super().__init__(link_id, url, on_message, on_closed)
+        self.device = device
+        self.baudrate = baudrate
+        self.port = None
+        self._poll_task = None
+        self._fd = None
+
+    async def open(self):
+        self.port = serial.Serial(self.device, self.baudrate, timeout=0, write_timeout=0)
+        loop = asyncio.get_running_loop()
+        if os.name == 'posix':
+            self._fd = self.port.fileno()
+            loop.add_reader(self._fd, self._on_readable)
+        else:
+            self._poll_task = loop.create_task(self._poll())
+
+    def _read_available(self):
+        try:
+            data = self.port.read(self.port.in_waiting or 1)
+        except (serial.SerialException, OSError) as e:
+            self._lost(e)
+            return
+        if data:
+            self.feed(data)
+
+    def _on_readable(self):
+        self._read_available()
+
+    async def _poll(self):
+        while not self.closed:
+            if self.port.in_waiting:
+                self._read_available()
+            else:
+                await asyncio.sleep(0.002)
+
+    def send(self, data: bytes):
+        self.port.write(data)
+        self.stats.bytes_tx += len(data)
+
+    def _close_transport(self):
+        if self._fd is not None:
+            asyncio.get_running_loop().remove_reader(self._fd)
+            self._fd = None
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self.port is not None:
+            self.port.close()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, link):
+        self.link = link
+
+    def datagram_received(self, data, addr):
+        self.link.peer = addr
+        self.link.feed(data)
+
+    def error_received(self, exc):
+        self.link.stats.parse_errors += 1
+
+
+class UdpLink(MavlinkLink):
+    """
+    UDP 링크 (url: udpin:<ip>:<port>)
+    마지막으로 패킷을 보낸 주소로 송신합니다.
+    """
+
+    def __init__(self, link_id, url, host: str, port: int, on_message, on_closed=None):
+        super().__init__(link_id, url, on_message, on_closed)
+        self.host = host
+        self.port = port
+        self.peer = None
+        self._transport = None
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(self), local_addr=(self.host, self.port)
+        )
+
+    def send(self, data: bytes):
+        if self.peer is not None:
+            self._transport.sendto(data, self.peer)
+            self.stats.bytes_tx += len(data)
+
+    def _close_transport(self):
+        if self._transport is not None:
+            self._transport.close()
+
+
+class _StreamProtocol(asyncio.Protocol):
+    def __init__(self, link):
+        self.link = link
+
+    def data_received(self, data):
+        self.link.feed(data)
+
+    def connection_lost(self, exc):
+        self.link._lost(exc)
+
+
+class TcpLink(MavlinkLink):
+    """
+    TCP 링크 (url: tcp:<host>:<port>)
+    """
+
+    def __init__(self, link_id, url, host: str, port: int, on_message, on_closed=None):
+        super().__init__(link_id, url, on_message, on_closed)
+        self.host = host
+        self.port = port
+        self._transport = None
+
+    async def open(self):
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_connection(lambda: _StreamProtocol(self), self.host, self.port)
+
+    def send(self, data: bytes):
+        self._transport.write(data)
+        self.stats.bytes_tx += len(data)
+
+    def _close_transport(self):
+        if self._transport is not None:
+            self._transport.close()
+
+
+def create_link(link_id: str, url: str, on_message, on_closed=None) -> MavlinkLink:
+    """
+    url로 링크 객체를 만듭니다.
+     - serial:<device>:<baudrate>  (예: serial:/dev/ttyUSB0:921600, serial:COM3:57600)
+     - udpin:<ip>:<port>           (예: udpin:0.0.0.0:14550)
+     - tcp:<host>:<port>           (예: tcp:127.0.0.1:5760)
+    """
+    scheme, _, rest = url.partition(':')
+    address, _, number = rest.rpartition(':')
+    if not address or not number.isdigit():
+        raise ValueError(f"잘못된 링크 주소입니다: {url}")
+
+    if scheme == 'serial':
+        return SerialLink(link_id, url, address, int(number), on_message, on_closed)
+    if scheme == 'udpin':
+        return UdpLink(link_id, url, address, int(number), on_message, on_closed)
+    if scheme == 'tcp':
+        return TcpLink(link_id, url, address, int(number), on_message, on_closed)
+    raise ValueError(f"지원하지 않는 링크 종류입니다: {scheme}")
+
+
+class FrameDeduplicator:
+    """
+    여러 링크로 같은 MAVLink 프레임이 들어올 때 처음 것만 통과시키는 클래스
+     - seq는 링크마다 따로 증가하므로 쓰지 않고, 송신자 + msg_id + 페이로드 CRC로 같은 프레임인지 판단
+     - window(초) 안에 다른 링크에서 먼저 받은 프레임만 중복으로 봄
+       (같은 링크에서 값이 같은 메시지가 반복되는 것은 정상 수신)
+    """
+
+    def __init__(self, window: float = 1.0):
+        self.window = window
+        self._seen = {}  # (sysid, compid, msg_id, crc): (link_id, 수신 시각)
+        self._next_purge = 0.0
+
+    def clear(self):
+        self._seen = {}
+        self._next_purge = 0.0
+
+    def is_duplicate(self, link_id: str, source: tuple, msg_id: int, payload: bytes, now: float) -> bool:
+        if now >= self._next_purge:
+            # 오래된 항목 정리 (window마다 한 번)
+            self._seen = {key: seen for key, seen in self._seen.items() if now - seen[1] < self.window}
+            self._next_purge = now + self.window
+
+        key = (source[0], source[1], msg_id, zlib.crc32(payload))
+        seen = self._seen.get(key)
+        if seen is not None and seen[0] != link_id and now - seen[1] < self.window:
+            return True
+        self._seen[key] = (link_id, now)
+        return False
+
+
+class TransportLoop:
+    """
+    asyncio 이벤트 루프 하나를 백그라운드 스레드에서 실행하며 여러 링크를 동시에 처리하는 클래스
+    링크마다 스레드를 만들지 않으므로, 텔레메트리 무선 모뎀과 Wi-Fi를 동시에 연결해도 스레드는 하나입니다.
+    """
+
+    def __init__(self):
+        self.loop = None
+        self._thread = None
+        self.links = {}  # link_id: MavlinkLink
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        for link_id in list(self.links):
+            self.close_link(link_id)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        self.loop = None
+        self._thread = None
+
+    def call(self, func, *args, timeout: float = 5.0):
+        """
+        이벤트 루프 스레드에서 func(*args)를 실행하고 결과를 기다립니다.
+        """
+        async def runner():
+            result = func(*args)
+            if asyncio.iscoroutine(result):
+                result = await result
+            return result
+        return asyncio.run_coroutine_threadsafe(runner(), self.loop).result(timeout)
+
+    def open_link(self, link_id: str, url: str, on_message, on_closed=None) -> MavlinkLink:
+        """
+        링크를 열고 등록합니다. 실패하면 예외를 그대로 전달합니다.
+        """
+        self.start()
+
+        def closed(link):
+            self.links.pop(link.link_id, None)
+            if on_closed:
+                on_closed(link)
+
+        link = create_link(link_id, url, on_message, closed)
+        try:
+            self.call(link.open)
+        except Exception:
+            self.call(link.close)
+            raise
+        self.links[link_id] = link
+        return link
+
+    def close_link(self, link_id: str):
+        link = self.links.pop(link_id, None)
+        if link is not None:
+            self.call(link.close)
+
+    def send(self, link_id: str, data: bytes):
+        link = self.links.get(link_id)
+        if link is not None:
+            self.loop.call_soon_threadsafe(link.send, data)
@@ -9,3 +9,12 @@ def resource_path(relative_path: str) -> str:
     else:
         base_path = os.getcwd()
     return os.path.join(base_path, relative_path)
+
+
+def data_path(relative_path: str) -> str:
+    """ 실행 중에 만드는 캐시 파일 경로 (PyInstaller는 실행 파일 옆, 개발 중에는 src 폴더) """
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
@@ -0,0 +1,127 @@
+import time
+
+from pymavlink import mavutil
+
+# 기체가 아닌 MAVLink 장치 (HEARTBEAT를 보내도 기체 목록에 넣지 않음)
+NON_VEHICLE_TYPES = frozenset(
+    getattr(mavutil.mavlink, name) for name in (
+        'MAV_TYPE_GCS', 'MAV_TYPE_ONBOARD_CONTROLLER', 'MAV_TYPE_GIMBAL', 'MAV_TYPE_CAMERA',
+        'MAV_TYPE_ADSB', 'MAV_TYPE_ANTENNA_TRACKER', 'MAV_TYPE_FLARM', 'MAV_TYPE_SERVO', 'MAV_TYPE_ODID',
+        'MAV_TYPE_BATTERY', 'MAV_TYPE_CHARGING_STATION', 'MAV_TYPE_LOG', 'MAV_TYPE_OSD', 'MAV_TYPE_IMU',
+        'MAV_TYPE_GPS', 'MAV_TYPE_WINCH', 'MAV_TYPE_PARACHUTE',
+    ) if hasattr(mavutil.mavlink, name)
+)
+
+
+def is_vehicle_heartbeat(msg) -> bool:
+    """
+    오토파일럿이 보낸 기체 HEARTBEAT인지 확인합니다. (짐벌/카메라/컴패니언 컴퓨터/GCS 등은 제외)
+    """
+    return msg.autopilot != mavutil.mavlink.MAV_AUTOPILOT_INVALID and msg.type not in NON_VEHICLE_TYPES
+
+
+class Vehicle:
+    """
+    기체 1대(sysid, compid)의 상태 저장소
+     - msg_id별 마지막 메시지 객체의 참조만 보관 (복사/변환 없음)
+     - 기체 수가 늘어도 메시지 종류 수만큼의 참조만 늘어남
+    """
+
+    __slots__ = ('sysid', 'compid', 'vehicle_type', 'autopilot', 'first_seen', 'last_seen', 'latest')
+
+    def __init__(self, sysid: int, compid: int, now: float):
+        self.sysid = sysid
+        self.compid = compid
+        self.vehicle_type = 0
+        self.autopilot = 0
+        self.first_seen = now
+        self.last_seen = now
+        self.latest = {}  # msg_id: 마지막 메시지
+
+    @property
+    def key(self) -> tuple:
+        return self.sysid, self.compid
+
+    def to_dict(self, now: float = None) -> dict:
+        if now is None:
+            now = time.monotonic()
+        return {
+            'sysid': self.sysid,
+            'compid': self.compid,
+            'type': self.vehicle_type,
+            'autopilot': self.autopilot,
+            'age': now - self.last_seen,
+            'message_count': len(self.latest),
+        }
+
+
+class VehicleRegistry:
+    """
+    MAVLink 송신자(sysid, compid)별 기체 목록
+     - 오토파일럿 HEARTBEAT를 보낸 송신자만 기체로 등록 (is_vehicle_heartbeat, GCS/짐벌/카메라 등은 제외)
+     - 처음 등록된 기체를 기본 선택 기체(active)로 지정 (다른 장치가 먼저 연결되어도 PFD/ND를 가져가지 않음)
+     - 데이터 읽기 스레드에서만 수정하고, GUI 스레드는 목록을 통째로 교체된 dict로 읽음
+    """
+
+    def __init__(self):
+        self._vehicles = {}  # (sysid, compid): Vehicle
+        self.active = None   # 선택된 기체 (sysid, compid)
+
+    def clear(self):
+        self._vehicles = {}
+        self.active = None
+
+    def __len__(self):
+        return len(self._vehicles)
+
+    def get(self, key: tuple):
+        return self._vehicles.get(key)
+
+    def keys(self) -> list:
+        return list(self._vehicles)
+
+    def is_active(self, key: tuple) -> bool:
+        return self.active is None or key == self.active
+
+    def set_active(self, key: tuple) -> bool:
+        if key not in self._vehicles:
+            return False
+        self.active = key
+        return True
+
+    def update(self, key: tuple, msg_id: int, msg, now: float = None):
+        """
+        수신한 메시지를 송신자의 상태 저장소에 반영합니다.
+        (vehicle, 새로 등록되었는지)를 반환하며, 기체가 아닌 송신자이면 vehicle은 None입니다.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        vehicle = self._vehicles.get(key)
+        added = False
+        if vehicle is None:
+            if msg_id != 0 or not is_vehicle_heartbeat(msg):
+                return None, False
+            vehicle = Vehicle(key[0], key[1], now)
+            # GUI 스레드가 순회 중일 수 있으므로 교체 방식으로 추가
+            self._vehicles = {**self._vehicles, key: vehicle}
+            if self.active is None:
+                self.active = key
+            added = True
+
+        if msg_id == 0:
+            vehicle.vehicle_type = msg.type
+            vehicle.autopilot = msg.autopilot
+        vehicle.last_seen = now
+        vehicle.latest[msg_id] = msg
+        return vehicle, added
+
+    def snapshot(self) -> list:
+        """
+        기체 목록을 반환합니다. (QML 전달용)
+        """
+        now = time.monotonic()
+        return [
+            dict(vehicle.to_dict(now), active=key == self.active)
+            for key, vehicle in sorted(self._vehicles.items())
+        ]
@@ -0,0 +1,35 @@
+import QtQuick 2.15
+
+// 공용 그래프 WebEngineView(GraphViewPool)를 표시할 자리
+// pool이 지정되면 view를 가져와 표시하고, pool이 바뀌거나(null 포함) 삭제될 때 되돌린다.
+Item {
+    id: graphHost
+
+    property var pool: null
+    property var acquiredPool: null // view를 가져온 pool
+
+    // view가 이 자리에 있고 stream-data.html 로드가 끝났는지
+    readonly property bool htmlLoaded: pool !== null && pool.owner === graphHost && pool.view.htmlLoaded
+
+    function runJavaScript(code) {
+        if (graphHost.htmlLoaded) {
+            pool.view.runJavaScript(code);
+        }
+    }
+
+    onPoolChanged: {
+        if (acquiredPool) {
+            acquiredPool.release(graphHost);
+        }
+        acquiredPool = pool;
+        if (pool) {
+            pool.acquire(graphHost);
+        }
+    }
+
+    Component.onDestruction: {
+        if (acquiredPool) {
+            acquiredPool.release(graphHost);
+        }
+    }
+}
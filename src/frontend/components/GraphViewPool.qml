@@ -0,0 +1,66 @@
+import QtQuick 2.15
+import QtWebEngine 1.10
+
+// 그래프 페이지(센서값 시각화, 자세 시각화)가 함께 쓰는 그래프 WebEngineView
+// WebEngineView는 1개마다 Chromium 렌더러와 수백 MB의 메모리를 쓰므로 페이지마다 만들지 않고,
+// 처음 그래프 페이지를 열 때 1개만 만들어 GraphHost 사이에서 옮겨 쓴다.
+Item {
+    id: graphViewPool
+    visible: false
+
+    property var view: null    // 공용 WebEngineView (처음 acquire 전에는 null)
+    property Item owner: null  // 현재 view를 표시 중인 GraphHost
+
+    Component {
+        id: viewComponent
+
+        WebEngineView {
+            property bool htmlLoaded: false
+
+            url: Qt.resolvedUrl("uplot/stream-data.html")
+
+            onLoadingChanged: function (loadRequest) {
+                if (loadRequest.status === WebEngineView.LoadFailedStatus) {
+                    console.log("Failed to load:", loadRequest.errorString);
+                    htmlLoaded = false;
+                } else if (loadRequest.status === WebEngineView.LoadSucceededStatus) {
+                    console.log("Successfully loaded HTML file");
+                    htmlLoaded = true;
+                }
+            }
+
+            onJavaScriptConsoleMessage: function (level, message, lineNumber, sourceID) {
+                console.log("JS Console:", message);
+            }
+        }
+    }
+
+    // host 안에 view를 표시 (view가 없으면 이때 생성)
+    function acquire(host) {
+        if (view === null) {
+            // QObject 부모는 pool로 고정하고 화면상 부모(parent)만 바꿔가며 사용
+            // (host가 삭제되어도 view는 삭제되지 않음)
+            view = viewComponent.createObject(graphViewPool);
+        }
+        owner = host;
+        view.parent = host;
+        view.anchors.fill = host;
+        view.visible = true;
+        return view;
+    }
+
+    // host가 view를 표시 중이면 pool로 되돌림 (다른 host가 이미 가져갔으면 무시)
+    function release(host) {
+        if (view === null || owner !== host) {
+            return;
+        }
+        // 숨겨진 동안 스트림 데이터를 받지 않도록 접속 해제
+        if (view.htmlLoaded) {
+            view.runJavaScript("window.disconnectStream();");
+        }
+        view.visible = false;
+        view.anchors.fill = undefined;
+        view.parent = graphViewPool;
+        owner = null;
+    }
+}
@@ -0,0 +1,252 @@
+import QtQuick 2.15
+import QtQuick.Layouts 1.15
+import Colors 1.0
+import NaldaPlot 1.0
+
+// WebEngine 없이 Qt Quick 씬 그래프로 그리는 그래프 묶음 (uPlot 그래프와 같은 구성)
+// 같은 단위의 필드끼리 그래프 1개로 묶고, 마우스를 올린 위치의 커서를 모든 그래프에 함께 표시한다.
+ColumnLayout {
+    id: nativeGraph
+    spacing: 10
+
+    property var buffer: null     // 매니저의 plotBuffer (PlotRingBuffer)
+    property var fields: []       // 메시지 필드 목록 ({name, units, plot})
+    property int windowLength: 200
+    property real cursorX: NaN    // 모든 그래프가 공유하는 커서 위치 (x축 값)
+    property var groups: []       // 단위별 그래프 목록 ({title, fields, colors})
+
+    readonly property var timeFields: ["time_boot_ms", "time_usec"]
+    readonly property var defaultColors: ["#B1556A", "#6DB178", "#445AB1"]
+
+    onFieldsChanged: rebuild()
+    onBufferChanged: applyWindowLength()
+    onWindowLengthChanged: applyWindowLength()
+
+    function applyWindowLength() {
+        if (nativeGraph.buffer) {
+            nativeGraph.buffer.capacity = nativeGraph.windowLength;
+        }
+    }
+
+    // 단위별로 묶어 그래프 목록 생성 (stream-data.html의 initGraphOpts와 같은 규칙)
+    function rebuild() {
+        var grouped = {};
+        var order = [];
+        nativeGraph.fields.forEach(field => {
+            if (!field.plot || nativeGraph.timeFields.indexOf(field.name) >= 0) {
+                return;
+            }
+            var unit = field.units ? field.units : "#"; // units이 정의되지 않는 경우 '#'
+            if (!grouped[unit]) {
+                grouped[unit] = [];
+                order.push(unit);
+            }
+            grouped[unit].push(field.name);
+        });
+
+        nativeGraph.groups = order.map(unit => {
+            var names = grouped[unit];
+            var title;
+            if (unit === "#") {
+                title = "No Units";
+            } else if (names.length <= 3) {
+                title = `${names.join(" / ")} (${unit})`;
+            } else {
+                title = `${names[0]} / ... / ${names[names.length - 1]} (${unit})`;
+            }
+
+            var colors = nativeGraph.defaultColors;
+            if (names.length > 3) {
+                colors = names.map((name, i) => Qt.hsla(i / names.length, 0.3, 0.5, 1.0));
+            }
+            return {
+                title: title,
+                fields: names,
+                colors: colors
+            };
+        });
+    }
+
+    function formatValue(value) {
+        if (value === undefined || isNaN(value)) {
+            return "-";
+        }
+        return (value % 1) ? value.toFixed(5) : value.toString();
+    }
+
+    Repeater {
+        model: nativeGraph.groups
+
+        delegate: Rectangle {
+            id: graphCard
+            required property var modelData
+
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            color: Colors.backgroundSecondary
+            radius: 8
+
+            // 커서 위치(없으면 최신 샘플)의 필드별 값
+            property var legendValues: []
+
+            // 축 범위 (LinePlot이 데이터에 맞춰 계산)
+            property real xMin: 0
+            property real xMax: 1
+            property real yMin: 0
+            property real yMax: 1
+
+            function refreshRange() {
+                graphCard.xMin = plot.xMin;
+                graphCard.xMax = plot.xMax;
+                graphCard.yMin = plot.yMin;
+                graphCard.yMax = plot.yMax;
+                graphCard.refreshLegend();
+            }
+
+            function refreshLegend() {
+                var x = isNaN(nativeGraph.cursorX) ? graphCard.xMax : nativeGraph.cursorX;
+                graphCard.legendValues = plot.valuesAt(x);
+            }
+
+            Connections {
+                target: nativeGraph
+
+                function onCursorXChanged() {
+                    graphCard.refreshLegend();
+                }
+            }
+
+            ColumnLayout {
+                anchors.fill: parent
+                anchors.margins: 10
+                spacing: 6
+
+                Text {
+                    text: graphCard.modelData.title
+                    color: Colors.textPrimary
+                    font.pixelSize: 16
+                    font.bold: true
+                    Layout.alignment: Qt.AlignHCenter
+                }
+
+                RowLayout {
+                    Layout.fillWidth: true
+                    Layout.fillHeight: true
+                    spacing: 6
+
+                    // y축 눈금 값
+                    Item {
+                        Layout.preferredWidth: 60
+                        Layout.fillHeight: true
+
+                        Repeater {
+                            model: 5
+
+                            Text {
+                                required property int index
+                                y: parent.height * index / 4 - height / 2
+                                width: parent.width
+                                horizontalAlignment: Text.AlignRight
+                                text: (graphCard.yMax - (graphCard.yMax - graphCard.yMin) * index / 4).toPrecision(4)
+                                color: Colors.gray100
+                                font.pixelSize: 11
+                            }
+                        }
+                    }
+
+                    Item {
+                        Layout.fillWidth: true
+                        Layout.fillHeight: true
+                        clip: true
+
+                        // 가로 눈금선
+                        Repeater {
+                            model: 5
+
+                            Rectangle {
+                                required property int index
+                                y: Math.min(parent.height - 1, parent.height * index / 4)
+                                width: parent.width
+                                height: 1
+                                color: Colors.gray700
+                            }
+                        }
+
+                        LinePlot {
+                            id: plot
+                            anchors.fill: parent
+                            buffer: nativeGraph.buffer
+                            fields: graphCard.modelData.fields
+                            colors: graphCard.modelData.colors
+                            cursorX: nativeGraph.cursorX
+
+                            onRangeChanged: graphCard.refreshRange()
+                        }
+
+                        MouseArea {
+                            anchors.fill: parent
+                            hoverEnabled: true
+                            acceptedButtons: Qt.NoButton
+
+                            onPositionChanged: function (mouse) {
+                                nativeGraph.cursorX = plot.xAt(mouse.x);
+                            }
+                            onExited: nativeGraph.cursorX = NaN
+                        }
+                    }
+                }
+
+                // x축 범위
+                RowLayout {
+                    Layout.fillWidth: true
+                    Layout.leftMargin: 66
+
+                    Text {
+                        text: graphCard.xMin.toFixed(0)
+                        color: Colors.gray100
+                        font.pixelSize: 11
+                    }
+
+                    Item {
+                        Layout.fillWidth: true
+                    }
+
+                    Text {
+                        text: graphCard.xMax.toFixed(0)
+                        color: Colors.gray100
+                        font.pixelSize: 11
+                    }
+                }
+
+                // 범례 (필드 이름과 커서 위치 값)
+                Flow {
+                    Layout.fillWidth: true
+                    spacing: 14
+
+                    Repeater {
+                        model: graphCard.modelData.fields
+
+                        Row {
+                            required property int index
+                            required property string modelData
+                            spacing: 6
+
+                            Rectangle {
+                                width: 12
+                                height: 3
+                                anchors.verticalCenter: parent.verticalCenter
+                                color: graphCard.modelData.colors[index % graphCard.modelData.colors.length]
+                            }
+
+                            Text {
+                                text: `${modelData}: ${nativeGraph.formatValue(graphCard.legendValues[index])}`
+                                color: Colors.textPrimary
+                                font.pixelSize: 12
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,54 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+
+// 표시할 기체 선택 콤보박스
+// 기체가 2대 이상 감지된 경우에만 보이며, 선택은 모든 화면(센서 그래프, PFD, ND)에 함께 적용된다.
+ComboBox {
+    id: vehicleSelector
+
+    property var vehicles: []
+
+    visible: vehicles.length > 1
+    implicitWidth: 200
+    model: vehicles.map(vehicle => `SYS ${vehicle.sysid} / COMP ${vehicle.compid}`)
+    currentIndex: vehicles.findIndex(vehicle => vehicle.active)
+
+    background: Rectangle {
+        color: "#404040"
+        radius: 4
+        border.color: "#666666"
+        border.width: 1
+    }
+
+    contentItem: Text {
+        text: vehicleSelector.displayText
+        color: "white"
+        font.pixelSize: 14
+        leftPadding: 10
+        verticalAlignment: Text.AlignVCenter
+        elide: Text.ElideRight
+    }
+
+    function refresh() {
+        vehicleSelector.vehicles = serialManager.getVehicleList() || [];
+    }
+
+    Connections {
+        target: serialManager
+
+        function onVehiclesChanged() {
+            vehicleSelector.refresh();
+        }
+
+        function onActiveVehicleChanged(sysid, compid) {
+            vehicleSelector.refresh();
+        }
+    }
+
+    onActivated: function (index) {
+        var vehicle = vehicleSelector.vehicles[index];
+        serialManager.setActiveVehicle(vehicle.sysid, vehicle.compid);
+    }
+
+    Component.onCompleted: refresh()
+}
@@ -0,0 +1,37 @@
+import QtQuick 2.15
+import QtQuick.Controls 2.15
+
+// 그래프에 표시할 샘플 수 선택 콤보박스 (uPlot 그래프와 네이티브 그래프 공통)
+// 선택하면 windowSelected(length)를 보내며, 그래프를 다시 만드는 것은 사용하는 페이지에서 처리한다.
+ComboBox {
+    id: windowLengthSelector
+
+    property int windowLength: 200
+    readonly property var lengths: [200, 1000, 5000, 20000, 100000, 500000]
+
+    signal windowSelected(int length)
+
+    implicitWidth: 150
+    model: lengths.map(length => `${length.toLocaleString(Qt.locale("en_US"), 'f', 0)} 샘플`)
+    currentIndex: lengths.indexOf(windowLength)
+
+    background: Rectangle {
+        color: "#404040"
+        radius: 4
+        border.color: "#666666"
+        border.width: 1
+    }
+
+    contentItem: Text {
+        text: windowLengthSelector.displayText
+        color: "white"
+        font.pixelSize: 14
+        leftPadding: 10
+        verticalAlignment: Text.AlignVCenter
+        elide: Text.ElideRight
+    }
+
+    onActivated: function (index) {
+        windowLengthSelector.windowSelected(windowLengthSelector.lengths[index]);
+    }
+}
@@ -69,7 +69,19 @@ Rectangle {
                 anchors.fill: parent
 
                 source: mainWindow.pageMap.find(item => item.name === mainWindow.currentPage).source
+
+                // 그래프를 쓰는 페이지에 공용 그래프 WebView 전달
+                onLoaded: {
+                    if ("graphViewPool" in item) {
+                        item.graphViewPool = graphViewPool;
+                    }
+                }
             }
         }
     }
+
+    // 그래프 페이지들이 함께 쓰는 WebEngineView (처음 그래프 페이지를 열 때 생성되고, 페이지를 옮겨도 유지)
+    Components.GraphViewPool {
+        id: graphViewPool
+    }
 }
@@ -3,6 +3,7 @@ import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
 import QtLocation 5.15
 import QtPositioning 5.15
+import "../../../components" as Components
 
 
 Rectangle {
@@ -19,11 +20,39 @@ Rectangle {
             // console.log("QML Received GPS:", lat, lon, alt, hdg);
             var newCoordinate = QtPositioning.coordinate(lat, lon);
             map.center = newCoordinate;
-            // droneMarker의 coordinate는 pathData의 마지막 요소를 통해 자동으로 업데이트되므로 여기서 직접 설정할 필요가 없다.
+            // droneMarker의 coordinate는 trackModel의 마지막 지점(lastCoordinate)으로 자동으로 업데이트되므로 여기서 직접 설정할 필요가 없다.
             gpsInfoText.text = `[현재 위치]   위도: ${lat.toFixed(7)}   |   경도: ${lon.toFixed(7)}   |   방위각: ${hdg.toFixed(2)}°`;
         }
 
-        // pathData가 변경되면 MapPolyline과 MapItemView가 자동으로 업데이트하므로, onPathDataChanged 핸들러는 명시적으로 필요하지 않다.
+    }
+
+    // 경로 모델에 지점이 추가되면 추가된 지점만 꼬리 선에 이어 붙인다. (경로 전체를 다시 받지 않음)
+    Connections {
+        target: gpsManager ? gpsManager.trackModel : null
+
+        function onRowsInserted(parent, first, last) {
+            for (var i = first; i <= last; i++) {
+                tailLine.addCoordinate(gpsManager.trackModel.coordinateAt(i));
+            }
+        }
+    }
+
+    // 확대 수준/화면 범위에 맞춰 단순화한 경로로 교체 (화면 이동/확대, 기체 전환, 지점이 쌓였을 때)
+    Connections {
+        target: gpsManager ? gpsManager.trackLod : null
+
+        function onPathChanged() {
+            ndRoot.reloadTrack();
+        }
+    }
+
+    // 단순화한 경로는 마지막 지점까지 포함하므로 꼬리 선은 마지막 지점부터 다시 시작
+    function reloadTrack() {
+        if (!gpsManager) {
+            return;
+        }
+        trackLine.path = gpsManager.trackLod.path;
+        tailLine.path = gpsManager.trackModel.count > 0 ? [gpsManager.trackModel.lastCoordinate] : [];
     }
 
     Rectangle {
@@ -49,13 +78,39 @@ Rectangle {
                     anchors.fill: parent
                     plugin: Plugin {
                         name: "osm"   // OpenStreetMap 무료 지도
+                        // 타일은 로컬 타일 캐시(tileCache)를 거쳐 받음 (받은 적 있는 타일은 오프라인에서도 바로 표시)
+                        PluginParameter { name: "osm.mapping.custom.host"; value: tileCache ? tileCache.url : "" }
+                        PluginParameter { name: "osm.mapping.providersrepository.disabled"; value: true }
                     }
+                    // 로컬 타일 캐시를 쓰는 사용자 지정 지도 (osm 플러그인은 custom.host 지도를 목록 마지막에 추가)
+                    activeMapType: supportedMapTypes[supportedMapTypes.length - 1]
                     center: QtPositioning.coordinate(37.450767, 126.657016) // 초기 위치: 인하대
                     zoomLevel: 17
                     
                     // 줌 레벨 제한
                     minimumZoomLevel: 1
                     maximumZoomLevel: 20
+
+                    // 경로 단순화에 사용할 확대 수준과 화면 범위 전달
+                    function updateViewport() {
+                        if (!gpsManager || width <= 0 || height <= 0) {
+                            return;
+                        }
+                        var region = map.visibleRegion.boundingGeoRectangle();
+                        if (isNaN(region.topLeft.latitude) || isNaN(region.bottomRight.latitude)) {
+                            return; // 지도 초기화 전
+                        }
+                        gpsManager.trackLod.setViewport(map.zoomLevel,
+                            region.topLeft.latitude, region.topLeft.longitude,
+                            region.bottomRight.latitude, region.bottomRight.longitude);
+                    }
+
+                    onMapReadyChanged: updateViewport()
+                    onZoomLevelChanged: updateViewport()
+                    onCenterChanged: updateViewport()
+                    onWidthChanged: updateViewport()
+                    onHeightChanged: updateViewport()
+                    Component.onCompleted: updateViewport()
                     
                     // 드래그 기능 구현
                     MouseArea {
@@ -102,17 +157,26 @@ Rectangle {
 
                     // 드론 이동 경로 (실선)
                     MapPolyline {
-                        path: gpsManager ? gpsManager.pathCoordinates : []
+                        id: trackLine
                         line.color: "#FF0000" // 빨간색
                         line.width: 3
+
+                        Component.onCompleted: ndRoot.reloadTrack()
+                    }
+
+                    // 마지막 경로 교체 이후 추가된 지점 (실선)
+                    MapPolyline {
+                        id: tailLine
+                        line.color: "#FF0000"
+                        line.width: 3
                     }
 
                     // 과거 경로 지점들 (빨간 원 + 숫자)
                     MapItemView {
-                        // 현재 위치(마지막 점)를 제외한 모든 점을 모델로 사용
-                        model: gpsManager ? gpsManager.pathCoordinates.slice(0, gpsManager.pathCoordinates.length - 1) : []
+                        // 화면 안의 과거 지점만 (현재 위치는 droneMarker로 표시)
+                        model: gpsManager ? gpsManager.trackLod.markerModel : null
                         delegate: MapQuickItem {
-                            coordinate: modelData
+                            coordinate: model.coordinate
                             anchorPoint.x: 10
                             anchorPoint.y: 10
                             sourceItem: Rectangle {
@@ -123,7 +187,7 @@ Rectangle {
                                 border.width: 1
                                 Text {
                                     anchors.centerIn: parent
-                                    text: index + 1 // 경로 순서 (1부터 시작)
+                                    text: model.number // 경로 순서 (1부터 시작)
                                     color: "white"
                                     font.bold: true
                                     font.pixelSize: 10
@@ -137,8 +201,8 @@ Rectangle {
                         id: droneMarker
                         anchorPoint.x: 15
                         anchorPoint.y: 15
-                        // pathData가 비어있지 않으면 가장 마지막 좌표를 사용
-                        coordinate: (gpsManager && gpsManager.pathCoordinates.length > 0) ? gpsManager.pathCoordinates[gpsManager.pathCoordinates.length - 1] : QtPositioning.coordinate(37.450767, 126.657016)
+                        // 경로가 비어있지 않으면 가장 마지막 좌표를 사용
+                        coordinate: (gpsManager && gpsManager.trackModel.count > 0) ? gpsManager.trackModel.lastCoordinate : QtPositioning.coordinate(37.450767, 126.657016)
 
                         sourceItem: Rectangle {
                             width: 30; height: 30
@@ -149,7 +213,7 @@ Rectangle {
 
                             Text {
                                 anchors.centerIn: parent
-                                text: gpsManager ? gpsManager.pathCoordinates.length : 0 // 경로 순서
+                                text: gpsManager ? gpsManager.trackModel.count : 0 // 경로 순서
                                 color: "white"
                                 font.bold: true
                                 font.pixelSize: 14
@@ -157,6 +221,13 @@ Rectangle {
                         }
                     }
                 }
+
+                // 기체 선택 (기체가 2대 이상일 때만 표시)
+                Components.VehicleSelector {
+                    anchors.top: parent.top
+                    anchors.left: parent.left
+                    anchors.margins: 10
+                }
             }
 
             // GPS 정보 표시 텍스트
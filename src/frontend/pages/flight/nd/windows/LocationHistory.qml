@@ -74,7 +74,7 @@ Rectangle {
             id: historyView
             Layout.fillWidth: true
             Layout.fillHeight: true
-            model: gpsManager ? gpsManager.pathData : []
+            model: gpsManager ? gpsManager.trackModel : null
 
             delegate: Rectangle {
                 width: historyView.width
@@ -85,11 +85,11 @@ Rectangle {
                     anchors.fill: parent
 
                     // 헤더와 동일한 너비 계산 방식 적용
-                    Text { text: modelData.timestamp; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.bold: true; font.pixelSize: 18}
-                    Text { text: modelData.lat; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.pixelSize: 14}
-                    Text { text: modelData.lon; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.pixelSize: 14 }
-                    Text { text: modelData.alt; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.pixelSize: 14 }
-                    Text { text: modelData.hdg; color: "white"; Layout.fillWidth: true; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter }
+                    Text { text: model.timestamp; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.bold: true; font.pixelSize: 18}
+                    Text { text: model.lat; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.pixelSize: 14}
+                    Text { text: model.lon; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.pixelSize: 14 }
+                    Text { text: model.alt; color: "white"; Layout.preferredWidth: parent.width * 0.2; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter; font.pixelSize: 14 }
+                    Text { text: model.hdg; color: "white"; Layout.fillWidth: true; horizontalAlignment: Text.AlignHCenter; verticalAlignment: Text.AlignVCenter }
                 }
             }
 
@@ -1,37 +1,51 @@
 import QtQuick 2.15
 import QtQuick.Controls 2.15
 import QtQuick.Layouts 1.15
+import "../../../components" as Components
 
 Rectangle {
     id: pfdRoot
     anchors.fill: parent
     color: "#1a1a1a"
 
-    // PFD 컨트롤러 연결
+    // PFD 컨트롤러 연결 (모든 계기 값을 프레임당 1번 묶어서 받음)
     Connections {
         target: pfdManager
 
-        function onPitchAngleChanged(pitchAngle) {
-            pfdRoot.pitchAngle = pitchAngle;
+        function onFlightStateChanged() {
+            pfdRoot.applyFlightState(pfdManager.flightState);
         }
+    }
 
-        function onRollAngleChanged(rollAngle) {
-            pfdRoot.rollAngle = rollAngle;
+    // 계기 값을 한 번에 반영하고, 값이 바뀐 계기만 다시 그림
+    function applyFlightState(state) {
+        if (state.pitchAngle !== pfdRoot.pitchAngle) {
+            pfdRoot.pitchAngle = state.pitchAngle;
+            pitchGuidelines.requestPaint();
         }
-
-        function onAltitudeChanged(altitude) {
-            pfdRoot.altitude = altitude;
+        if (state.rollAngle !== pfdRoot.rollAngle) {
+            pfdRoot.rollAngle = state.rollAngle;
+            rollDial.requestPaint();
         }
-
-        function onAirspeedChanged(airspeed) {
-            pfdRoot.airspeed = airspeed;
+        // 속도/고도 테이프와 표시 값은 정수 단위로 그리므로 반올림 값이 바뀔 때만 다시 그림
+        if (Math.round(state.airspeed) !== Math.round(pfdRoot.airspeed)) {
+            airspeedScale.requestPaint();
+            airspeedReadout.requestPaint();
         }
-
-        function onHeadingChanged(heading) {
-            pfdRoot.heading = heading;
+        pfdRoot.airspeed = state.airspeed;
+        if (Math.round(state.altitude) !== Math.round(pfdRoot.altitude)) {
+            altitudeScale.requestPaint();
+            altitudeReadout.requestPaint();
+        }
+        pfdRoot.altitude = state.altitude;
+        if (Math.round(state.heading) !== Math.round(pfdRoot.heading)) {
+            headingScale.requestPaint();
         }
+        pfdRoot.heading = state.heading;
     }
 
+    Component.onCompleted: applyFlightState(pfdManager.flightState)
+
     // PFD 크기와 위치를 위한 속성
     property real pitchAngle: 0  // 피치 각도 (도)
     property real rollAngle: 0   // 롤 각도 (도)
@@ -318,6 +332,7 @@ Rectangle {
         }
         // 중앙 화살표 박스 (속도)
         Canvas {
+            id: airspeedReadout
             width: 48
             height: 32
             anchors.horizontalCenter: parent.horizontalCenter
@@ -394,6 +409,7 @@ Rectangle {
         }
         // 중앙 화살표 박스 (고도)
         Canvas {
+            id: altitudeReadout
             width: 60
             height: 32
             anchors.horizontalCenter: parent.horizontalCenter
@@ -436,14 +452,6 @@ Rectangle {
             id: headingScale
             anchors.fill: parent
 
-            // heading 값이 변경될 때마다 다시 그리기
-            Connections {
-                target: pfdRoot
-                function onHeadingChanged() {
-                    headingScale.requestPaint();
-                }
-            }
-
             onPaint: {
                 var ctx = getContext("2d");
                 ctx.clearRect(0, 0, width, height);
@@ -563,6 +571,14 @@ Rectangle {
         }
     }
 
+    // 기체 선택 (좌측 상단, 기체가 2대 이상일 때만 표시)
+    Components.VehicleSelector {
+        anchors.top: parent.top
+        anchors.left: parent.left
+        anchors.margins: 16
+        z: 200
+    }
+
     // 시뮬레이션 토글 버튼 (우측 상단)
     // Button {
     //     id: simToggleBtn
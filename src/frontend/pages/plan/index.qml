@@ -574,6 +574,84 @@ Rectangle {
                                     font.bold: true
                                 }
 
+                                // 웨이포인트 주변 지도 타일 미리 받기 (현장에서 오프라인으로 사용)
+                                RowLayout {
+                                    Layout.fillWidth: true
+                                    spacing: 10
+
+                                    Text {
+                                        text: "지도 미리 받기 (확대 수준)"
+                                        color: "#cccccc"
+                                        font.pixelSize: 12
+                                    }
+
+                                    SpinBox {
+                                        id: prefetchMinZoom
+                                        from: 1
+                                        to: 19
+                                        value: 12
+                                        Layout.preferredWidth: 100
+                                    }
+
+                                    Text {
+                                        text: "~"
+                                        color: "#cccccc"
+                                        font.pixelSize: 12
+                                    }
+
+                                    SpinBox {
+                                        id: prefetchMaxZoom
+                                        from: 1
+                                        to: 19
+                                        value: 17
+                                        Layout.preferredWidth: 100
+                                    }
+
+                                    Button {
+                                        text: tileCache && tileCache.prefetching ? "취소" : "미리 받기"
+                                        Layout.preferredWidth: 90
+                                        enabled: tileCache !== null && (tileCache.prefetching || waypoints.length > 0)
+
+                                        background: Rectangle {
+                                            color: parent.pressed ? "#1976D2" : "#2196F3"
+                                            radius: 6
+                                        }
+
+                                        contentItem: Text {
+                                            text: parent.text
+                                            color: "white"
+                                            horizontalAlignment: Text.AlignHCenter
+                                            verticalAlignment: Text.AlignVCenter
+                                            font.pixelSize: 14
+                                        }
+
+                                        onClicked: {
+                                            if (tileCache.prefetching) {
+                                                tileCache.cancelPrefetch();
+                                            } else {
+                                                tileCache.prefetchRegion(waypoints, prefetchMinZoom.value, prefetchMaxZoom.value, 500);
+                                            }
+                                        }
+                                    }
+
+                                    Text {
+                                        Layout.fillWidth: true
+                                        text: tileCache && tileCache.prefetching ? `${tileCache.prefetchDone} / ${tileCache.prefetchTotal}` : ""
+                                        color: "#cccccc"
+                                        font.pixelSize: 12
+                                    }
+                                }
+
+                                // 공개 OSM 서버 사용 정책으로 일부 타일을 받지 않았을 때 안내
+                                Text {
+                                    Layout.fillWidth: true
+                                    visible: text !== ""
+                                    text: tileCache ? tileCache.prefetchWarning : ""
+                                    color: "#FFA726"
+                                    font.pixelSize: 12
+                                    wrapMode: Text.WordWrap
+                                }
+
                                 ListView {
                                     Layout.fillWidth: true
                                     Layout.fillHeight: true
@@ -765,7 +843,12 @@ Rectangle {
                                         anchors.fill: parent
                                         plugin: Plugin {
                                             name: "osm"   // OpenStreetMap 무료 지도
+                                            // 타일은 로컬 타일 캐시(tileCache)를 거쳐 받음 (받은 적 있는 타일은 오프라인에서도 바로 표시)
+                                            PluginParameter { name: "osm.mapping.custom.host"; value: tileCache ? tileCache.url : "" }
+                                            PluginParameter { name: "osm.mapping.providersrepository.disabled"; value: true }
                                         }
+                                        // 로컬 타일 캐시를 쓰는 사용자 지정 지도 (osm 플러그인은 custom.host 지도를 목록 마지막에 추가)
+                                        activeMapType: supportedMapTypes[supportedMapTypes.length - 1]
                                         center: QtPositioning.coordinate(37.450767, 126.657016) // 초기 위치: 인하대
                                         zoomLevel: 15
 
@@ -2,8 +2,8 @@ import QtQuick 2.15
 import QtQuick.Layouts 1.15
 import QtQuick.Controls 2.15
 import QtQuick.Controls.Material 2.15
-import QtWebEngine 1.10
 import Colors 1.0
+import "../../../components" as Components
 
 ColumnLayout {
     id: attitudeOverviewRoot
@@ -12,7 +12,21 @@ ColumnLayout {
     property var messageFrame: []
     property int attitudeMessageId: 30
 
-    property bool htmlLoaded: false
+    property var graphViewPool: null // 공용 그래프 WebView (setup/index.qml에서 지정)
+    property bool htmlLoaded: graphView.htmlLoaded
+    property bool nativePlot: false // false: uPlot 그래프 (WebEngine, 기본값), true: 네이티브 그래프(LinePlot)
+    property int graphWindowLength: 200 // 그래프에 표시할 샘플 수 (200 ~ 수십만, WindowLengthSelector에서 변경)
+
+    // 1초마다 수신 주기를 확인하여 그래프 그리기 주기를 맞춤 (수신 주기보다 자주 그리지 않음)
+    Timer {
+        interval: 1000
+        running: attitudeOverviewRoot.htmlLoaded
+        repeat: true
+        onTriggered: {
+            var hz = serialManager.getMessageHz(attitudeOverviewRoot.attitudeMessageId);
+            graphView.runJavaScript(`window.setIncomingRate(${hz});`);
+        }
+    }
 
     property real rollAngle: 0
     property real pitchAngle: 0
@@ -21,32 +35,48 @@ ColumnLayout {
     property bool showFixedAxes: true
     property bool showHelperAxes: true
 
-    // htmlLoaded 변경 감지 핸들러 추가
     // 30번 ATTITUDE를 받아오도록 수정
-    onHtmlLoadedChanged: {
-        if (htmlLoaded) {
-            var metaData = attitudeOverviewManager.setTargetMessage(attitudeOverviewRoot.attitudeMessageId);
+    Component.onCompleted: {
+        var metaData = attitudeOverviewManager.setTargetMessage(attitudeOverviewRoot.attitudeMessageId);
 
-            // 단위를 rad에서 degree로 변환
-            for (var i = 0; i < metaData.fields.length; i++) {
-                if (metaData.fields[i].units === "rad") {
-                    metaData.fields[i].units = "degree";
-                }
-                if (metaData.fields[i].units === "rad/s") {
-                    metaData.fields[i].units = "degree/s";
-                }
+        // 단위를 rad에서 degree로 변환
+        for (var i = 0; i < metaData.fields.length; i++) {
+            if (metaData.fields[i].units === "rad") {
+                metaData.fields[i].units = "degree";
+            }
+            if (metaData.fields[i].units === "rad/s") {
+                metaData.fields[i].units = "degree/s";
             }
+        }
+
+        attitudeOverviewRoot.messageFrame = metaData.fields;
+    }
 
-            attitudeOverviewRoot.messageFrame = metaData.fields;
+    // htmlLoaded 변경 감지 핸들러 (uPlot 그래프로 전환할 때마다 스트림 접속 후 그래프 생성)
+    onHtmlLoadedChanged: {
+        if (htmlLoaded) {
+            // 그래프 데이터 스트림 접속 (WebSocket 바이너리)
+            var url = attitudeOverviewManager.getStreamUrl();
+            var channel = attitudeOverviewManager.getStreamChannel();
+            graphView.runJavaScript(`window.connectStream(${JSON.stringify(url)}, ${JSON.stringify(channel)});`);
 
-            var hz = serialManager.getMessageHz(attitudeOverviewRoot.attitudeMessageId);
-            var dataToSend = {
-                fields: attitudeOverviewRoot.messageFrame,
-                hz: hz
-            };
-            var jsCode = `window.receiveGraphMetaData(${JSON.stringify(dataToSend)});`;
-            webView.runJavaScript(jsCode);
+            initGraph();
+        }
+    }
+
+    // uPlot 그래프 생성 (네이티브 그래프는 windowLength 바인딩으로 버퍼 크기만 바뀜)
+    function initGraph() {
+        if (attitudeOverviewRoot.nativePlot || !attitudeOverviewRoot.htmlLoaded) {
+            return;
         }
+        var hz = serialManager.getMessageHz(attitudeOverviewRoot.attitudeMessageId);
+        var dataToSend = {
+            fields: attitudeOverviewRoot.messageFrame,
+            hz: hz,
+            window: attitudeOverviewRoot.graphWindowLength
+        };
+        var jsCode = `window.receiveGraphMetaData(${JSON.stringify(dataToSend)});`;
+        graphView.runJavaScript(jsCode);
     }
 
     // 메시지 업데이트 수신용 Connection
@@ -54,25 +84,15 @@ ColumnLayout {
         target: attitudeOverviewManager
 
         function onMessageUpdated(data) {
-            // 자세 업데이트
+            // 3D 모델 자세 업데이트 (프레임마다 최신값만)
             // 30번 ATTITUDE 값은 rad 이므로 변환
-            data.roll = data.roll * 180 / 3.14592;
-            data.pitch = data.pitch * 180 / 3.14592;
-            data.yaw = data.yaw * 180 / 3.14592;
-
-            // 3D 모델 자세 업데이트
-            attitudeOverviewRoot.rollAngle = data.roll;
-            attitudeOverviewRoot.pitchAngle = data.pitch;
-            attitudeOverviewRoot.yawAngle = data.yaw;
-
-            // HTML이 완전히 로드된 경우에만 JavaScript 함수 호출
-            if (attitudeOverviewRoot.htmlLoaded) {
-                var jsCode = `window.receiveData(${JSON.stringify(data)});`;
-                webView.runJavaScript(jsCode);
-            } else {
-                console.log("HTML이 아직 로드되지 않았습니다. 데이터 무시:");
-            }
+            attitudeOverviewRoot.rollAngle = data.roll * 180 / 3.14592;
+            attitudeOverviewRoot.pitchAngle = data.pitch * 180 / 3.14592;
+            attitudeOverviewRoot.yawAngle = data.yaw * 180 / 3.14592;
         }
+
+        // 그래프 데이터는 QML을 거치지 않고 GraphStreamServer에서 WebView로 바이너리로 직접 전달
+        // (rad 단위 필드는 AttitudeOverviewManager에서 degree로 변환)
     }
 
     // 상단 제목
@@ -184,6 +204,36 @@ ColumnLayout {
                             attitudeOverviewRoot.showHelperAxes = checked;
                         }
                     }
+
+                    // 그래프 종류 선택
+                    CheckBox {
+                        id: nativePlotCheckBox
+                        text: "네이티브 그래프"
+                        checked: attitudeOverviewRoot.nativePlot
+                        Material.accent: Colors.green
+
+                        contentItem: Text {
+                            text: nativePlotCheckBox.text
+                            color: Colors.textPrimary
+                            font.pixelSize: 14
+                            leftPadding: nativePlotCheckBox.indicator.width + nativePlotCheckBox.spacing
+                            verticalAlignment: Text.AlignVCenter
+                        }
+
+                        onToggled: {
+                            attitudeOverviewRoot.nativePlot = checked;
+                        }
+                    }
+
+                    // 그래프에 표시할 샘플 수
+                    Components.WindowLengthSelector {
+                        windowLength: attitudeOverviewRoot.graphWindowLength
+
+                        onWindowSelected: function (length) {
+                            attitudeOverviewRoot.graphWindowLength = length;
+                            initGraph();
+                        }
+                    }
                 }
 
                 // 그래프 영역
@@ -192,25 +242,21 @@ ColumnLayout {
                     Layout.preferredHeight: 450 * 2 // 그래프 개수
                     Layout.topMargin: 30
 
-                    WebEngineView {
-                        id: webView
+                    // 네이티브 그래프
+                    Components.NativeGraph {
                         anchors.fill: parent
-                        url: Qt.resolvedUrl("../../../components/uplot/stream-data.html")
-                        // url: "src:/pages/setup/attitude-overview/uplot/stream-data.html"
-
-                        onLoadingChanged: function (loadRequest) {
-                            if (loadRequest.status === WebEngineView.LoadFailedStatus) {
-                                console.log("Failed to load:", loadRequest.errorString);
-                                attitudeOverviewRoot.htmlLoaded = false;
-                            } else if (loadRequest.status === WebEngineView.LoadSucceededStatus) {
-                                console.log("Successfully loaded HTML file");
-                                attitudeOverviewRoot.htmlLoaded = true;
-                            }
-                        }
+                        visible: attitudeOverviewRoot.nativePlot
+                        buffer: attitudeOverviewRoot.nativePlot ? attitudeOverviewManager.plotBuffer : null
+                        fields: attitudeOverviewRoot.messageFrame
+                        windowLength: attitudeOverviewRoot.graphWindowLength
+                    }
 
-                        onJavaScriptConsoleMessage: function (level, message, lineNumber, sourceID) {
-                            console.log("JS Console:", message);
-                        }
+                    // 공용 WebEngineView를 이 자리에 표시 (uPlot 그래프를 선택한 경우에만 가져옴)
+                    Components.GraphHost {
+                        id: graphView
+                        anchors.fill: parent
+                        visible: !attitudeOverviewRoot.nativePlot
+                        pool: attitudeOverviewRoot.nativePlot ? null : attitudeOverviewRoot.graphViewPool
                     }
 
                     // 마우스 휠 이벤트를 스크롤로 전달
@@ -603,6 +603,54 @@ ColumnLayout {
                     font.weight: 500
                 }
             }
+
+            // 비행 기록 (연결된 동안 수신 데이터를 logs/ 아래에 저장)
+            Button {
+                id: recordButton
+                Layout.preferredHeight: 40
+                Layout.preferredWidth: 300
+                Layout.topMargin: 10
+                visible: connectSerialRoot.isConnected && !connectSerialRoot.connectionLoading
+                text: serialManager.recording ? "기록 종료" : "기록 시작"
+                background: Rectangle {
+                    color: recordMouseArea.containsMouse ? Qt.darker(Colors.gray600, 1.05) : Colors.gray600
+                    border.color: serialManager.recording ? Colors.red : "transparent"
+                    radius: 8
+                }
+                contentItem: Text {
+                    text: recordButton.text
+                    color: serialManager.recording ? Colors.red : Colors.textPrimary
+                    font.pixelSize: 14
+                    font.weight: 700
+                    horizontalAlignment: Text.AlignHCenter
+                    verticalAlignment: Text.AlignVCenter
+                }
+
+                MouseArea {
+                    id: recordMouseArea
+                    anchors.fill: parent
+                    hoverEnabled: true
+                    cursorShape: Qt.PointingHandCursor
+
+                    onClicked: {
+                        if (serialManager.recording) {
+                            serialManager.stopRecording();
+                        } else {
+                            serialManager.startRecording("");
+                        }
+                    }
+                }
+            }
+
+            // 비행 기록 상태 표시 (파일 경로 또는 쓰기 오류)
+            Text {
+                Layout.preferredWidth: 300
+                visible: text !== ""
+                text: serialManager.recordingStatus
+                color: serialManager.recordingStatus.startsWith("기록 오류") ? Colors.red : Colors.gray100
+                font.pixelSize: 12
+                wrapMode: Text.WrapAnywhere
+            }
         }
     }
 
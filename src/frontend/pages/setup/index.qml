@@ -31,6 +31,7 @@ Rectangle {
         ,
     ]
     property int selectedMenuId: 1
+    property var graphViewPool: null // 그래프 페이지에 전달할 공용 WebView (main.qml에서 지정)
 
     RowLayout {
         anchors.fill: parent
@@ -61,6 +62,12 @@ Rectangle {
                 anchors.fill: parent
 
                 source: setupPage.menuItems.find(item => item.id === setupPage.selectedMenuId).source
+
+                onLoaded: {
+                    if ("graphViewPool" in item) {
+                        item.graphViewPool = Qt.binding(() => setupPage.graphViewPool);
+                    }
+                }
             }
         }
     }
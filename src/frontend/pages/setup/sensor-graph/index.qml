@@ -2,8 +2,8 @@ import QtQuick 2.15
 import QtQuick.Layouts 1.15
 import QtQuick.Controls 2.15
 import QtQuick.Controls.Material 2.15
-import QtWebEngine 1.10
 import Colors 1.0
+import "../../../components" as Components
 
 ColumnLayout {
     id: sensorGraphRoot
@@ -31,20 +31,47 @@ ColumnLayout {
     ]
     property var selectedMessageValues: [] // 일부러 messageFrame과 분리, 지속적인 업데이트를 하다보니 plot의 checkbox가 흔들림
 
-    property bool htmlLoaded: false
+    property var graphViewPool: null // 공용 그래프 WebView (setup/index.qml에서 지정)
+    property bool htmlLoaded: graphView.htmlLoaded
+    property bool nativePlot: false // false: uPlot 그래프 (WebEngine, 기록 확대/이동 지원, 기본값), true: 네이티브 그래프(LinePlot)
+    property int graphWindowLength: 200 // 그래프에 표시할 샘플 수 (200 ~ 수십만, WindowLengthSelector에서 변경)
+    property real incomingHz: 0 // 선택된 메시지의 수신 주기
+
+    // 1초마다 수신 주기를 확인하여 그래프 그리기 주기를 맞춤 (수신 주기보다 자주 그리지 않음)
+    Timer {
+        interval: 1000
+        running: true
+        repeat: true
+        onTriggered: {
+            sensorGraphRoot.incomingHz = serialManager.getMessageHz(sensorGraphRoot.selectedMessageId);
+            if (sensorGraphRoot.htmlLoaded) {
+                graphView.runJavaScript(`window.setIncomingRate(${sensorGraphRoot.incomingHz});`);
+            }
+        }
+    }
 
-    // htmlLoaded 변경 감지 핸들러
-    // 처음에 첫 번째 메시지 선택해서 출력
+    // htmlLoaded 변경 감지 핸들러 (uPlot 그래프로 전환할 때마다 스트림 접속 후 그래프 생성)
     onHtmlLoadedChanged: {
-        if (htmlLoaded && sensorGraphRoot.messageList.length > 0) {
-            sensorGraphRoot.selectedMessageId = sensorGraphRoot.messageList[0].id;
-            setTargetMessage(sensorGraphRoot.selectedMessageId);
+        if (htmlLoaded) {
+            connectStream();
+            initGraph();
+        }
+    }
+
+    onNativePlotChanged: {
+        if (nativePlot) {
+            initGraph();
         }
     }
 
     // messageList 초기화
+    // 처음에 첫 번째 메시지 선택해서 출력
     Component.onCompleted: {
         sensorGraphRoot.messageList = serialManager.getMessageList() || [];
+        if (sensorGraphRoot.messageList.length > 0) {
+            sensorGraphRoot.selectedMessageId = sensorGraphRoot.messageList[0].id;
+            setTargetMessage(sensorGraphRoot.selectedMessageId);
+        }
     }
 
     // 메시지 업데이트 수신용 Connection
@@ -52,25 +79,37 @@ ColumnLayout {
         target: sensorGraphManager
 
         function onMessageUpdated(data) {
-            // table의 value 업데이트
+            // table의 value 업데이트 (프레임마다 최신값만)
             sensorGraphRoot.selectedMessageValues = messageFrame.map(field => data[field.name]);
+        }
 
-            // HTML이 완전히 로드된 경우에만 JavaScript 함수 호출
-            if (sensorGraphRoot.htmlLoaded) {
-                var jsCode = `window.receiveData(${JSON.stringify(data)});`;
-                webView.runJavaScript(jsCode);
-            } else {
-                console.log("HTML이 아직 로드되지 않았습니다. 데이터 무시:");
-            }
+        // 그래프 데이터는 QML을 거치지 않고 GraphStreamServer에서 WebView로 바이너리로 직접 전달
+    }
+
+    // 기체 선택이 바뀌면 이전 기체의 그래프를 지우고 다시 그림
+    Connections {
+        target: serialManager
+
+        function onActiveVehicleChanged(sysid, compid) {
+            initGraph();
         }
     }
 
     // 상단 제목
-    Text {
-        text: "센서값 시각화"
-        color: Colors.textPrimary
-        font.pixelSize: 24
-        font.bold: true
+    RowLayout {
+        Layout.fillWidth: true
+
+        Text {
+            text: "센서값 시각화"
+            color: Colors.textPrimary
+            font.pixelSize: 24
+            font.bold: true
+            Layout.fillWidth: true
+        }
+
+        // 기체 선택 (기체가 2대 이상일 때만 표시)
+        Components.VehicleSelector {
+        }
     }
 
     // 컨텐츠 영역
@@ -409,14 +448,48 @@ ColumnLayout {
                     }
                 }
 
-                // 업데이트 주기 표시
-                Text {
-                    text: "rate: " + (serialManager.getMessageHz(sensorGraphRoot.selectedMessageId).toFixed(2)) + " Hz"
-                    color: Colors.textPrimary
-                    font.pixelSize: 14
+                RowLayout {
                     Layout.fillWidth: true
                     Layout.topMargin: 5
-                    horizontalAlignment: Text.AlignRight
+
+                    // 그래프 종류 선택
+                    CheckBox {
+                        id: nativePlotCheckBox
+                        text: "네이티브 그래프"
+                        checked: sensorGraphRoot.nativePlot
+                        Material.accent: Colors.green
+
+                        contentItem: Text {
+                            text: nativePlotCheckBox.text
+                            color: Colors.textPrimary
+                            font.pixelSize: 14
+                            leftPadding: nativePlotCheckBox.indicator.width + nativePlotCheckBox.spacing
+                            verticalAlignment: Text.AlignVCenter
+                        }
+
+                        onToggled: {
+                            sensorGraphRoot.nativePlot = checked;
+                        }
+                    }
+
+                    // 그래프에 표시할 샘플 수
+                    Components.WindowLengthSelector {
+                        windowLength: sensorGraphRoot.graphWindowLength
+
+                        onWindowSelected: function (length) {
+                            sensorGraphRoot.graphWindowLength = length;
+                            initGraph();
+                        }
+                    }
+
+                    // 업데이트 주기 표시
+                    Text {
+                        text: "rate: " + sensorGraphRoot.incomingHz.toFixed(2) + " Hz"
+                        color: Colors.textPrimary
+                        font.pixelSize: 14
+                        Layout.fillWidth: true
+                        horizontalAlignment: Text.AlignRight
+                    }
                 }
 
                 // 그래프
@@ -425,24 +498,22 @@ ColumnLayout {
                     Layout.preferredHeight: 450 * (new Set(sensorGraphRoot.messageFrame.slice(1).map(f => f.units)).size) // 그래프 개수
                     Layout.topMargin: 30
 
-                    WebEngineView {
-                        id: webView
+                    // 네이티브 그래프
+                    Components.NativeGraph {
+                        id: nativeGraph
                         anchors.fill: parent
-                        url: Qt.resolvedUrl("../../../components/uplot/stream-data.html")
-
-                        onLoadingChanged: function (loadRequest) {
-                            if (loadRequest.status === WebEngineView.LoadFailedStatus) {
-                                console.log("Failed to load:", loadRequest.errorString);
-                                sensorGraphRoot.htmlLoaded = false;
-                            } else if (loadRequest.status === WebEngineView.LoadSucceededStatus) {
-                                console.log("Successfully loaded HTML file");
-                                sensorGraphRoot.htmlLoaded = true;
-                            }
-                        }
+                        visible: sensorGraphRoot.nativePlot
+                        buffer: sensorGraphRoot.nativePlot ? sensorGraphManager.plotBuffer : null
+                        fields: sensorGraphRoot.messageFrame
+                        windowLength: sensorGraphRoot.graphWindowLength
+                    }
 
-                        onJavaScriptConsoleMessage: function (level, message, lineNumber, sourceID) {
-                            console.log("JS Console:", message);
-                        }
+                    // 공용 WebEngineView를 이 자리에 표시 (uPlot 그래프를 선택한 경우에만 가져옴)
+                    Components.GraphHost {
+                        id: graphView
+                        anchors.fill: parent
+                        visible: !sensorGraphRoot.nativePlot
+                        pool: sensorGraphRoot.nativePlot ? null : sensorGraphRoot.graphViewPool
                     }
 
                     // 웹엔진뷰 위의 마우스 영역
@@ -477,16 +548,26 @@ ColumnLayout {
         initGraph();
     }
 
+    // 그래프 데이터 스트림 접속 (WebSocket 바이너리)
+    function connectStream() {
+        var url = sensorGraphManager.getStreamUrl();
+        var channel = sensorGraphManager.getStreamChannel();
+        graphView.runJavaScript(`window.connectStream(${JSON.stringify(url)}, ${JSON.stringify(channel)});`);
+    }
+
     function initGraph() {
-        if (sensorGraphRoot.htmlLoaded) {
+        if (sensorGraphRoot.nativePlot) {
+            nativeGraph.rebuild(); // plot 체크 변경은 messageFrame 안에서만 바뀌므로 직접 다시 묶음
+        } else if (sensorGraphRoot.htmlLoaded) {
             // 메시지의 Hz 정보 가져오기
             var hz = serialManager.getMessageHz(sensorGraphRoot.selectedMessageId);
             var dataToSend = {
                 fields: sensorGraphRoot.messageFrame,
-                hz: hz
+                hz: hz,
+                window: sensorGraphRoot.graphWindowLength
             };
             var jsCode = `window.receiveGraphMetaData(${JSON.stringify(dataToSend)});`;
-            webView.runJavaScript(jsCode);
+            graphView.runJavaScript(jsCode);
         } else {
             console.log("HTML이 아직 로드되지 않았습니다.");
         }
@@ -4,7 +4,9 @@ import sys
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QSplashScreen
 from PySide6.QtGui import QFontDatabase, QFont, QPixmap, QIcon
-from PySide6.QtWebEngineQuick import QtWebEngineQuick  # linux trouble shooting: 사용하지는 않지만 import 해야 QtWebEngine이 작동함
+# linux trouble shooting: 사용하지는 않지만 QApplication 생성 전에 import 해야 QtWebEngine이 작동함
+# (모듈만 불러오며, Chromium 렌더러는 그래프 페이지를 처음 열 때 GraphViewPool에서 1개만 생성됨)
+from PySide6.QtWebEngineQuick import QtWebEngineQuick
 
 from windows.main_window import MainWindow
 from backend.utils import resource_path
@@ -7,11 +7,14 @@ from backend.sensor_graph_manager import SensorGraphManager
 from backend.attitude_overview_manger import AttitudeOverviewManager
 from backend.tooltip_manager import TooltipManager
 from backend.serial_manager import SerialManager
+from backend.graph_stream_server import GraphStreamServer
 from backend.dock_manager import DockManager
 from backend.gps_manager import GpsManager
 from backend.resource_manager import ResourceManager
 from backend.pfd_maganer import PFDManager
 from backend.parameter_setting_manager import ParameterSettingManager
+from backend.tile_cache import TileCacheServer
+from backend.line_plot_item import LinePlot  # noqa: F401 (QML 타입 등록: import NaldaPlot 1.0)
 
 from backend.utils import resource_path
 
@@ -94,19 +97,25 @@ class MainWindow(QMainWindow):
         self.dock_manager = DockManager(self)
         self.serial_manager = SerialManager()
         self.gps_manager = GpsManager()
-        self.sensor_graph_manager = SensorGraphManager()
-        self.attitude_overview_manager = AttitudeOverviewManager()
+        self.graph_stream_server = GraphStreamServer()  # 그래프 WebView로 바이너리 데이터 전송
+        self.tile_cache = TileCacheServer()  # 지도 타일 캐시 (ND/Plan 지도가 공유)
+        self.sensor_graph_manager = SensorGraphManager(self.serial_manager, self.graph_stream_server)
+        self.attitude_overview_manager = AttitudeOverviewManager(self.serial_manager, self.graph_stream_server)
         self.resource_manager = ResourceManager()
         self.parameter_setting_manager = ParameterSettingManager()
 
         # 독 전용 컨텍스트
         self.pfd_manager = PFDManager()
 
-        # serial 데이터 업데이트 이벤트 등록
-        self.serial_manager.messageUpdated.connect(self.sensor_graph_manager.get_data)
-        self.serial_manager.messageUpdated.connect(self.attitude_overview_manager.get_data)
-        self.serial_manager.messageUpdated.connect(self.pfd_manager.get_data)
-        # self.serial_manager.messageUpdated.connect(self.gps_backend.get_data) # gps도 연결 필요
+        # serial 데이터 구독
+        # 센서 그래프와 자세 시각화는 setTargetMessage에서 선택한 메시지만 구독
+        self.serial_manager.subscribe(PFDManager.MESSAGE_IDS, self.pfd_manager.get_data)
+        # 경로는 선택되지 않은 기체도 기록 (기체 전환 시 바로 표시)
+        self.serial_manager.subscribe(GpsManager.MESSAGE_IDS, self.gps_manager.get_data, all_vehicles=True)
+
+        # 선택된 기체가 바뀌면 지도 경로와 PFD도 해당 기체로 전환
+        self.serial_manager.activeVehicleChanged.connect(self.gps_manager.setActiveVehicle)
+        self.serial_manager.activeVehicleChanged.connect(self.pfd_manager.setActiveVehicle)
 
         # send 이벤트
         self.attitude_overview_manager.newPidGains.connect(self.serial_manager.send_message)
@@ -121,6 +130,7 @@ class MainWindow(QMainWindow):
         context.setContextProperty("dockManager", self.dock_manager)
         context.setContextProperty("serialManager", self.serial_manager)
         context.setContextProperty("gpsManager", self.gps_manager)
+        context.setContextProperty("tileCache", self.tile_cache)
         context.setContextProperty("sensorGraphManager", self.sensor_graph_manager)
         context.setContextProperty("attitudeOverviewManager", self.attitude_overview_manager)
         context.setContextProperty("resourceManager", self.resource_manager)
@@ -155,6 +165,12 @@ class MainWindow(QMainWindow):
             self.dock_area_width = self.width() - 80
             self._set_dock_width(self.dock_area_width)
 
+    def closeEvent(self, event):
+        """종료 시 아직 저장하지 않은 캐시를 디스크에 기록"""
+        self.serial_manager.schemas.save()
+        self.tile_cache.close()  # 타일 사용 시각 commit, SQLite 닫기
+        super().closeEvent(event)
+
     def _setup_dock_widgets(self):
         """도크 위젯들 설정"""
 
@@ -175,6 +191,7 @@ class MainWindow(QMainWindow):
             qml_path='frontend/pages/flight/pfd/index.qml',
             managers=[
                 ('pfdManager', self.pfd_manager),
+                ('serialManager', self.serial_manager),
             ]
         )
         self.dock_top_right.setWidget(widget_top_right)
@@ -188,6 +205,8 @@ class MainWindow(QMainWindow):
             managers=[
                 ('resourceManager', self.resource_manager),
                 ('gpsManager', self.gps_manager),
+                ('serialManager', self.serial_manager),
+                ('tileCache', self.tile_cache),
             ]
         )
         self.dock_bottom_left.setWidget(widget_bottom_left)